@@ -0,0 +1,251 @@
+import math
+from functools import partial
+
+import numpy as np
+from scipy import stats
+from tqdm import tqdm
+
+import module.match_pipeline as mp
+import module.heatmap as hm
+import module.location_store as ls
+
+
+GROUPS = ("winner", "loser")
+
+# t-test에 쓰는 경기별 지표 (process_match 결과의 키)
+METRICS = (
+    "passes",
+    "pass_success_rate",
+    "on_target",
+    "possession",
+    "turnover_count_total",
+    "turnover_count",
+    "fouls",
+)
+
+# 히트맵 종류 -> process_match 결과의 위치 리스트 키
+LOCATION_KINDS = {
+    "pass": "pass_locations",
+    "shot": "shot_locations",
+    "turnover": "turnover_locations",
+}
+
+# 히트맵 그리드 크기 (heatmap.draw_heatmap 기본값과 동일)
+NUM_BINS_X = 12
+NUM_BINS_Y = 8
+
+
+class RunningStats:
+    """
+    값을 하나씩 더하면서 개수/평균/분산을 갱신하는 누적기 (Welford 알고리즘)
+    값을 저장하지 않으므로 메모리가 일정하고, 다른 누적기와 merge로 합칠 수 있음
+    (Chan 등의 병렬 분산 공식, 워커별 부분 결과 병합용)
+    """
+
+    __slots__ = ("count", "mean", "m2")
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0  # 평균과의 편차 제곱합
+
+    def add(self, value):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        return self
+
+    def variance(self, ddof=1):
+        """
+        분산 (ddof=1: 표본 분산, ddof=0: 모분산, 값이 부족하면 nan)
+        """
+        if self.count <= ddof:
+            return math.nan
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof=1):
+        return math.sqrt(self.variance(ddof))
+
+    def __repr__(self):
+        return f"RunningStats(count={self.count}, mean={self.mean!r}, var={self.variance()!r})"
+
+
+def empty_grids():
+    """
+    위치 종류별 빈 누적 그리드 딕셔너리
+    """
+    return {kind: np.zeros((NUM_BINS_Y, NUM_BINS_X), dtype=np.int64) for kind in LOCATION_KINDS}
+
+
+def summarize_match(result, keep_locations=False):
+    """
+    process_match 결과를 경기 하나의 요약(그룹별 지표 값, 위치 그리드)으로 줄이는 함수
+    위치 리스트는 여기서 바로 12x8 그리드로 비닝하므로 경기 수가 늘어도 위치 데이터가 쌓이지 않음
+    (그리드는 경기당 작은 정수라 uint16으로 저장)
+
+    매개변수:
+    - result (dict | None): process_match 결과
+    - keep_locations (bool): True이면 원본 좌표도 float32 (N, 2) 배열로 포함 (위치 저장소 기록용)
+
+    반환값:
+    - dict | None: {"values": {그룹: {지표: 값}}, "grids": {그룹: {종류: 그리드}}}
+                   (keep_locations이면 "teams": {그룹: 팀 이름}, "locations": {그룹: {종류: 좌표 배열}} 추가)
+    """
+    if result is None:
+        return None
+    summary = {
+        "values": {group: {metric: result[group][metric] for metric in METRICS} for group in GROUPS},
+        "grids": {
+            group: {
+                kind: hm.bin_locations(result[group][key], NUM_BINS_X, NUM_BINS_Y).astype(np.uint16)
+                for kind, key in LOCATION_KINDS.items()
+            }
+            for group in GROUPS
+        },
+    }
+    if keep_locations:
+        summary["teams"] = {group: result[group]["team_name"] for group in GROUPS}
+        summary["locations"] = {
+            group: {
+                kind: np.asarray(result[group][key], dtype=np.float32).reshape(-1, 2)
+                for kind, key in LOCATION_KINDS.items()
+            }
+            for group in GROUPS
+        }
+    return summary
+
+
+def process_match_summary(
+    match_result, folder_path_events, store_path=None, cache_dir=None, keep_locations=False
+):
+    """
+    경기 하나를 처리해 요약만 반환하는 함수 (워커 프로세스에서 비닝까지 끝내고 작은 결과만 전달)
+    """
+    result = mp.process_match(match_result, folder_path_events, store_path, cache_dir)
+    return summarize_match(result, keep_locations)
+
+
+class MatchAggregates:
+    """
+    승리팀/패배팀 그룹별 위치 그리드 합계와 지표 누적기
+    경기 요약을 add로 하나씩 더하거나, 다른 MatchAggregates(워커별 부분 결과)를 merge로 합침
+    (그리드는 정수 합이므로 병합 순서와 관계없이 결과가 같음)
+    """
+
+    __slots__ = ("matches", "grids", "stats")
+
+    def __init__(self):
+        self.matches = 0
+        self.grids = {group: empty_grids() for group in GROUPS}
+        self.stats = {group: {metric: RunningStats() for metric in METRICS} for group in GROUPS}
+
+    def add(self, summary):
+        if summary is None:
+            return self
+        self.matches += 1
+        for group in GROUPS:
+            for kind, grid in summary["grids"][group].items():
+                self.grids[group][kind] += grid
+            for metric, value in summary["values"][group].items():
+                self.stats[group][metric].add(value)
+        return self
+
+    def merge(self, other):
+        self.matches += other.matches
+        for group in GROUPS:
+            for kind, grid in other.grids[group].items():
+                self.grids[group][kind] += grid
+            for metric, accumulator in other.stats[group].items():
+                self.stats[group][metric].merge(accumulator)
+        return self
+
+    def ttest(self, metric):
+        """
+        승리팀/패배팀 지표의 Welch t-test (누적된 평균/표준편차/개수로 계산)
+
+        반환값:
+        - tuple: (t-statistic, p-value)
+        """
+        winner = self.stats["winner"][metric]
+        loser = self.stats["loser"][metric]
+        return stats.ttest_ind_from_stats(
+            winner.mean, winner.std(), winner.count,
+            loser.mean, loser.std(), loser.count,
+            equal_var=False,
+        )
+
+
+def aggregate_matches(
+    match_results,
+    folder_path_events,
+    workers=1,
+    chunksize=8,
+    store_path=None,
+    cache_dir=None,
+    progress=False,
+    location_store=None,
+):
+    """
+    여러 경기를 처리해 그룹별 누적 결과를 만드는 함수 (경기별 요약만 부모 프로세스로 전달)
+
+    매개변수:
+    - match_results (list): match_id, winner, loser 정보를 담은 딕셔너리 리스트
+    - folder_path_events (str): 이벤트 JSON 파일이 위치한 폴더 경로
+    - workers (int): 워커 프로세스 수 (1이면 직렬 처리, 0 이하면 CPU 코어 수)
+    - chunksize (int): 워커 하나에 한 번에 전달할 경기 수
+    - store_path (str | None): Parquet 저장소 경로 (주어지면 JSON 대신 사용)
+    - cache_dir (str | None): 경기 지표 캐시 폴더 경로
+    - progress (bool): True이면 tqdm 진행 표시줄 출력
+    - location_store (str | None): 위치 저장소 경로 (주어지면 저장소에 없는 경기의 원본 좌표를 추가)
+
+    반환값:
+    - MatchAggregates: 그룹별 위치 그리드 합계와 지표 누적기
+    - dict: {그룹: {지표: 경기별 값 리스트}} (분포 그래프용, match_results 순서)
+    - list: values의 각 값에 해당하는 경기 ID 리스트 (이벤트 파일이 없는 경기 제외)
+    """
+    aggregates = MatchAggregates()
+    values = {group: {metric: [] for metric in METRICS} for group in GROUPS}
+    match_ids = []
+
+    process = process_match_summary
+    if location_store is not None:
+        process = partial(process_match_summary, keep_locations=True)
+
+    summaries = mp.run_matches(
+        match_results,
+        folder_path_events,
+        workers=workers,
+        chunksize=chunksize,
+        store_path=store_path,
+        cache_dir=cache_dir,
+        process=process,
+    )
+    if progress:
+        summaries = tqdm(summaries, total=len(match_results), desc="Processing matches", unit="match")
+
+    locations = ls.LocationStore(location_store) if location_store is not None else None
+    try:
+        for match_result, summary in zip(match_results, summaries):
+            if summary is None:
+                continue
+            aggregates.add(summary)
+            match_ids.append(match_result["match_id"])
+            for group in GROUPS:
+                for metric, value in summary["values"][group].items():
+                    values[group][metric].append(value)
+            if locations is not None:
+                locations.append(match_result["match_id"], summary)
+    finally:
+        if locations is not None:
+            locations.close()
+    return aggregates, values, match_ids
@@ -0,0 +1,240 @@
+import os
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib.pyplot as plt
+
+import module.heatmap as hm
+import module.match_index as mi
+import module.lineup_registry as lr
+from module.match_report import MatchReport
+
+
+DEFAULT_FORMATS = ("png",)
+
+
+def use_headless_backend():
+    """
+    화면 없이(headless) 파일로만 저장하는 비대화형 백엔드(Agg)로 전환하는 함수
+    (plt.show()가 창을 띄우거나 블로킹하지 않음)
+    """
+    plt.switch_backend("Agg")
+
+
+def save_figure(fig, output_dir, name, formats=DEFAULT_FORMATS, dpi=100):
+    """
+    Figure를 지정한 형식(PNG/SVG 등)으로 저장한 뒤 바로 닫는 함수
+    (Figure를 닫지 않으면 pyplot이 참조를 유지해 긴 배치 작업에서 메모리가 계속 증가)
+
+    매개변수:
+    - fig (matplotlib.figure.Figure): 저장할 Figure
+    - output_dir (str): 저장 폴더 경로
+    - name (str): 파일 이름 (확장자 제외)
+    - formats (tuple): 저장 형식 목록 (ex. ("png", "svg"))
+    - dpi (int): 래스터 형식의 해상도
+
+    반환값:
+    - list: 저장된 파일 경로 리스트
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    try:
+        for fmt in formats:
+            path = os.path.join(output_dir, f"{name}.{fmt}")
+            fig.savefig(path, format=fmt, dpi=dpi, bbox_inches="tight")
+            paths.append(path)
+    finally:
+        plt.close(fig)
+    return paths
+
+
+def render_heatmap_grids(grid_groups, output_dir, formats=DEFAULT_FORMATS, dpi=100):
+    """
+    이미 비닝된 그리드 묶음별 히트맵을 파일로 저장하는 함수 (ex. 증분 집계 상태의 누적 그리드)
+
+    매개변수:
+    - grid_groups (dict): {파일 이름: (구간별 개수 행렬, 제목, 데이터 종류)}
+    - output_dir (str): 저장 폴더 경로
+
+    반환값:
+    - list: 저장된 파일 경로 리스트
+    """
+    paths = []
+    for name, (heatmap, title, kind) in grid_groups.items():
+        fig = hm.draw_heatmap_grid(heatmap, title, kind, show=False)
+        paths.extend(save_figure(fig, output_dir, name, formats, dpi))
+    return paths
+
+
+def render_match_report(
+    match_id,
+    folder_path_events,
+    folder_path_lineups,
+    output_dir,
+    formats=DEFAULT_FORMATS,
+    dpi=100,
+    store_path=None,
+    lineup_cache=None,
+):
+    """
+    한 경기의 리포트 그림(패스 네트워크, 슛 맵, 경기 통계, Most Player, 이벤트 체인)을
+    <output_dir>/<match_id>/ 폴더에 저장하는 함수
+    (MatchReport로 이벤트/라인업을 경기당 한 번만 로드하고 파생 데이터를 모든 그림이 공유)
+
+    매개변수:
+    - match_id (int): 경기 ID
+    - folder_path_events (str): 이벤트 JSON 폴더 경로
+    - folder_path_lineups (str): 라인업 JSON 폴더 경로
+    - output_dir (str): 리포트 저장 폴더 경로
+    - formats (tuple): 저장 형식 목록 (ex. ("png", "svg"))
+    - dpi (int): 래스터 형식의 해상도
+    - store_path (str | None): 이벤트 Parquet 저장소 경로 (지정 시 JSON 대신 사용)
+    - lineup_cache (str | None): 라인업 저장소 파일 경로 (lineup_registry, 프로세스당 한 번 읽음)
+
+    반환값:
+    - list | None: 저장된 파일 경로 리스트 (이벤트 또는 라인업 데이터가 없으면 None)
+    """
+    registry = lr.get_registry(folder_path_lineups, lineup_cache)
+    report = MatchReport(match_id, folder_path_events, folder_path_lineups, store_path, registry)
+    if not report.has_data():
+        return None
+
+    match_dir = os.path.join(output_dir, str(match_id))
+    save = partial(save_figure, output_dir=match_dir, formats=formats, dpi=dpi)
+
+    paths = []
+    try:
+        for name, fig in report.figures():
+            paths += save(fig, name=name)
+    finally:
+        # 그리는 도중 예외가 나도 열린 Figure가 남지 않도록 정리
+        plt.close("all")
+
+    return paths
+
+
+def _render_match(match_id, **kwargs):
+    # 워커 프로세스에서 실행: 한 경기의 실패가 전체 배치를 멈추지 않도록 오류를 결과로 반환
+    try:
+        return match_id, render_match_report(match_id, **kwargs), None
+    except Exception as e:
+        plt.close("all")
+        return match_id, None, f"{type(e).__name__}: {e}"
+
+
+def render_matches(
+    match_ids,
+    folder_path_events,
+    folder_path_lineups,
+    output_dir,
+    formats=DEFAULT_FORMATS,
+    dpi=100,
+    workers=1,
+    chunksize=1,
+    store_path=None,
+    lineup_cache=None,
+):
+    """
+    여러 경기의 리포트를 병렬로 저장하는 제너레이터 (결과 순서는 match_ids 순서와 동일)
+
+    매개변수:
+    - match_ids (list): 경기 ID 리스트
+    - folder_path_events (str): 이벤트 JSON 폴더 경로
+    - folder_path_lineups (str): 라인업 JSON 폴더 경로
+    - output_dir (str): 리포트 저장 폴더 경로
+    - formats (tuple): 저장 형식 목록
+    - dpi (int): 래스터 형식의 해상도
+    - workers (int): 워커 프로세스 수 (1: 직렬 처리, 0 이하: CPU 코어 수)
+    - chunksize (int): 워커 하나에 한 번에 전달할 경기 수
+    - store_path (str | None): 이벤트 Parquet 저장소 경로
+    - lineup_cache (str | None): 라인업 저장소 파일 경로 (워커를 띄우기 전에 선택한 경기를 모두 파싱해 저장)
+
+    반환값:
+    - iterator: (match_id, 저장된 파일 경로 리스트 또는 None, 오류 메시지 또는 None)
+    """
+    render = partial(
+        _render_match,
+        folder_path_events=folder_path_events,
+        folder_path_lineups=folder_path_lineups,
+        output_dir=output_dir,
+        formats=tuple(formats),
+        dpi=dpi,
+        store_path=store_path,
+        lineup_cache=lineup_cache,
+    )
+
+    if lineup_cache is not None:
+        # 워커는 저장 파일을 읽기만 하도록 부모 프로세스에서 한 번 갱신
+        registry = lr.get_registry(folder_path_lineups, lineup_cache)
+        registry.load(match_ids)
+        registry.save()
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    use_headless_backend()
+    if workers == 1:
+        for match_id in match_ids:
+            yield render(match_id)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=use_headless_backend
+    ) as executor:
+        yield from executor.map(render, match_ids, chunksize=chunksize)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경기 리포트 그림 일괄 저장 (headless)")
+    parser.add_argument("match_ids", nargs="*", type=int, help="경기 ID (생략 시 경기 인덱스에서 선택)")
+    parser.add_argument("--season", action="append", default=None, help="시즌 이름 (여러 번 지정 가능)")
+    parser.add_argument("--team", action="append", default=None, help="팀 이름 (여러 번 지정 가능)")
+    parser.add_argument("--matches", default="./Laliga_10_21", help="경기 정보 JSON 폴더")
+    parser.add_argument("--events", default="./data/events", help="이벤트 JSON 폴더")
+    parser.add_argument("--lineups", default="./data/lineups", help="라인업 JSON 폴더")
+    parser.add_argument("--event-store", default=None, help="이벤트 Parquet 저장소 경로")
+    parser.add_argument("--lineup-cache", default=None, help="라인업 저장소 파일 경로 (python -m module.lineup_registry로 생성)")
+    parser.add_argument("--out", default="./reports", help="리포트 저장 폴더")
+    parser.add_argument("--format", nargs="+", default=list(DEFAULT_FORMATS), choices=["png", "svg", "pdf"], help="저장 형식")
+    parser.add_argument("--dpi", type=int, default=100, help="PNG 해상도")
+    parser.add_argument("--workers", type=int, default=1, help="워커 프로세스 수 (0: CPU 코어 수)")
+    parser.add_argument("--chunksize", type=int, default=1, help="워커 하나에 한 번에 전달할 경기 수")
+    args = parser.parse_args()
+
+    match_ids = args.match_ids
+    if not match_ids:
+        index = mi.get_match_index(args.matches, args.events)
+        selected = mi.filter_matches(
+            index,
+            seasons=args.season,
+            teams=args.team,
+            has_events=None if args.event_store else True,
+        )
+        match_ids = selected["match_id"].tolist()
+
+    rendered = 0
+    for match_id, paths, error in render_matches(
+        match_ids,
+        args.events,
+        args.lineups,
+        args.out,
+        formats=args.format,
+        dpi=args.dpi,
+        workers=args.workers,
+        chunksize=args.chunksize,
+        store_path=args.event_store,
+        lineup_cache=args.lineup_cache,
+    ):
+        if error is not None:
+            print(f"{match_id}: 실패 ({error})")
+        elif paths is None:
+            print(f"{match_id}: 이벤트 또는 라인업 데이터 없음")
+        else:
+            rendered += 1
+
+    print(f"{rendered}/{len(match_ids)}개 경기 리포트 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+import os
+import gc
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import tracemalloc
+import statistics
+from datetime import datetime, timezone
+
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+
+import module.match_table as mt
+import module.turnovermap as to
+import module.eventchain_map as ec
+import module.pass_networkmap_def as pnm
+import module.shot_map_def as sm
+import module.heatmap as hm
+import module.match_pipeline as mp
+import module.synthetic_data as sd
+from module.match_report import MatchReport
+from module.event_loader import load_events
+from module.event_model import load_event_records
+
+
+# 결과 파일 형식이 바뀌면 올리는 버전
+RESULT_FORMAT_VERSION = 1
+
+
+def measure(func, repeat=3):
+    """
+    함수 실행 시간(초)을 repeat번 측정하고, 한 번 더 실행해 최대 메모리 사용량을 측정하는 함수
+    (tracemalloc은 실행을 느리게 하므로 시간 측정과 분리)
+
+    반환값:
+    - dict: {"times": [초, ...], "peak_memory_bytes": 파이썬 할당 최대 바이트}
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"times": times, "peak_memory_bytes": peak}
+
+
+def _summary(name, group, measured, per_count=1):
+    # 경기 여러 개를 한 번에 처리한 경우 per_count로 나눠 경기당 시간으로 환산
+    times = [t / per_count for t in measured["times"]]
+    return {
+        "name": name,
+        "group": group,
+        "unit": "s/match",
+        "repeat": len(times),
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+        "peak_memory_bytes": measured["peak_memory_bytes"],
+    }
+
+
+def _render(draw):
+    # 그린 Figure는 바로 닫아 측정 사이에 메모리가 쌓이지 않도록 함
+    fig = draw()
+    fig.canvas.draw()
+    plt.close(fig)
+
+
+def _render_report(events_path, lineup_path):
+    # 경기 리포트 그림 8개를 이벤트/라인업 로드부터 한 번에 그림 (batch_render 경기당 작업)
+    match_id = int(os.path.splitext(os.path.basename(events_path))[0])
+    report = MatchReport(match_id, os.path.dirname(events_path), os.path.dirname(lineup_path))
+    for _, fig in report.figures():
+        fig.canvas.draw()
+        plt.close(fig)
+
+
+def benchmark_match(events_path, lineup_path, repeat=3):
+    """
+    한 경기 이벤트 파일에 대해 로드/추출/렌더링 단계별 시간을 측정하는 함수
+
+    반환값:
+    - list: 단계별 측정 결과 딕셔너리 리스트
+    """
+    records = load_event_records(events_path)
+    match_data, team_names, possession_percentages = mt.extract_match_data(records)
+    team_name = team_names[0]
+    shot_ids, _ = ec.find_shot_events(records, team_name)
+    locations = mp.extract_location_data(records, team_name)[0]
+
+    cases = [
+        ("load_events (json)", "load", lambda: load_events(events_path)),
+        ("load_event_records", "load", lambda: load_event_records(events_path)),
+        ("extract_match_data", "extract", lambda: mt.extract_match_data(records)),
+        ("extract_turnover_data", "extract", lambda: to.extract_turnover_data(records, "home")),
+        ("extract_turnovers (both sides)", "extract", lambda: to.extract_turnovers(records)),
+        ("get_locations", "extract", lambda: ec.get_locations(records, shot_ids, team_name)),
+        ("extract_location_data", "extract", lambda: mp.extract_location_data(records, team_name)),
+        ("compute_match_metrics", "extract", lambda: mp.compute_match_metrics(records)),
+        ("bin_locations", "extract", lambda: hm.bin_locations(locations)),
+        ("draw_pass_network", "render", lambda: _render(lambda: pnm.draw_pass_network(records, lineup_path, "home", show=False))),
+        ("draw_shot_map", "render", lambda: _render(lambda: sm.draw_shot_map(records, lineup_path, "home", show=False))),
+        ("draw_event_chain", "render", lambda: _render(lambda: ec.draw_event_chain(records, lineup_path, "home", show=False))),
+        ("draw_heatmap_grid", "render", lambda: _render(lambda: hm.draw_heatmap_grid(hm.bin_locations(locations), "Bench", "pass", show=False))),
+        ("create_match_table", "render", lambda: _render(lambda: mt.create_match_table(match_data, team_names, possession_percentages, show=False))),
+        ("match_report (8 figures)", "render", lambda: _render_report(events_path, lineup_path)),
+    ]
+    return [_summary(name, group, measure(func, repeat)) for name, group, func in cases]
+
+
+def benchmark_pipeline(match_results, folder_path_events, workers=1, repeat=1):
+    """
+    multi_final.py의 메인 루프(경기별 지표 추출, 캐시 미사용)를 측정하는 함수
+
+    반환값:
+    - dict: 측정 결과 (경기당 시간)
+    """
+    def run():
+        for _ in mp.run_matches(match_results, folder_path_events, workers=workers):
+            pass
+
+    return _summary(
+        f"run_matches (workers={workers})",
+        "pipeline",
+        measure(run, repeat),
+        per_count=len(match_results),
+    )
+
+
+def run_benchmarks(n_matches=10, n_events=3500, repeat=3, workers=1, data_dir=None, seed=0):
+    """
+    합성 데이터를 만들어 전체 벤치마크를 실행하는 함수 (네트워크 불필요)
+
+    매개변수:
+    - n_matches (int): 합성 경기 수
+    - n_events (int): 경기당 이벤트 수
+    - repeat (int): 측정 반복 횟수
+    - workers (int): 파이프라인 측정 시 워커 프로세스 수
+    - data_dir (str | None): 합성 데이터 저장 폴더 (None이면 임시 폴더를 만들고 끝나면 삭제)
+    - seed (int): 합성 데이터 난수 시드
+
+    반환값:
+    - dict: {"meta": 실행 환경/설정, "results": 단계별 측정 결과 리스트}
+    """
+    temp_dir = None
+    if data_dir is None:
+        temp_dir = tempfile.mkdtemp(prefix="football_bench_")
+        data_dir = temp_dir
+
+    try:
+        match_results = sd.write_synthetic_matches(data_dir, n_matches, n_events, seed)
+        folder_path_events = os.path.join(data_dir, "events")
+        first_id = match_results[0]["match_id"]
+
+        results = benchmark_match(
+            os.path.join(folder_path_events, f"{first_id}.json"),
+            os.path.join(data_dir, "lineups", f"{first_id}.json"),
+            repeat,
+        )
+        results.append(benchmark_pipeline(match_results, folder_path_events, 1, repeat=1))
+        if workers != 1:
+            results.append(benchmark_pipeline(match_results, folder_path_events, workers, repeat=1))
+    finally:
+        if temp_dir is not None:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    meta = {
+        "format_version": RESULT_FORMAT_VERSION,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "matplotlib": matplotlib.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "params": {"matches": n_matches, "events_per_match": n_events, "repeat": repeat, "workers": workers, "seed": seed},
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare_results(current, baseline):
+    """
+    이전 실행 결과(baseline)와 비교해 단계별 중앙값 시간 비율을 계산하는 함수
+
+    반환값:
+    - dict: {단계 이름: 현재 중앙값 / 이전 중앙값}
+    """
+    previous = {result["name"]: result for result in baseline["results"]}
+    ratios = {}
+    for result in current["results"]:
+        if result["name"] in previous and previous[result["name"]]["median"] > 0:
+            ratios[result["name"]] = result["median"] / previous[result["name"]]["median"]
+    return ratios
+
+
+def print_results(report, ratios=None):
+    print(f"{'name':<34}{'median ms':>12}{'min ms':>10}{'peak MiB':>10}{'vs base':>9}")
+    for result in report["results"]:
+        ratio = ""
+        if ratios and result["name"] in ratios:
+            ratio = f"{ratios[result['name']]:.2f}x"
+        print(
+            f"{result['name']:<34}{result['median'] * 1000:>12.2f}{result['min'] * 1000:>10.2f}"
+            f"{result['peak_memory_bytes'] / 2**20:>10.2f}{ratio:>9}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="추출/렌더링 단계 벤치마크 (합성 데이터 사용)")
+    parser.add_argument("--matches", type=int, default=10, help="합성 경기 수")
+    parser.add_argument("--events", type=int, default=3500, help="경기당 이벤트 수")
+    parser.add_argument("--repeat", type=int, default=3, help="측정 반복 횟수")
+    parser.add_argument("--workers", type=int, default=1, help="파이프라인 측정 워커 수 (1이 아니면 직렬과 함께 측정)")
+    parser.add_argument("--seed", type=int, default=0, help="합성 데이터 난수 시드")
+    parser.add_argument("--data-dir", default=None, help="합성 데이터 저장 폴더 (생략 시 임시 폴더)")
+    parser.add_argument("--out", default="benchmark_results.json", help="결과 JSON 파일 경로")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    plt.switch_backend("Agg")
+    report = run_benchmarks(args.matches, args.events, args.repeat, args.workers, args.data_dir, args.seed)
+
+    ratios = None
+    if args.compare is not None:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            ratios = compare_results(report, json.load(f))
+        report["compare"] = {"baseline": args.compare, "median_ratio": ratios}
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_results(report, ratios)
+    print(f"결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+import os
+import json
+
+import module.profiling as prof
+
+
+# 스트리밍 파싱 시 한 번에 읽는 문자 수
+STREAM_CHUNK_SIZE = 1 << 16
+
+_decoder = json.JSONDecoder()
+
+
+def iter_events(events_file_path):
+    """
+    이벤트 JSON 파일을 스트리밍으로 읽어 이벤트를 하나씩 반환하는 제너레이터
+    파일 전체를 한 번에 파싱하지 않으므로 메모리 사용량이 파일 크기와 무관하게 일정
+
+    매개변수:
+    - events_file_path (str): 이벤트 JSON 파일 경로 (이벤트 객체들의 배열)
+
+    반환값:
+    - iterator: 이벤트 딕셔너리
+    """
+    with open(events_file_path, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        started = False
+        eof = False
+
+        while True:
+            # 공백, 배열 시작 '[' 와 구분자 ',' 건너뛰기
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,[":
+                if buffer[pos] == "[":
+                    started = True
+                pos += 1
+
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+
+            if pos < len(buffer) and not started:
+                raise ValueError(f"{events_file_path}: not a JSON array of events")
+
+            if pos < len(buffer):
+                try:
+                    event, end = _decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    # 버퍼 끝에서 객체가 잘린 경우: 더 읽은 뒤 다시 시도
+                    if eof:
+                        raise
+                else:
+                    pos = end
+                    yield event
+                    continue
+
+            if eof:
+                if started:
+                    raise ValueError(f"{events_file_path}: unterminated event array")
+                return
+
+            # 이미 처리한 부분은 버리고 다음 청크를 이어 붙임
+            chunk = f.read(STREAM_CHUNK_SIZE)
+            eof = not chunk
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+
+def load_events(events_source):
+    """
+    이벤트 데이터를 로드하는 함수
+    파일 경로가 주어지면 JSON을 파싱하고, 이미 파싱된 이벤트 리스트는 그대로 반환
+
+    매개변수:
+    - events_source (str | list): 이벤트 JSON 파일 경로 또는 파싱된 이벤트 리스트
+
+    반환값:
+    - list: 이벤트 리스트
+    """
+    if isinstance(events_source, (str, os.PathLike)):
+        with prof.stage("event_loader.load_events") as s:
+            with open(events_source, "r", encoding="utf-8") as f:
+                events = json.load(f)
+            if prof.is_enabled():
+                s.bytes_read += os.path.getsize(events_source)
+                s.events += len(events)
+        return events
+    if not isinstance(events_source, list):
+        return list(events_source)
+    return events_source
+
+
+def load_lineups(lineup_source):
+    """
+    라인업 데이터를 로드하는 함수
+    파일 경로가 주어지면 JSON을 파싱하고, 이미 파싱된 라인업 리스트는 그대로 반환
+
+    매개변수:
+    - lineup_source (str | list): 라인업 JSON 파일 경로 또는 파싱된 라인업 리스트 ([홈팀, 원정팀])
+
+    반환값:
+    - list: 팀별 라인업 리스트
+    """
+    if isinstance(lineup_source, (str, os.PathLike)):
+        with open(lineup_source, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return lineup_source
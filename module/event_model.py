@@ -0,0 +1,291 @@
+import os
+import math
+
+import module.profiling as prof
+from module.event_loader import iter_events
+
+
+class Vocabulary:
+    """
+    범주형 문자열(이벤트 종류, 팀, 결과 등)을 정수 코드로 바꾸는 변환 테이블
+    코드 0은 값이 없음(None)을 의미
+    """
+
+    __slots__ = ("codes", "names")
+
+    def __init__(self, names=()):
+        self.codes = {None: 0}
+        self.names = [None]
+        for name in names:
+            self.code(name)
+
+    def code(self, name):
+        # 처음 보는 문자열이면 새 코드를 부여 (intern)
+        code = self.codes.get(name)
+        if code is None:
+            code = len(self.names)
+            self.codes[name] = code
+            self.names.append(name)
+        return code
+
+    def get(self, name):
+        # 등록되지 않은 문자열이면 -1 (새 코드를 만들지 않음)
+        return self.codes.get(name, -1)
+
+    def name(self, code):
+        return self.names[code]
+
+
+# 프로세스 전체에서 공유하는 코드 테이블
+# (자주 쓰는 값은 미리 등록해 두어 어느 프로세스에서나 같은 코드를 가짐)
+EVENT_TYPES = Vocabulary(
+    [
+        "Starting XI",
+        "Pass",
+        "Ball Receipt*",
+        "Carry",
+        "Shot",
+        "Duel",
+        "Dribble",
+        "Foul Committed",
+        "Bad Behaviour",
+    ]
+)
+OUTCOMES = Vocabulary(
+    [
+        "Incomplete",
+        "Pass Offside",
+        "Goal",
+        "Saved",
+        "Post",
+        "Saved Off Target",
+        "Saved to Post",
+        "Blocked",
+        "Lost In Play",
+        "Lost Out",
+        "Complete",
+    ]
+)
+CARDS = Vocabulary(["Yellow Card", "Red Card", "Second Yellow"])
+PASS_TYPES = Vocabulary(["Corner"])
+PLAY_PATTERNS = Vocabulary()
+TEAMS = Vocabulary()
+
+STARTING_XI = EVENT_TYPES.code("Starting XI")
+PASS = EVENT_TYPES.code("Pass")
+CARRY = EVENT_TYPES.code("Carry")
+SHOT = EVENT_TYPES.code("Shot")
+DUEL = EVENT_TYPES.code("Duel")
+DRIBBLE = EVENT_TYPES.code("Dribble")
+FOUL_COMMITTED = EVENT_TYPES.code("Foul Committed")
+BAD_BEHAVIOUR = EVENT_TYPES.code("Bad Behaviour")
+
+INCOMPLETE = OUTCOMES.code("Incomplete")
+PASS_OFFSIDE = OUTCOMES.code("Pass Offside")
+GOAL = OUTCOMES.code("Goal")
+SAVED = OUTCOMES.code("Saved")
+POST = OUTCOMES.code("Post")
+SAVED_OFF_TARGET = OUTCOMES.code("Saved Off Target")
+SAVED_TO_POST = OUTCOMES.code("Saved to Post")
+BLOCKED = OUTCOMES.code("Blocked")
+LOST_IN_PLAY = OUTCOMES.code("Lost In Play")
+LOST_OUT = OUTCOMES.code("Lost Out")
+COMPLETE = OUTCOMES.code("Complete")
+
+YELLOW_CARD = CARDS.code("Yellow Card")
+RED_CARD = CARDS.code("Red Card")
+SECOND_YELLOW = CARDS.code("Second Yellow")
+
+CORNER = PASS_TYPES.code("Corner")
+
+NAN = float("nan")
+
+
+class Event:
+    """
+    압축 이벤트 레코드 (__slots__로 인스턴스 딕셔너리 없이 저장)
+
+    - type, team, possession_team, play_pattern, outcome, pass_type, card: 정수 코드
+    - x, y, end_x, end_y: 위치 좌표 (없으면 nan)
+    - outcome: pass/shot/duel/dribble 중 이벤트 종류에 맞는 결과
+    - card: foul_committed 또는 bad_behaviour의 카드
+    """
+
+    __slots__ = (
+        "id",
+        "index",
+        "period",
+        "possession",
+        "type",
+        "team",
+        "possession_team",
+        "play_pattern",
+        "player_id",
+        "player",
+        "duration",
+        "x",
+        "y",
+        "end_x",
+        "end_y",
+        "outcome",
+        "pass_type",
+        "recipient_id",
+        "recipient",
+        "key_pass_id",
+        "card",
+        "related_events",
+    )
+
+    def __init__(self, id, type, team):
+        self.id = id
+        self.index = None
+        self.period = None
+        self.possession = None
+        self.type = type
+        self.team = team
+        self.possession_team = 0
+        self.play_pattern = 0
+        self.player_id = None
+        self.player = None
+        self.duration = 0.0
+        self.x = NAN
+        self.y = NAN
+        self.end_x = NAN
+        self.end_y = NAN
+        self.outcome = 0
+        self.pass_type = 0
+        self.recipient_id = None
+        self.recipient = None
+        self.key_pass_id = None
+        self.card = 0
+        self.related_events = ()
+
+    @property
+    def location(self):
+        # 원본 JSON과 같은 [x, y] 형태 (위치가 없으면 None)
+        if math.isnan(self.x):
+            return None
+        return [self.x, self.y]
+
+    @property
+    def end_location(self):
+        if math.isnan(self.end_x):
+            return None
+        return [self.end_x, self.end_y]
+
+    @property
+    def type_name(self):
+        return EVENT_TYPES.name(self.type)
+
+    @property
+    def team_name(self):
+        return TEAMS.name(self.team)
+
+    @property
+    def outcome_name(self):
+        return OUTCOMES.name(self.outcome)
+
+    def __repr__(self):
+        return f"Event({self.type_name!r}, {self.team_name!r}, {self.location})"
+
+
+def _name(obj, key):
+    value = obj.get(key)
+    return value.get("name") if value else None
+
+
+def event_from_dict(event):
+    """
+    StatsBomb 이벤트 딕셔너리를 Event 레코드로 변환하는 함수
+
+    매개변수:
+    - event (dict): StatsBomb 이벤트
+
+    반환값:
+    - Event: 압축 이벤트 레코드
+    """
+    type_code = EVENT_TYPES.code(event["type"]["name"])
+    record = Event(event["id"], type_code, TEAMS.code(_name(event, "team")))
+    record.index = event.get("index")
+    record.period = event.get("period")
+    record.possession = event.get("possession")
+    record.possession_team = TEAMS.code(_name(event, "possession_team"))
+    record.play_pattern = PLAY_PATTERNS.code(_name(event, "play_pattern"))
+    record.duration = event.get("duration", 0) or 0.0
+    record.related_events = tuple(event.get("related_events", ()))
+
+    player = event.get("player")
+    if player:
+        record.player_id = player.get("id")
+        record.player = player.get("name")
+
+    location = event.get("location")
+    if location:
+        record.x = float(location[0])
+        record.y = float(location[1])
+
+    if type_code == PASS:
+        pass_info = event.get("pass", {})
+        record.outcome = OUTCOMES.code(_name(pass_info, "outcome"))
+        record.pass_type = PASS_TYPES.code(_name(pass_info, "type"))
+        recipient = pass_info.get("recipient")
+        if recipient:
+            record.recipient_id = recipient.get("id")
+            record.recipient = recipient.get("name")
+        end_location = pass_info.get("end_location")
+        if end_location:
+            record.end_x = float(end_location[0])
+            record.end_y = float(end_location[1])
+    elif type_code == SHOT:
+        shot_info = event.get("shot", {})
+        record.outcome = OUTCOMES.code(_name(shot_info, "outcome"))
+        record.key_pass_id = shot_info.get("key_pass_id")
+    elif type_code == DUEL:
+        record.outcome = OUTCOMES.code(_name(event.get("duel", {}), "outcome"))
+    elif type_code == DRIBBLE:
+        record.outcome = OUTCOMES.code(_name(event.get("dribble", {}), "outcome"))
+
+    card = _name(event.get("foul_committed", {}), "card") or _name(
+        event.get("bad_behaviour", {}), "card"
+    )
+    record.card = CARDS.code(card)
+
+    return record
+
+
+def iter_event_records(events_source):
+    """
+    이벤트 데이터를 Event 레코드로 하나씩 반환하는 제너레이터 (경기 단위 공통 로더)
+
+    매개변수:
+    - events_source (str | list | iterator): 이벤트 JSON 파일 경로(스트리밍으로 읽음),
+      이벤트 딕셔너리/Event 레코드의 리스트 또는 반복자
+
+    반환값:
+    - iterator: Event 레코드
+    """
+    if isinstance(events_source, (str, os.PathLike)):
+        events_source = iter_events(events_source)
+
+    for event in events_source:
+        yield event if isinstance(event, Event) else event_from_dict(event)
+
+
+@prof.profiled()
+def load_event_records(events_source):
+    """
+    이벤트 데이터를 Event 레코드 리스트로 로드하는 함수 (경기당 한 번 생성해 공유)
+    이미 Event 레코드 리스트이면 그대로 반환
+
+    매개변수:
+    - events_source (str | list | iterator): 이벤트 JSON 파일 경로,
+      이벤트 딕셔너리/Event 레코드의 리스트 또는 반복자
+
+    반환값:
+    - list: Event 레코드 리스트
+    """
+    if isinstance(events_source, list) and (
+        not events_source or isinstance(events_source[0], Event)
+    ):
+        return events_source
+    return list(iter_event_records(events_source))
@@ -0,0 +1,400 @@
+import os
+import glob
+import json
+import argparse
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import module.event_model as em
+import module.profiling as prof
+from module.event_loader import load_events
+
+
+# 컬럼형 저장소에 보관하는 이벤트 필드 (중첩 딕셔너리를 평탄화한 컬럼)
+EVENT_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("index", pa.int32()),
+        ("period", pa.int8()),
+        ("minute", pa.int16()),
+        ("second", pa.int16()),
+        ("type", pa.string()),
+        ("possession", pa.int32()),
+        ("possession_team", pa.string()),
+        ("play_pattern", pa.string()),
+        ("team", pa.string()),
+        ("player_id", pa.int64()),
+        ("player", pa.string()),
+        ("location_x", pa.float64()),
+        ("location_y", pa.float64()),
+        ("duration", pa.float64()),
+        ("related_events", pa.list_(pa.string())),
+        ("pass_recipient_id", pa.int64()),
+        ("pass_recipient", pa.string()),
+        ("pass_end_x", pa.float64()),
+        ("pass_end_y", pa.float64()),
+        ("pass_outcome", pa.string()),
+        ("pass_type", pa.string()),
+        ("shot_outcome", pa.string()),
+        ("shot_key_pass_id", pa.string()),
+        ("duel_outcome", pa.string()),
+        ("dribble_outcome", pa.string()),
+        ("foul_card", pa.string()),
+        ("bad_behaviour_card", pa.string()),
+    ]
+)
+
+EVENT_COLUMNS = EVENT_SCHEMA.names
+
+
+def _name(obj, key):
+    # {"key": {"name": ...}} 형태에서 name 추출
+    return obj.get(key, {}).get("name")
+
+
+def _xy(location):
+    if location:
+        return location[0], location[1]
+    return None, None
+
+
+def flatten_event(event):
+    """
+    중첩된 StatsBomb 이벤트 딕셔너리를 컬럼 단위의 평탄한 딕셔너리로 변환하는 함수
+
+    매개변수:
+    - event (dict): StatsBomb 이벤트
+
+    반환값:
+    - dict: EVENT_COLUMNS를 키로 갖는 딕셔너리
+    """
+    pass_info = event.get("pass", {})
+    shot_info = event.get("shot", {})
+    location_x, location_y = _xy(event.get("location"))
+    pass_end_x, pass_end_y = _xy(pass_info.get("end_location"))
+
+    return {
+        "id": event.get("id"),
+        "index": event.get("index"),
+        "period": event.get("period"),
+        "minute": event.get("minute"),
+        "second": event.get("second"),
+        "type": _name(event, "type"),
+        "possession": event.get("possession"),
+        "possession_team": _name(event, "possession_team"),
+        "play_pattern": _name(event, "play_pattern"),
+        "team": _name(event, "team"),
+        "player_id": event.get("player", {}).get("id"),
+        "player": _name(event, "player"),
+        "location_x": location_x,
+        "location_y": location_y,
+        "duration": event.get("duration"),
+        "related_events": event.get("related_events"),
+        "pass_recipient_id": pass_info.get("recipient", {}).get("id"),
+        "pass_recipient": _name(pass_info, "recipient"),
+        "pass_end_x": pass_end_x,
+        "pass_end_y": pass_end_y,
+        "pass_outcome": _name(pass_info, "outcome"),
+        "pass_type": _name(pass_info, "type"),
+        "shot_outcome": _name(shot_info, "outcome"),
+        "shot_key_pass_id": shot_info.get("key_pass_id"),
+        "duel_outcome": _name(event.get("duel", {}), "outcome"),
+        "dribble_outcome": _name(event.get("dribble", {}), "outcome"),
+        "foul_card": _name(event.get("foul_committed", {}), "card"),
+        "bad_behaviour_card": _name(event.get("bad_behaviour", {}), "card"),
+    }
+
+
+def events_to_table(events):
+    """
+    이벤트 리스트를 pyarrow Table로 변환하는 함수
+
+    매개변수:
+    - events (list): StatsBomb 이벤트 리스트
+
+    반환값:
+    - pyarrow.Table: EVENT_SCHEMA를 따르는 테이블
+    """
+    columns = {name: [] for name in EVENT_COLUMNS}
+    for event in events:
+        for name, value in flatten_event(event).items():
+            columns[name].append(value)
+    return pa.Table.from_pydict(columns, schema=EVENT_SCHEMA)
+
+
+def flatten_events(events):
+    """
+    이벤트 리스트를 pandas DataFrame으로 변환하는 함수
+
+    매개변수:
+    - events (list): StatsBomb 이벤트 리스트
+
+    반환값:
+    - pd.DataFrame: 이벤트 1개당 1행인 데이터프레임
+    """
+    return events_to_table(events).to_pandas()
+
+
+def table_to_records(table):
+    """
+    컬럼형 테이블을 중첩 딕셔너리를 거치지 않고 바로 Event 레코드 리스트로 변환하는 함수
+
+    매개변수:
+    - table (pyarrow.Table): EVENT_SCHEMA를 따르는 테이블
+
+    반환값:
+    - list: Event 레코드 리스트
+    """
+    columns = {name: table.column(name).to_pylist() for name in EVENT_COLUMNS}
+    nan = em.NAN
+
+    records = []
+    for row in zip(*(columns[name] for name in EVENT_COLUMNS)):
+        col = dict(zip(EVENT_COLUMNS, row))
+        type_code = em.EVENT_TYPES.code(col["type"])
+        record = em.Event(col["id"], type_code, em.TEAMS.code(col["team"]))
+        record.index = col["index"]
+        record.period = col["period"]
+        record.possession = col["possession"]
+        record.possession_team = em.TEAMS.code(col["possession_team"])
+        record.play_pattern = em.PLAY_PATTERNS.code(col["play_pattern"])
+        record.player_id = col["player_id"]
+        record.player = col["player"]
+        record.duration = col["duration"] or 0.0
+        record.related_events = tuple(col["related_events"] or ())
+        if col["location_x"] is not None:
+            record.x = col["location_x"]
+            record.y = col["location_y"]
+
+        if type_code == em.PASS:
+            record.outcome = em.OUTCOMES.code(col["pass_outcome"])
+            record.pass_type = em.PASS_TYPES.code(col["pass_type"])
+            record.recipient_id = col["pass_recipient_id"]
+            record.recipient = col["pass_recipient"]
+            record.end_x = nan if col["pass_end_x"] is None else col["pass_end_x"]
+            record.end_y = nan if col["pass_end_y"] is None else col["pass_end_y"]
+        elif type_code == em.SHOT:
+            record.outcome = em.OUTCOMES.code(col["shot_outcome"])
+            record.key_pass_id = col["shot_key_pass_id"]
+        elif type_code == em.DUEL:
+            record.outcome = em.OUTCOMES.code(col["duel_outcome"])
+        elif type_code == em.DRIBBLE:
+            record.outcome = em.OUTCOMES.code(col["dribble_outcome"])
+
+        record.card = em.CARDS.code(col["foul_card"] or col["bad_behaviour_card"])
+        records.append(record)
+
+    return records
+
+
+def season_key(season_name):
+    # "2020/2021" -> "2020-2021" (디렉터리 이름으로 사용)
+    return season_name.replace("/", "-")
+
+
+def match_seasons(folder_path_matches):
+    """
+    경기 JSON 폴더(ex. Laliga_10_21)에서 match_id별 시즌 정보를 추출하는 함수
+
+    매개변수:
+    - folder_path_matches (str): 경기 정보 JSON 파일이 위치한 폴더 경로
+
+    반환값:
+    - dict: {match_id: 시즌 이름}
+    """
+    seasons = {}
+    for filename in sorted(os.listdir(folder_path_matches)):
+        if not filename.endswith(".json"):
+            continue
+        with open(
+            os.path.join(folder_path_matches, filename), "r", encoding="utf-8"
+        ) as f:
+            for match in json.load(f):
+                seasons[match["match_id"]] = match["season"]["season_name"]
+    return seasons
+
+
+def match_path(store_path, match_id, season_name):
+    # 시즌/경기 단위 파티션 경로: <store>/season=<시즌>/match_id=<id>/events.parquet
+    return os.path.join(
+        store_path,
+        f"season={season_key(season_name)}",
+        f"match_id={match_id}",
+        "events.parquet",
+    )
+
+
+def ingest_events(folder_path_events, folder_path_matches, store_path, overwrite=False):
+    """
+    이벤트 JSON 파일들을 시즌/경기 단위로 파티션된 Parquet 저장소로 변환하는 함수
+    이미 변환된 경기는 overwrite=True가 아니면 건너뜀
+
+    매개변수:
+    - folder_path_events (str): 이벤트 JSON 파일이 위치한 폴더 경로
+    - folder_path_matches (str): 경기 정보 JSON 파일이 위치한 폴더 경로
+    - store_path (str): Parquet 저장소 경로
+    - overwrite (bool): 기존 파티션을 다시 변환할지 여부
+
+    반환값:
+    - int: 새로 변환된 경기 수
+    """
+    seasons = match_seasons(folder_path_matches)
+
+    converted = 0
+    for filename in sorted(os.listdir(folder_path_events)):
+        if not filename.endswith(".json"):
+            continue
+        match_id = int(filename[: -len(".json")])
+        season_name = seasons.get(match_id, "unknown")
+
+        output_path = match_path(store_path, match_id, season_name)
+        if os.path.exists(output_path) and not overwrite:
+            continue
+
+        with open(
+            os.path.join(folder_path_events, filename), "r", encoding="utf-8"
+        ) as f:
+            events = json.load(f)
+
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        pq.write_table(events_to_table(events), output_path)
+        converted += 1
+
+    return converted
+
+
+def find_match_path(store_path, match_id):
+    """
+    저장소에서 경기의 Parquet 파일 경로를 찾는 함수 (없으면 None)
+    """
+    paths = glob.glob(
+        os.path.join(store_path, "season=*", f"match_id={match_id}", "events.parquet")
+    )
+    return paths[0] if paths else None
+
+
+@prof.profiled()
+def load_match_table(match_id, store_path, columns=None, path=None):
+    """
+    한 경기의 이벤트를 pyarrow Table로 읽는 함수
+
+    매개변수:
+    - match_id (int): 경기 ID
+    - store_path (str): Parquet 저장소 경로
+    - columns (list | None): 읽을 컬럼 (None이면 전체)
+    - path (str | None): 이미 찾은 경기 파일 경로 (None이면 저장소에서 찾음)
+
+    반환값:
+    - pyarrow.Table: 경기 이벤트 테이블
+    """
+    if path is None:
+        path = find_match_path(store_path, match_id)
+    if path is None:
+        raise FileNotFoundError(f"match_id={match_id} is not in {store_path}")
+    return pq.read_table(path, columns=columns)
+
+
+def load_match_frame(match_id, store_path, columns=None, path=None):
+    """
+    한 경기의 이벤트를 pandas DataFrame으로 읽는 함수
+    """
+    return load_match_table(match_id, store_path, columns, path).to_pandas()
+
+
+def load_match_records(match_id, store_path, path=None):
+    """
+    한 경기의 이벤트를 Event 레코드 리스트로 읽는 함수
+
+    매개변수:
+    - match_id (int): 경기 ID
+    - store_path (str): Parquet 저장소 경로
+    - path (str | None): 이미 찾은 경기 파일 경로 (None이면 저장소에서 찾음)
+
+    반환값:
+    - list: Event 레코드 리스트
+    """
+    return table_to_records(load_match_table(match_id, store_path, path=path))
+
+
+def load_season_frame(season_name, store_path, columns=None):
+    """
+    한 시즌 전체 경기의 이벤트를 하나의 DataFrame으로 읽는 함수 (match_id 컬럼 포함)
+
+    매개변수:
+    - season_name (str): 시즌 이름 (ex. "2020/2021")
+    - store_path (str): Parquet 저장소 경로
+    - columns (list | None): 읽을 컬럼 (None이면 전체)
+
+    반환값:
+    - pd.DataFrame: 시즌 이벤트 데이터프레임
+    """
+    frames = []
+    season_path = os.path.join(store_path, f"season={season_key(season_name)}")
+    for match_dir in sorted(glob.glob(os.path.join(season_path, "match_id=*"))):
+        match_id = int(os.path.basename(match_dir).split("=", 1)[1])
+        frame = pq.read_table(
+            os.path.join(match_dir, "events.parquet"), columns=columns
+        ).to_pandas()
+        frame.insert(0, "match_id", match_id)
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame(columns=["match_id"] + list(columns or EVENT_COLUMNS))
+    return pd.concat(frames, ignore_index=True)
+
+
+def load_matches_frame(match_ids, columns=None, store_path=None, folder_path_events=None):
+    """
+    여러 경기의 이벤트를 하나의 DataFrame으로 읽는 함수 (match_id 컬럼 포함)
+    Parquet 저장소가 주어지면 필요한 컬럼만 읽고, 아니면 이벤트 JSON을 컬럼 형식으로 변환
+    (이벤트 데이터가 없는 경기는 건너뜀)
+
+    매개변수:
+    - match_ids (list): 경기 ID 리스트
+    - columns (list | None): 읽을 컬럼 (None이면 전체)
+    - store_path (str | None): Parquet 저장소 경로
+    - folder_path_events (str | None): 이벤트 JSON 폴더 경로 (store_path가 없을 때 사용)
+
+    반환값:
+    - pd.DataFrame: match_id 순서로 이어 붙인 이벤트 데이터프레임
+    """
+    frames = []
+    for match_id in match_ids:
+        if store_path is not None:
+            path = find_match_path(store_path, match_id)
+            if path is None:
+                continue
+            frame = load_match_frame(match_id, store_path, columns, path)
+        else:
+            event_file_path = os.path.join(folder_path_events, f"{match_id}.json")
+            if not os.path.exists(event_file_path):
+                continue
+            frame = flatten_events(load_events(event_file_path))
+            if columns is not None:
+                frame = frame[list(columns)]
+        frame.insert(0, "match_id", match_id)
+        frames.append(frame)
+
+    if not frames:
+        return pd.DataFrame(columns=["match_id"] + list(columns or EVENT_COLUMNS))
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="이벤트 JSON을 시즌/경기 단위 Parquet 저장소로 변환"
+    )
+    parser.add_argument("--events", default="./data/events", help="이벤트 JSON 폴더")
+    parser.add_argument("--matches", default="./Laliga_10_21", help="경기 정보 JSON 폴더")
+    parser.add_argument("--out", default="./data/event_store", help="Parquet 저장소 경로")
+    parser.add_argument("--overwrite", action="store_true", help="기존 경기도 다시 변환")
+    args = parser.parse_args()
+
+    converted = ingest_events(args.events, args.matches, args.out, args.overwrite)
+    print(f"{converted}개 경기의 이벤트가 Parquet 저장소로 변환되었습니다: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,127 +1,107 @@
 import matplotlib.pyplot as plt
-import json
+
+import module.event_model as em
+import module.profiling as prof
+from module.event_model import load_event_records
+from module.lineup_registry import match_lineup
+from module.pitch import draw_soccer_field
 
 # '슛' 이벤트를 필터링하는 함수 
 def find_shot_events(events, team_name):
+    team = em.TEAMS.get(team_name)
     shot_events_id = []
     shot_category = []
     for event in (events):
-        if event['type']['name'] == 'Shot' and event['team']['name'] == team_name:
-            # outcome 값을 'shot' 객체 내에서 추출
-            outcome = event.get('shot', {}).get('outcome', {}).get('name')
-            shot_events_id.append(event['id'])
-            shot_category.append(outcome)
+        if event.type == em.SHOT and event.team == team:
+            # 슛 결과 코드를 이름으로 변환
+            shot_events_id.append(event.id)
+            shot_category.append(event.outcome_name)
            
     return shot_events_id, shot_category
 
-# 직전 이벤트 추출 함수
-def get_locations(events_file_path, shot_events_id,team_name):
+# 이벤트 인덱스 생성 함수 (경기당 한 번)
+@prof.profiled()
+def build_event_index(events):
+    """
+    이벤트 id로 이벤트 위치를 바로 찾기 위한 인덱스를 만드는 함수
+
+    매개변수:
+    - events (list): 경기 Event 레코드 리스트
+
+    반환값:
+    - dict: {"position": {이벤트 id: 리스트 내 위치},
+             "previous_pass": {팀 이름: 각 위치 직전에 나온 해당 팀 패스의 위치 리스트 (없으면 -1)}}
+    """
+    position = {}
+    pass_positions = {}
+    for i, event in enumerate(events):
+        position[event.id] = i
+        if event.type == em.PASS:
+            pass_positions.setdefault(event.team_name, []).append(i)
+
+    previous_pass = {}
+    for team, positions in pass_positions.items():
+        previous = [-1] * len(events)
+        last = -1
+        next_pass = 0
+        for i in range(len(events)):
+            previous[i] = last
+            if next_pass < len(positions) and positions[next_pass] == i:
+                last = i
+                next_pass += 1
+        previous_pass[team] = previous
+
+    return {"position": position, "previous_pass": previous_pass}
+
+
+# 직전 이벤트 추출 함수 (슛 -> 키 패스 -> 그 직전 패스를 인덱스로 바로 조회)
+@prof.profiled()
+def get_locations(events_file_path, shot_events_id, team_name, event_index=None):
+    events = events_file_path
+    if event_index is None:
+        event_index = build_event_index(events)
+    position = event_index["position"]
+    previous_pass = event_index["previous_pass"].get(team_name)
 
     keypass_id_list = []
     shot_location = []
     for shot_id in shot_events_id:
-        for event in events_file_path:
-            if event['id'] == shot_id and 'key_pass_id' in event['shot']:
-                key_id = event['shot']['key_pass_id']
-                keypass_id_list.append(key_id)
-                location = event['location']
-                shot_location.append(location)
-                
+        i = position.get(shot_id)
+        if i is not None and events[i].key_pass_id is not None:
+            keypass_id_list.append(events[i].key_pass_id)
+            shot_location.append(events[i].location)
 
     pass_location = []
     pass_id_list = []
     for keypass_id in keypass_id_list:
-        for event in events_file_path:
-            if event['id'] == keypass_id and event['type']['name'] == 'Pass':
-                location = event['location']
-                pass_location.append(location)
-                pass_id_list.append(event['id'])
-    
+        i = position.get(keypass_id)
+        if i is not None and events[i].type == em.PASS:
+            pass_location.append(events[i].location)
+            pass_id_list.append(keypass_id)
+
     pass_location_1 = []
-    for pass_id in pass_id_list:
-        tem = ''
-        for event in events_file_path[::-1]:
-            if event['id'] == pass_id:
-                tem = team_name
-                continue
-            if event['type']['name'] == 'Pass' and event['team']['name'] == tem:
-                location = event['location']
-                pass_location_1.append(location)
-                break
+    if previous_pass is not None:
+        for pass_id in pass_id_list:
+            j = previous_pass[position[pass_id]]
+            if j >= 0:
+                pass_location_1.append(events[j].location)
 
-            
     return shot_location, pass_location, pass_location_1
 
 
-# 축구 필드 그리기 함수
-def draw_soccer_field(ax, side, field_dimen=(120, 80)):
-    """
-    축구 필드를 그리는 함수
-    """
-    field_length, field_width = field_dimen
-
-    # 필드 외곽선
-    ax.plot([0, 0, field_length, field_length, 0], [0, field_width, field_width, 0, 0], color="black")
-
-    # 홈/어웨이 진영 배경색 표시
-    if side == 'home':
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-    elif side == 'away':
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-
-    # 센터 라인
-    ax.plot([field_length / 2, field_length / 2], [0, field_width], color="black")
-
-    # 센터 서클
-    center_circle = plt.Circle((field_length / 2, field_width / 2), 9.15, color="black", fill=False)
-    ax.add_patch(center_circle)
-    ax.scatter(field_length / 2, field_width / 2, color="black", s=20)  # 센터 스팟
-
-    # 페널티 구역
-    ax.plot([0, 16.5, 16.5, 0], [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-                                  (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-    ax.plot([field_length, field_length - 16.5, field_length - 16.5, field_length],
-            [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-             (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-
-    # 골키퍼 구역
-    ax.plot([0, 5.5, 5.5, 0], [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-                                (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-    ax.plot([field_length, field_length - 5.5, field_length - 5.5, field_length],
-            [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-             (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-
-    # 골대
-    ax.plot([0, -2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([0, -2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-
-    ax.set_xlim(-5, field_length + 5)
-    ax.set_ylim(-5, field_width + 5)
-    ax.set_aspect("equal", adjustable="box")
-    return ax
-
 # 이벤트 체인의 좌표를 화살표로 연결하고 시각화하는 함수
-def draw_event_chain(events_file_path, lineup_file_path, side):
+def draw_event_chain(events_file_path, lineup_file_path, side, show=True, event_index=None):
+    # show=False이면 화면에 출력하지 않고 Figure를 반환 (배치 렌더링용)
+    # lineup_file_path는 라인업 JSON 파일 경로, 파싱된 라인업 리스트 또는 lineup_registry.MatchLineup
+    # event_index가 주어지면 (build_event_index 결과, 홈/원정 공유) 다시 만들지 않음
     fig, ax = plt.subplots(figsize=(12, 8))
     draw_soccer_field(ax, side)  
 
-    with open(lineup_file_path, 'r', encoding='utf-8') as f:
-            lineup_data = json.load(f)
-    with open(events_file_path, 'r', encoding='utf-8') as file:
-        events = json.load(file)
-
-    # 팀과 선발 명단 확인
-    if side == 'home':
-        lineup_info = lineup_data[0]
-    else:
-        side == 'away'
-        lineup_info = lineup_data[1]
-    
-    team_name = lineup_info["team_name"]    
+    # 이벤트 데이터 (JSON 파일 경로, 파싱된 이벤트 리스트 또는 Event 레코드 리스트)
+    events = load_event_records(events_file_path)
+
+    # 팀 확인 (라인업 파일은 lineup_registry에서 경기당 한 번만 파싱)
+    team_name = match_lineup(lineup_file_path).team_name(side)
    
     
        
@@ -131,11 +111,13 @@ def draw_event_chain(events_file_path, lineup_file_path, side):
     # 필터링된 '슛' 이벤트가 없는 경우
     if not shot_event_id:
         print("No shot events found.")  
-        return
+        return fig
     
 
-    # 좌표데이터 추출
-    shot_locations, pass_locations, pass_locations_1  = get_locations(events, shot_event_id,team_name)
+    # 좌표데이터 추출 (이벤트 인덱스는 경기당 한 번 생성)
+    if event_index is None:
+        event_index = build_event_index(events)
+    shot_locations, pass_locations, pass_locations_1  = get_locations(events, shot_event_id, team_name, event_index)
     
     # 직전 이벤트들을 화살표로 연결
     for shot, _pass, _pass_1, category in zip(shot_locations, pass_locations, pass_locations_1, shot_category):
@@ -184,7 +166,9 @@ def draw_event_chain(events_file_path, lineup_file_path, side):
     plt.title(f"Event Chain for {team_name}")
     plt.axis('off')
     plt.legend(loc='upper right')
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
 if __name__ == "__main__":
@@ -1,71 +1,90 @@
 import numpy as np
 import matplotlib.pyplot as plt
 
-def draw_heatmap(data_imported, team_name, type):
-    # 축구장 크기 (m)
-    field_x = 120  # 가로
-    field_y = 80  # 세로
-
-    # 구간 크기 (가로 12개, 세로 8개)
-    num_bins_x = 12
-    num_bins_y = 8
+from module.pitch import draw_soccer_field
+
+# 배열(np.memmap 등)을 비닝할 때 한 번에 변환하는 행 수
+BIN_CHUNK_ROWS = 1 << 20
+
+
+def bin_locations(locations, num_bins_x=12, num_bins_y=8, field_dimen=(120, 80)):
+    """
+    위치 데이터를 (num_bins_y x num_bins_x) 그리드로 비닝하여 구간별 개수를 세는 함수
+    반복문 없이 NumPy 배열 연산으로 전체 위치를 처리
+    (N, 2) 배열은 BIN_CHUNK_ROWS 행씩 나눠 처리하므로 np.memmap(위치 저장소)을 넘기면
+    전체를 메모리로 읽지 않고 비닝함
+
+    매개변수:
+    - locations (list | np.ndarray): (x, y) 좌표 리스트 또는 (N, 2) 배열 (np.memmap 가능)
+    - num_bins_x (int): 가로 구간 수
+    - num_bins_y (int): 세로 구간 수
+    - field_dimen (tuple): 필드의 크기 (길이, 너비)
+
+    반환값:
+    - np.ndarray: (num_bins_y, num_bins_x) 크기의 구간별 개수 행렬
+    """
+    if isinstance(locations, np.ndarray) and len(locations) > BIN_CHUNK_ROWS:
+        counts = np.zeros((num_bins_y, num_bins_x), dtype=np.int64)
+        for start in range(0, len(locations), BIN_CHUNK_ROWS):
+            chunk = locations[start:start + BIN_CHUNK_ROWS]
+            counts += bin_locations(chunk, num_bins_x, num_bins_y, field_dimen)
+        return counts
+
+    field_x, field_y = field_dimen
     bin_x = field_x / num_bins_x
     bin_y = field_y / num_bins_y
 
-    # 예시 패스 데이터 (x, y 좌표)
-    passes = data_imported
+    points = np.asarray(locations, dtype=float).reshape(-1, 2)
 
-    # 히트맵을 위한 2D 배열 (패스 개수를 카운트)
-    heatmap = np.zeros((num_bins_y, num_bins_x))
+    # 구간 인덱스 (필드 밖 좌표는 가장자리 구간으로 포함)
+    x_index = np.clip(np.floor_divide(points[:, 0], bin_x), 0, num_bins_x - 1)
+    y_index = np.clip(np.floor_divide(points[:, 1], bin_y), 0, num_bins_y - 1)
+    flat_index = y_index.astype(np.intp) * num_bins_x + x_index.astype(np.intp)
 
-    # 패스를 각 구간에 분류하고 개수 카운트
-    for x, y in passes:
-        # 가로 (x) 위치
-        bin_x_index = min(int(x // bin_x), num_bins_x - 1)
-        
-        # 세로 (y) 위치
-        bin_y_index = min(int(y // bin_y), num_bins_y - 1)
-        
-        # 해당 구간의 패스 개수 증가
-        heatmap[bin_y_index, bin_x_index] += 1
+    counts = np.bincount(flat_index, minlength=num_bins_x * num_bins_y)
+    return counts.reshape(num_bins_y, num_bins_x)
 
-    # 축구장 그림 그리기
-    fig, ax = plt.subplots(figsize=(12, 8))
 
-    # 축구장 외곽선
-    ax.plot([0, 0, field_x, field_x, 0], [0, field_y, field_y, 0, 0], color="black")
-
-    # 센터 라인
-    ax.plot([field_x / 2, field_x / 2], [0, field_y], color="black")
-
-    # 센터 서클
-    center_circle = plt.Circle((field_x / 2, field_y / 2), 9.15, color="black", fill=False)
-    ax.add_patch(center_circle)
-    ax.scatter(field_x / 2, field_y / 2, color="black", s=20)  # 센터 스팟
-
-    # 페널티 구역
-    ax.plot([0, 16.5, 16.5, 0], [(field_y - 40.3) / 2, (field_y - 40.3) / 2,
-                                (field_y + 40.3) / 2, (field_y + 40.3) / 2], color="black")
-    ax.plot([field_x, field_x - 16.5, field_x - 16.5, field_x],
-            [(field_y - 40.3) / 2, (field_y - 40.3) / 2,
-            (field_y + 40.3) / 2, (field_y + 40.3) / 2], color="black")
-
-    # 골키퍼 구역
-    ax.plot([0, 5.5, 5.5, 0], [(field_y - 18.32) / 2, (field_y - 18.32) / 2,
-                                (field_y + 18.32) / 2, (field_y + 18.32) / 2], color="black")
-    ax.plot([field_x, field_x - 5.5, field_x - 5.5, field_x],
-            [(field_y - 18.32) / 2, (field_y - 18.32) / 2,
-            (field_y + 18.32) / 2, (field_y + 18.32) / 2], color="black")
-
-    # 골대
-    ax.plot([0, -2], [(field_y - 7.32) / 2, (field_y - 7.32) / 2], color="black")
-    ax.plot([0, -2], [(field_y + 7.32) / 2, (field_y + 7.32) / 2], color="black")
-    ax.plot([field_x, field_x + 2], [(field_y - 7.32) / 2, (field_y - 7.32) / 2], color="black")
-    ax.plot([field_x, field_x + 2], [(field_y + 7.32) / 2, (field_y + 7.32) / 2], color="black")
-
-    ax.set_xlim(-5, field_x + 5)
-    ax.set_ylim(-5, field_y + 5)
-    ax.set_aspect("equal", adjustable="box")
+def draw_heatmap(data_imported, team_name, type, num_bins_x=12, num_bins_y=8):
+    """
+    위치 데이터를 그리드로 비닝한 뒤 축구장 위에 히트맵으로 시각화
+
+    매개변수:
+    - data_imported (list | np.ndarray): (x, y) 좌표 리스트 또는 (N, 2) 배열
+      (ex. location_store.open_locations(...)["xy"] memmap, 전체를 메모리로 읽지 않음)
+    - team_name (str): 제목에 표시할 이름
+    - type (str): 데이터 종류 (ex. "pass", "shot", "turnover")
+    - num_bins_x (int): 가로 구간 수
+    - num_bins_y (int): 세로 구간 수
+
+    반환값:
+    - np.ndarray: 구간별 개수 행렬
+    """
+    heatmap = bin_locations(data_imported, num_bins_x, num_bins_y)
+    draw_heatmap_grid(heatmap, team_name, type)
+    return heatmap
+
+
+def draw_heatmap_grid(heatmap, team_name, type, show=True):
+    """
+    이미 계산된 구간별 개수 행렬(bin_locations 결과 등)을 히트맵으로 시각화
+
+    매개변수:
+    - heatmap (np.ndarray): (세로 구간 수, 가로 구간 수) 크기의 개수 행렬
+    - team_name (str): 제목에 표시할 이름
+    - type (str): 데이터 종류 (ex. "pass", "shot", "turnover")
+    - show (bool): True이면 plt.show()로 화면에 출력 (False이면 출력하지 않고 Figure만 반환)
+
+    반환값:
+    - matplotlib.figure.Figure: 히트맵 Figure
+    """
+    # 축구장 크기 (m)
+    field_x = 120  # 가로
+    field_y = 80  # 세로
+
+    # 축구장 그림 그리기 (공유 필드 배경)
+    fig, ax = plt.subplots(figsize=(12, 8))
+    draw_soccer_field(ax, field_dimen=(field_x, field_y))
 
     # 히트맵 시각화
     # 히트맵을 축구장 위에 투명하게 덧붙이기
@@ -88,4 +107,6 @@ def draw_heatmap(data_imported, team_name, type):
     cbar.set_ticklabels([f'{i}' for i in ticks])
 
     plt.axis('off')
-    plt.show()
\ No newline at end of file
+    if show:
+        plt.show()
+    return fig
\ No newline at end of file
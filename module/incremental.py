@@ -0,0 +1,220 @@
+import os
+import pickle
+from functools import partial
+
+import module.match_pipeline as mp
+import module.match_cache as mc
+import module.aggregates as agg
+import module.location_store as ls
+
+
+# 상태 파일 형식이 바뀌면 올리는 버전
+STATE_FORMAT_VERSION = 2
+
+# 지표 추출 코드(match_cache.CODE_FILES)와 함께 이 파일들이 바뀌면 상태를 다시 계산
+STATE_CODE_FILES = ["heatmap.py", "aggregates.py", "incremental.py"]
+
+
+def state_code_version():
+    """
+    상태 파일에 기록하는 코드 버전 (지표 추출 코드 버전 + 비닝/집계 코드 해시)
+    """
+    module_dir = os.path.dirname(os.path.abspath(__file__))
+    parts = [mc.code_version()] + [mc.file_hash(os.path.join(module_dir, name)) for name in STATE_CODE_FILES]
+    return ":".join(parts)
+
+
+def new_state():
+    """
+    빈 증분 집계 상태를 만드는 함수
+
+    반환값:
+    - dict: {"version", "code_version", "matches"}
+            matches: {match_id: {"key", "winner", "values", "grids"}} (경기별 요약, aggregates.summarize_match)
+            (누적 그리드는 state_aggregates에서 경기별 그리드를 합해 만듦)
+    """
+    return {
+        "version": STATE_FORMAT_VERSION,
+        "code_version": state_code_version(),
+        "matches": {},
+    }
+
+
+def load_state(state_path):
+    """
+    저장된 상태를 읽는 함수
+    파일이 없거나, 상태 형식/지표 추출 코드가 바뀌었으면 빈 상태를 반환 (전체 재계산)
+    """
+    if not os.path.exists(state_path):
+        return new_state()
+
+    try:
+        with open(state_path, "rb") as f:
+            state = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return new_state()
+
+    if state.get("version") != STATE_FORMAT_VERSION or state.get("code_version") != state_code_version():
+        return new_state()
+    return state
+
+
+def save_state(state, state_path):
+    """
+    상태를 저장하는 함수 (임시 파일에 쓴 뒤 교체하므로 중단되어도 이전 상태가 유지됨)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(state_path)), exist_ok=True)
+    temp_path = f"{state_path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, state_path)
+
+
+def _source_key(source_path, previous=None):
+    # 크기/수정 시각이 같으면 이전 해시를 재사용하고, 다르면 내용 해시로 비교
+    stat = os.stat(source_path)
+    if previous is not None and previous[:2] == (stat.st_size, stat.st_mtime_ns):
+        return previous
+    return (stat.st_size, stat.st_mtime_ns, mc.file_hash(source_path))
+
+
+def _location_source(key, winner):
+    # 위치 저장소에 기록하는 원본 표시 (이벤트 파일 해시와 승리팀, 둘 중 하나가 바뀌면 좌표를 다시 저장)
+    return f"{key[2]}:{winner}"
+
+
+def update_state(
+    state,
+    match_results,
+    folder_path_events,
+    store_path=None,
+    workers=1,
+    chunksize=8,
+    cache_dir=None,
+    location_store=None,
+):
+    """
+    새로 추가되었거나 이벤트 파일이 바뀐 경기만 처리해 상태에 합치는 함수
+    (선택에서 빠졌거나 이벤트 파일이 사라진 경기는 상태에서 제거)
+    위치 저장소가 주어지면 상태와 맞지 않는 경기(바뀌었거나 제거된 경기)의 좌표를 무효화하고,
+    처리한 경기와 상태에는 있지만 저장소에 없는 경기의 원본 좌표를 저장소에 추가
+
+    매개변수:
+    - state (dict): load_state 결과
+    - match_results (list): match_id, winner, loser 정보를 담은 딕셔너리 리스트
+    - folder_path_events (str): 이벤트 JSON 파일이 위치한 폴더 경로
+    - store_path (str | None): Parquet 저장소 경로 (주어지면 JSON 대신 사용)
+    - workers (int): 워커 프로세스 수
+    - chunksize (int): 워커 하나에 한 번에 전달할 경기 수
+    - cache_dir (str | None): 경기 지표 캐시 폴더 경로
+    - location_store (str | None): 위치 저장소 경로
+
+    반환값:
+    - dict: {"added", "changed", "removed", "unchanged", "stored", "discarded"} 경기 수
+            (stored: 위치 저장소에 추가한 경기 수, discarded: 위치 저장소에서 무효화한 경기 수)
+    """
+    matches = state["matches"]
+    counts = {"added": 0, "changed": 0, "removed": 0, "unchanged": 0, "stored": 0, "discarded": 0}
+
+    pending = []
+    # 상태는 그대로 두고 위치 저장소에만 추가할 경기
+    locations_only = []
+    keys = {}
+    selected_ids = set()
+    for match_result in match_results:
+        match_id = match_result["match_id"]
+        selected_ids.add(match_id)
+        source_path = mp.match_source_path(match_id, folder_path_events, store_path)
+        entry = matches.get(match_id)
+
+        if source_path is None:
+            if entry is not None:
+                del matches[match_id]
+                counts["removed"] += 1
+            continue
+
+        key = _source_key(source_path, entry["key"] if entry else None)
+        if entry is not None and entry["key"][2] == key[2] and entry["winner"] == match_result["winner"]:
+            # 내용이 같으면 수정 시각만 갱신
+            entry["key"] = key
+            counts["unchanged"] += 1
+            locations_only.append(match_result)
+            continue
+
+        if entry is not None:
+            del matches[match_id]
+            counts["changed"] += 1
+        else:
+            counts["added"] += 1
+        keys[match_id] = key
+        pending.append(match_result)
+
+    for match_id in [m for m in matches if m not in selected_ids]:
+        del matches[match_id]
+        counts["removed"] += 1
+
+    locations = None
+    process = agg.process_match_summary
+    if location_store is None:
+        locations_only = []
+    else:
+        locations = ls.LocationStore(location_store)
+        process = partial(agg.process_match_summary, keep_locations=True)
+        # 처리 후 상태에 남을 경기별 원본 표시 (저장소의 기록과 다르면 예전 좌표이므로 무효화)
+        sources = {match_id: _location_source(entry["key"], entry["winner"]) for match_id, entry in matches.items()}
+        for match_result in pending:
+            match_id = match_result["match_id"]
+            sources[match_id] = _location_source(keys[match_id], match_result["winner"])
+        for match_id in list(locations):
+            if locations.source(match_id) != sources.get(match_id):
+                locations.discard(match_id)
+                counts["discarded"] += 1
+        locations_only = [m for m in locations_only if m["match_id"] not in locations]
+
+    summaries = mp.run_matches(
+        pending + locations_only,
+        folder_path_events,
+        workers=workers,
+        chunksize=chunksize,
+        store_path=store_path,
+        cache_dir=cache_dir,
+        process=process,
+    )
+    try:
+        for match_result, summary in zip(pending + locations_only, summaries):
+            if summary is None:
+                continue
+            match_id = match_result["match_id"]
+            if match_id in keys:
+                matches[match_id] = {
+                    "key": keys[match_id],
+                    "winner": match_result["winner"],
+                    "values": summary["values"],
+                    "grids": summary["grids"],
+                }
+            if locations is not None and match_id not in locations:
+                locations.append(match_id, summary, sources[match_id])
+                counts["stored"] += 1
+    finally:
+        if locations is not None:
+            locations.close()
+
+    return counts
+
+
+def state_aggregates(state):
+    """
+    상태에 저장된 경기별 요약으로 MatchAggregates를 만드는 함수 (match_id 순서로 누적)
+    """
+    aggregates = agg.MatchAggregates()
+    for match_id in sorted(state["matches"]):
+        aggregates.add(state["matches"][match_id])
+    return aggregates
+
+
+def group_values(state, group, metric):
+    """
+    그룹(winner/loser)의 경기별 지표 값을 match_id 순서로 반환하는 함수
+    """
+    matches = state["matches"]
+    return [matches[match_id]["values"][group][metric] for match_id in sorted(matches)]
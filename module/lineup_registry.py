@@ -0,0 +1,349 @@
+import os
+import pickle
+import argparse
+
+import pandas as pd
+
+import module.match_cache as mc
+from module.event_loader import load_lineups
+
+
+# 저장 파일 형식이 바뀌면 올리는 버전
+REGISTRY_FORMAT_VERSION = 1
+
+SIDES = ("home", "away")
+
+# 선수 표 컬럼 (players_frame)
+PLAYER_COLUMNS = [
+    "match_id",
+    "player_id",
+    "player_name",
+    "team_name",
+    "side",
+    "jersey_number",
+    "starting",
+    "minutes",
+]
+
+
+def _clock_minutes(clock):
+    # "MM:SS" 경기 시각 -> 분
+    minutes, seconds = clock.split(":")
+    return int(minutes) + int(seconds) / 60
+
+
+def minutes_played(positions):
+    """
+    positions의 from/to 구간으로 출전 시간(분)을 계산하는 함수
+    to가 없으면 경기 끝까지 뛴 것으로 보고, 연장전(3, 4피리어드)에 걸친 경우 120분, 아니면 90분까지로 계산
+
+    매개변수:
+    - positions (list): 라인업 JSON의 선수별 positions 리스트
+
+    반환값:
+    - float: 출전 시간 (분)
+    """
+    periods = [p.get("to_period") or p.get("from_period") or 1 for p in positions]
+    match_end = 120 if any(period > 2 for period in periods) else 90
+
+    total = 0.0
+    for position in positions:
+        start = _clock_minutes(position["from"]) if position.get("from") else 0.0
+        end = _clock_minutes(position["to"]) if position.get("to") else match_end
+        total += max(end - start, 0.0)
+    return total
+
+
+class PlayerRecord:
+    """
+    경기 하나에서의 선수 정보 (팀, 선발 여부, 출전 시간, 등번호)
+    """
+
+    __slots__ = ("player_id", "player_name", "team_name", "side", "jersey_number", "starting", "minutes")
+
+    def __init__(self, player_id, player_name, team_name, side, jersey_number, starting, minutes):
+        self.player_id = player_id
+        self.player_name = player_name
+        self.team_name = team_name
+        self.side = side
+        self.jersey_number = jersey_number
+        self.starting = starting
+        self.minutes = minutes
+
+    def __repr__(self):
+        return f"PlayerRecord({self.player_name!r}, {self.team_name!r}, starting={self.starting}, minutes={self.minutes:.1f})"
+
+
+class MatchLineup:
+    """
+    경기 하나의 라인업 (선수 ID -> PlayerRecord, 홈/원정 팀 이름, 팀별 선발 선수 ID 집합)
+    선발 여부 확인은 집합 조회이므로 이벤트마다 확인해도 O(1)
+    """
+
+    __slots__ = ("match_id", "team_names", "players", "starting_ids")
+
+    def __init__(self, match_id, team_names, players):
+        self.match_id = match_id
+        self.team_names = team_names
+        self.players = players
+        self.starting_ids = {
+            side: frozenset(p.player_id for p in players.values() if p.side == side and p.starting)
+            for side in SIDES
+        }
+
+    def team_name(self, side):
+        return self.team_names[SIDES.index(side)]
+
+
+def parse_lineup(lineup_data, match_id=None):
+    """
+    라인업 JSON 데이터를 MatchLineup으로 변환하는 함수
+
+    매개변수:
+    - lineup_data (list): 파싱된 라인업 리스트 ([홈팀, 원정팀])
+    - match_id (int | None): 경기 ID
+
+    반환값:
+    - MatchLineup
+    """
+    team_names = []
+    players = {}
+    for side, team in zip(SIDES, lineup_data):
+        team_names.append(team["team_name"])
+        for player in team["lineup"]:
+            positions = player.get("positions", [])
+            players[player["player_id"]] = PlayerRecord(
+                player["player_id"],
+                player["player_name"],
+                team["team_name"],
+                side,
+                player.get("jersey_number"),
+                any(position["start_reason"] == "Starting XI" for position in positions),
+                minutes_played(positions),
+            )
+    return MatchLineup(match_id, tuple(team_names), players)
+
+
+def _lineup_rows(lineup):
+    # 저장용 기본 자료형 (클래스를 pickle하지 않으므로 python -m 실행 여부와 관계없이 읽을 수 있음)
+    return lineup.team_names, [tuple(getattr(p, name) for name in PlayerRecord.__slots__) for p in lineup.players.values()]
+
+
+def _lineup_from_rows(match_id, team_names, rows):
+    players = {row[0]: PlayerRecord(*row) for row in rows}
+    return MatchLineup(match_id, team_names, players)
+
+
+def registry_code_version():
+    """
+    저장 파일에 기록하는 코드 버전 (이 파일의 해시, 파싱 방식이 바뀌면 다시 파싱)
+    """
+    return mc.file_hash(os.path.abspath(__file__))
+
+
+class LineupRegistry:
+    """
+    라인업 폴더의 경기별 MatchLineup을 메모리에 한 번만 파싱해 두는 저장소
+    cache_path가 주어지면 파싱 결과를 pickle로 저장해 다음 실행에서 재사용
+    (라인업 파일의 크기/수정 시각이 바뀐 경기만 다시 파싱)
+
+    사용 예:
+        registry = get_registry("./data/lineups", "./cache/lineup_registry.pkl")
+        lineup = registry.get(3773457)
+        registry.save()
+    """
+
+    def __init__(self, folder_path_lineups="./data/lineups", cache_path=None):
+        self.folder_path_lineups = folder_path_lineups
+        self.cache_path = cache_path
+        self.entries = {}  # {match_id: (파일 크기, 수정 시각, MatchLineup)}
+        self.dirty = False
+        if cache_path is not None:
+            self._load_cache()
+
+    def _load_cache(self):
+        if not os.path.exists(self.cache_path):
+            return
+        try:
+            with open(self.cache_path, "rb") as f:
+                saved = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return
+        if saved.get("version") != REGISTRY_FORMAT_VERSION or saved.get("code_version") != registry_code_version():
+            return
+        # 이미 메모리에 있는 경기는 그대로 두고 저장된 경기만 추가
+        for match_id, (size, mtime_ns, team_names, rows) in saved["entries"].items():
+            if match_id not in self.entries:
+                self.entries[match_id] = (size, mtime_ns, _lineup_from_rows(match_id, team_names, rows))
+
+    def lineup_path(self, match_id):
+        return os.path.join(self.folder_path_lineups, f"{match_id}.json")
+
+    def get(self, match_id):
+        """
+        경기의 MatchLineup을 반환하는 함수 (처음이거나 파일이 바뀌었을 때만 파싱)
+
+        반환값:
+        - MatchLineup | None: 라인업 파일이 없으면 None
+        """
+        path = self.lineup_path(match_id)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        entry = self.entries.get(match_id)
+        if entry is not None and entry[:2] == (stat.st_size, stat.st_mtime_ns):
+            return entry[2]
+
+        lineup = parse_lineup(load_lineups(path), match_id)
+        self.entries[match_id] = (stat.st_size, stat.st_mtime_ns, lineup)
+        self.dirty = True
+        return lineup
+
+    def load(self, match_ids=None):
+        """
+        여러 경기의 라인업을 한 번에 준비하는 함수 (None이면 폴더의 모든 라인업 파일)
+
+        반환값:
+        - dict: {match_id: MatchLineup} (라인업 파일이 없는 경기 제외)
+        """
+        if match_ids is None:
+            match_ids = sorted(
+                int(name[:-5])
+                for name in os.listdir(self.folder_path_lineups)
+                if name.endswith(".json") and name[:-5].isdigit()
+            )
+        lineups = {}
+        for match_id in match_ids:
+            lineup = self.get(match_id)
+            if lineup is not None:
+                lineups[match_id] = lineup
+        return lineups
+
+    def save(self):
+        """
+        새로 파싱한 경기가 있으면 저장 파일을 갱신하는 함수 (임시 파일에 쓴 뒤 교체)
+        """
+        if self.cache_path is None or not self.dirty:
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+        saved = {
+            "version": REGISTRY_FORMAT_VERSION,
+            "code_version": registry_code_version(),
+            "entries": {
+                match_id: (size, mtime_ns, *_lineup_rows(lineup))
+                for match_id, (size, mtime_ns, lineup) in self.entries.items()
+            },
+        }
+        temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as f:
+            pickle.dump(saved, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, self.cache_path)
+        self.dirty = False
+
+    def players_frame(self, match_ids=None):
+        """
+        경기 x 선수 1행의 선수 표를 만드는 함수 (시즌 단위 선수 조회용)
+
+        매개변수:
+        - match_ids (list | None): 경기 ID 목록 (None이면 폴더의 모든 경기)
+
+        반환값:
+        - pd.DataFrame: PLAYER_COLUMNS 형식의 표
+        """
+        rows = [
+            (match_id, p.player_id, p.player_name, p.team_name, p.side, p.jersey_number, p.starting, p.minutes)
+            for match_id, lineup in self.load(match_ids).items()
+            for p in lineup.players.values()
+        ]
+        return pd.DataFrame(rows, columns=PLAYER_COLUMNS)
+
+
+# 프로세스 안에서 공유하는 저장소 (라인업 폴더별 하나)
+_registries = {}
+
+
+def get_registry(folder_path_lineups="./data/lineups", cache_path=None):
+    """
+    라인업 폴더의 공유 LineupRegistry를 반환하는 함수 (같은 폴더는 프로세스당 한 번만 생성)
+    (저장 파일 없이 만들어진 저장소에 나중에 cache_path가 주어지면 저장 파일을 읽어 합침)
+    """
+    key = os.path.abspath(folder_path_lineups)
+    registry = _registries.get(key)
+    if registry is None:
+        registry = _registries[key] = LineupRegistry(folder_path_lineups, cache_path)
+    elif registry.cache_path is None and cache_path is not None:
+        registry.cache_path = cache_path
+        registry._load_cache()
+    return registry
+
+
+def match_lineup(lineup_source):
+    """
+    라인업 데이터를 MatchLineup으로 반환하는 함수 (그림 함수 공통 입력 처리)
+    파일 경로는 공유 저장소에서 가져오므로 같은 경기의 라인업 파일을 다시 파싱하지 않음
+
+    매개변수:
+    - lineup_source (str | list | MatchLineup): 라인업 JSON 파일 경로, 파싱된 라인업 리스트 또는 MatchLineup
+
+    반환값:
+    - MatchLineup
+    """
+    if isinstance(lineup_source, MatchLineup):
+        return lineup_source
+    if isinstance(lineup_source, (str, os.PathLike)):
+        folder, name = os.path.split(os.fspath(lineup_source))
+        stem = name[:-5] if name.endswith(".json") else name
+        lineup = get_registry(folder or ".").get(int(stem) if stem.isdigit() else stem)
+        if lineup is None:
+            raise FileNotFoundError(lineup_source)
+        return lineup
+    return parse_lineup(lineup_source)
+
+
+def player_summary(players):
+    """
+    선수 표를 선수별 출전 경기 수, 선발 수, 총 출전 시간으로 요약하는 함수
+
+    매개변수:
+    - players (pd.DataFrame): players_frame 결과
+
+    반환값:
+    - pd.DataFrame: player_id, player_name, team_name, matches, starts, minutes (출전 시간 내림차순)
+    """
+    summary = players.groupby(["player_id", "player_name", "team_name"], sort=False).agg(
+        matches=("match_id", "size"),
+        starts=("starting", "sum"),
+        minutes=("minutes", "sum"),
+    )
+    return summary.reset_index().sort_values("minutes", ascending=False, ignore_index=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="라인업 저장소 생성 및 선수별 출전 기록 조회")
+    parser.add_argument("--lineups", default="./data/lineups", help="라인업 JSON 폴더")
+    parser.add_argument("--cache", default="./cache/lineup_registry.pkl", help="라인업 저장소 파일 경로")
+    parser.add_argument("--team", action="append", default=None, help="팀 이름 (여러 번 지정 가능)")
+    parser.add_argument("--player", type=int, action="append", default=None, help="선수 ID (여러 번 지정 가능)")
+    parser.add_argument("--top", type=int, default=20, help="출력할 선수 수")
+    parser.add_argument("--out", default=None, help="선수별 요약 CSV 저장 경로")
+    args = parser.parse_args()
+
+    registry = get_registry(args.lineups, args.cache)
+    players = registry.players_frame()
+    registry.save()
+
+    if args.team:
+        players = players[players["team_name"].isin(args.team)]
+    if args.player:
+        players = players[players["player_id"].isin(args.player)]
+
+    summary = player_summary(players)
+    print(f"{players['match_id'].nunique()}개 경기, {len(summary)}명")
+    print(summary.head(args.top).to_string(index=False))
+    if args.out is not None:
+        summary.to_csv(args.out, index=False)
+
+
+if __name__ == "__main__":
+    main()
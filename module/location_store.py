@@ -0,0 +1,311 @@
+import os
+import json
+import argparse
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+import module.heatmap as hm
+
+
+# 저장소 형식이 바뀌면 올리는 버전
+STORE_FORMAT_VERSION = 2
+
+# 위치 종류와 결과 (aggregates.LOCATION_KINDS, aggregates.GROUPS와 동일)
+LOCATION_KINDS = ("pass", "shot", "turnover")
+GROUPS = ("winner", "loser")
+
+# 위치 종류별 컬럼 파일 (컬럼 이름 -> (dtype, 행당 원소 수))
+COLUMNS = {
+    "xy": (np.float32, 2),
+    "match_id": (np.int64, 1),
+    "team": (np.int32, 1),
+    "outcome": (np.int8, 1),
+}
+
+# outcome 컬럼 코드 (0: 승리팀, 1: 패배팀)
+OUTCOME_CODES = {group: code for code, group in enumerate(GROUPS)}
+
+# 재비닝할 때 한 번에 읽는 행 수 (메모리 사용량 상한)
+CHUNK_ROWS = 1 << 20
+
+META_FILE = "meta.json"
+
+
+def column_path(store_path, kind, column):
+    return os.path.join(store_path, f"{kind}.{column}.bin")
+
+
+def load_meta(store_path):
+    """
+    저장소 메타데이터(위치 종류별 확정된 행 수, 팀 이름 목록, 저장된 경기)를 읽는 함수
+    (저장소가 없으면 빈 메타데이터)
+    matches: {경기 ID 문자열: {"source": 원본 파일 해시, "rows": {종류: [시작 행, 끝 행]}}}
+    (matches에 없는 행은 무효화된 경기의 좌표로, 비닝할 때 제외)
+    """
+    path = os.path.join(store_path, META_FILE)
+    if not os.path.exists(path):
+        return {
+            "version": STORE_FORMAT_VERSION,
+            "counts": {kind: 0 for kind in LOCATION_KINDS},
+            "teams": [],
+            "matches": {},
+        }
+    with open(path, "r", encoding="utf-8") as f:
+        meta = json.load(f)
+    if meta.get("version") != STORE_FORMAT_VERSION:
+        raise ValueError(f"{store_path}: unsupported location store version {meta.get('version')}")
+    return meta
+
+
+def dead_ranges(meta, kind):
+    """
+    위치 종류 하나에서 유효한 경기에 속하지 않는 행 구간 목록 (무효화된 경기의 예전 좌표)
+
+    반환값:
+    - list: [(시작 행, 끝 행), ...] (행 순서)
+    """
+    live = sorted(tuple(entry["rows"][kind]) for entry in meta["matches"].values())
+    ranges = []
+    position = 0
+    for start, stop in live:
+        if start > position:
+            ranges.append((position, start))
+        position = max(position, stop)
+    if position < meta["counts"][kind]:
+        ranges.append((position, meta["counts"][kind]))
+    return ranges
+
+
+class LocationStore:
+    """
+    경기별 패스/슛/턴오버 좌표를 위치 종류별 float32 파일 뒤에 이어 쓰는 추가 전용 저장소
+    각 좌표에는 match_id, 팀 코드, 결과(승리팀/패배팀) 컬럼이 같은 행 번호로 붙음
+    flush 때 메타데이터의 행 수를 갱신하며, 읽는 쪽은 이 행 수까지만 사용하므로
+    쓰는 도중 중단되어도 확정된 데이터는 그대로 유지됨 (다음에 열 때 확정되지 않은 꼬리를 잘라냄)
+    이벤트 파일이 바뀌었거나 분석에서 빠진 경기는 discard로 무효화 (파일에서 지우지 않고
+    메타데이터의 경기별 행 구간에서만 빼므로, 비닝할 때 제외되고 다시 append할 수 있음)
+
+    사용 예:
+        with LocationStore("./cache/locations") as store:
+            store.append(match_id, summary)
+    """
+
+    def __init__(self, store_path):
+        self.store_path = store_path
+        os.makedirs(store_path, exist_ok=True)
+        self.meta = load_meta(store_path)
+        self._matches = {int(match_id) for match_id in self.meta["matches"]}
+        self._teams = {name: code for code, name in enumerate(self.meta["teams"])}
+
+        self._files = {}
+        for kind in LOCATION_KINDS:
+            rows = self.meta["counts"][kind]
+            for column, (dtype, width) in COLUMNS.items():
+                path = column_path(store_path, kind, column)
+                f = open(path, "ab")
+                f.truncate(rows * width * np.dtype(dtype).itemsize)
+                self._files[kind, column] = f
+
+    def __contains__(self, match_id):
+        return match_id in self._matches
+
+    def __iter__(self):
+        return iter(sorted(self._matches))
+
+    def source(self, match_id):
+        """
+        저장된 경기의 원본 파일 해시 (append할 때 기록, 없으면 None)
+        """
+        entry = self.meta["matches"].get(str(match_id))
+        return entry["source"] if entry is not None else None
+
+    def discard(self, match_id):
+        """
+        저장된 경기의 좌표를 무효화하는 함수 (없는 경기면 False)
+        """
+        if match_id not in self._matches:
+            return False
+        self._matches.remove(match_id)
+        del self.meta["matches"][str(match_id)]
+        return True
+
+    def _team_code(self, team_name):
+        code = self._teams.get(team_name)
+        if code is None:
+            code = self._teams[team_name] = len(self.meta["teams"])
+            self.meta["teams"].append(team_name)
+        return code
+
+    def append(self, match_id, summary, source=None):
+        """
+        경기 하나의 좌표를 추가하는 함수 (이미 저장된 경기는 건너뜀)
+
+        매개변수:
+        - match_id (int): 경기 ID
+        - summary (dict): aggregates.summarize_match(..., keep_locations=True) 결과
+                          ("teams": {그룹: 팀 이름}, "locations": {그룹: {종류: (N, 2) 배열}})
+        - source (str | None): 원본 파일 해시 (바뀐 경기를 찾을 때 비교)
+        """
+        if match_id in self._matches:
+            return
+        starts = dict(self.meta["counts"])
+        for group in GROUPS:
+            team = self._team_code(summary["teams"][group])
+            for kind, points in summary["locations"][group].items():
+                points = np.asarray(points, dtype=np.float32).reshape(-1, 2)
+                rows = len(points)
+                self._files[kind, "xy"].write(points.tobytes())
+                self._files[kind, "match_id"].write(np.full(rows, match_id, dtype=np.int64).tobytes())
+                self._files[kind, "team"].write(np.full(rows, team, dtype=np.int32).tobytes())
+                self._files[kind, "outcome"].write(np.full(rows, OUTCOME_CODES[group], dtype=np.int8).tobytes())
+                self.meta["counts"][kind] += rows
+        self._matches.add(match_id)
+        self.meta["matches"][str(match_id)] = {
+            "source": source,
+            "rows": {kind: [starts[kind], self.meta["counts"][kind]] for kind in LOCATION_KINDS},
+        }
+
+    def flush(self):
+        """
+        쓴 좌표를 디스크에 반영한 뒤 메타데이터의 행 수를 갱신하는 함수 (확정 시점)
+        """
+        for f in self._files.values():
+            f.flush()
+            os.fsync(f.fileno())
+        path = os.path.join(self.store_path, META_FILE)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.meta, f)
+        os.replace(temp_path, path)
+
+    def close(self):
+        self.flush()
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+def open_locations(store_path, kind):
+    """
+    위치 종류 하나의 컬럼을 numpy.memmap으로 여는 함수 (파일 내용을 메모리로 읽지 않음)
+
+    매개변수:
+    - store_path (str): 위치 저장소 경로
+    - kind (str): "pass", "shot", "turnover"
+
+    반환값:
+    - dict: {"xy": (N, 2) float32, "match_id": (N,) int64, "team": (N,) int32, "outcome": (N,) int8}
+    """
+    rows = load_meta(store_path)["counts"][kind]
+    columns = {}
+    for column, (dtype, width) in COLUMNS.items():
+        shape = (rows, 2) if width == 2 else (rows,)
+        if rows == 0:
+            columns[column] = np.empty(shape, dtype=dtype)
+        else:
+            columns[column] = np.memmap(column_path(store_path, kind, column), dtype=dtype, mode="r", shape=shape)
+    return columns
+
+
+def _selection(columns, start, stop, outcome, team_codes, match_ids):
+    mask = None
+
+    def combine(current, condition):
+        return condition if current is None else current & condition
+
+    if outcome is not None:
+        mask = combine(mask, columns["outcome"][start:stop] == OUTCOME_CODES[outcome])
+    if team_codes is not None:
+        mask = combine(mask, np.isin(columns["team"][start:stop], team_codes))
+    if match_ids is not None:
+        mask = combine(mask, np.isin(columns["match_id"][start:stop], match_ids))
+    return mask
+
+
+def bin_store(
+    store_path,
+    kind,
+    outcome=None,
+    teams=None,
+    match_ids=None,
+    num_bins_x=12,
+    num_bins_y=8,
+    field_dimen=(120, 80),
+):
+    """
+    저장된 좌표를 원하는 해상도의 그리드로 다시 비닝하는 함수
+    memmap을 CHUNK_ROWS 행씩 읽어 비닝하므로 좌표 수와 관계없이 메모리 사용량이 일정
+
+    매개변수:
+    - store_path (str): 위치 저장소 경로
+    - kind (str): "pass", "shot", "turnover"
+    - outcome (str | None): "winner" 또는 "loser" (None이면 전체)
+    - teams (list | None): 팀 이름 목록 (None이면 전체)
+    - match_ids (list | None): 경기 ID 목록 (None이면 전체)
+    - num_bins_x (int): 가로 구간 수
+    - num_bins_y (int): 세로 구간 수
+    - field_dimen (tuple): 필드의 크기 (길이, 너비)
+
+    반환값:
+    - np.ndarray: (num_bins_y, num_bins_x) 크기의 구간별 개수 행렬
+    """
+    meta = load_meta(store_path)
+    columns = open_locations(store_path, kind)
+    team_codes = None
+    if teams is not None:
+        names = meta["teams"]
+        team_codes = [code for code, name in enumerate(names) if name in set(teams)]
+    if match_ids is not None:
+        match_ids = np.asarray(match_ids, dtype=np.int64)
+
+    dead = dead_ranges(meta, kind)
+
+    heatmap = np.zeros((num_bins_y, num_bins_x), dtype=np.int64)
+    xy = columns["xy"]
+    for start in range(0, len(xy), CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, len(xy))
+        points = xy[start:stop]
+        mask = _selection(columns, start, stop, outcome, team_codes, match_ids)
+        # 무효화된 경기의 행 제외
+        for dead_start, dead_stop in dead:
+            if dead_start < stop and dead_stop > start:
+                if mask is None:
+                    mask = np.ones(stop - start, dtype=bool)
+                mask[max(dead_start, start) - start:min(dead_stop, stop) - start] = False
+        if mask is not None:
+            points = points[mask]
+        heatmap += hm.bin_locations(points, num_bins_x, num_bins_y, field_dimen)
+    return heatmap
+
+
+def main():
+    parser = argparse.ArgumentParser(description="위치 저장소 좌표를 원하는 해상도로 다시 비닝해 히트맵 저장")
+    parser.add_argument("store", help="위치 저장소 경로 (multi_final.py --location-store로 생성)")
+    parser.add_argument("--kind", default="pass", choices=list(LOCATION_KINDS), help="위치 종류")
+    parser.add_argument("--outcome", default=None, choices=list(GROUPS), help="승리팀/패배팀 (생략 시 전체)")
+    parser.add_argument("--team", action="append", default=None, help="팀 이름 (여러 번 지정 가능)")
+    parser.add_argument("--bins", type=int, nargs=2, default=[12, 8], metavar=("X", "Y"), help="가로/세로 구간 수")
+    parser.add_argument("--out", default=None, help="히트맵 이미지 저장 경로 (생략 시 화면 출력)")
+    args = parser.parse_args()
+
+    if args.out is not None:
+        plt.switch_backend("Agg")
+
+    heatmap = bin_store(args.store, args.kind, args.outcome, args.team, None, args.bins[0], args.bins[1])
+    title = " ".join(filter(None, [args.outcome and args.outcome.capitalize(), "/".join(args.team or [])])) or "All"
+    fig = hm.draw_heatmap_grid(heatmap, title, args.kind, show=args.out is None)
+    if args.out is not None:
+        fig.savefig(args.out, bbox_inches="tight")
+        print(f"{int(heatmap.sum())}개 좌표 비닝 ({args.bins[0]}x{args.bins[1]}): {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+import os
+import pickle
+import hashlib
+
+
+# 캐시 파일 형식이 바뀌면 올리는 버전
+CACHE_FORMAT_VERSION = 1
+
+# 이 파일들의 내용이 바뀌면 캐시된 지표를 모두 다시 계산 (추출 로직 변경 감지)
+CODE_FILES = [
+    "match_table.py",
+    "turnovermap.py",
+    "match_pipeline.py",
+    "event_loader.py",
+    "event_store.py",
+    "event_model.py",
+]
+
+_code_version = None
+
+
+def file_hash(path):
+    """
+    파일 내용의 SHA-1 해시를 계산하는 함수
+    """
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_version():
+    """
+    지표 추출 코드의 버전 문자열을 반환하는 함수
+    (캐시 형식 버전 + CODE_FILES 내용 해시, 프로세스당 한 번 계산)
+    """
+    global _code_version
+    if _code_version is None:
+        module_dir = os.path.dirname(os.path.abspath(__file__))
+        digest = hashlib.sha1(str(CACHE_FORMAT_VERSION).encode())
+        for filename in CODE_FILES:
+            digest.update(file_hash(os.path.join(module_dir, filename)).encode())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def cache_path(cache_dir, match_id):
+    return os.path.join(cache_dir, f"{match_id}.pkl")
+
+
+def load_cached_metrics(cache_dir, match_id, source_path):
+    """
+    캐시된 경기 지표를 읽는 함수
+    원본 파일의 크기/수정 시각이 같으면 바로 사용하고, 수정 시각만 바뀐 경우에는
+    내용 해시를 비교하여 내용이 같으면 사용
+
+    매개변수:
+    - cache_dir (str): 캐시 폴더 경로
+    - match_id (int): 경기 ID
+    - source_path (str): 지표를 계산한 원본 이벤트 파일 경로 (JSON 또는 Parquet)
+
+    반환값:
+    - dict | None: 캐시된 경기 지표 (캐시가 없거나 무효화되었으면 None)
+    """
+    path = cache_path(cache_dir, match_id)
+    if not os.path.exists(path):
+        return None
+
+    try:
+        with open(path, "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+
+    key = entry["key"]
+    if key["code_version"] != code_version():
+        return None
+
+    stat = os.stat(source_path)
+    if key["size"] != stat.st_size:
+        return None
+    if key["mtime_ns"] != stat.st_mtime_ns:
+        if key["sha1"] != file_hash(source_path):
+            return None
+        # 내용은 같고 수정 시각만 바뀐 경우: 다음 조회부터 해시 계산을 생략하도록 갱신
+        save_cached_metrics(
+            cache_dir, match_id, source_path, entry["metrics"], key["sha1"]
+        )
+
+    return entry["metrics"]
+
+
+def save_cached_metrics(cache_dir, match_id, source_path, metrics, sha1=None):
+    """
+    경기 지표를 캐시에 저장하는 함수
+    (임시 파일에 쓴 뒤 교체하므로 병렬 워커가 동시에 써도 깨진 파일이 남지 않음)
+
+    매개변수:
+    - cache_dir (str): 캐시 폴더 경로
+    - match_id (int): 경기 ID
+    - source_path (str): 지표를 계산한 원본 이벤트 파일 경로
+    - metrics (dict): 저장할 경기 지표
+    - sha1 (str | None): 원본 파일 해시 (None이면 새로 계산)
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    stat = os.stat(source_path)
+    entry = {
+        "key": {
+            "match_id": match_id,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha1": sha1 or file_hash(source_path),
+            "code_version": code_version(),
+        },
+        "metrics": metrics,
+    }
+
+    path = cache_path(cache_dir, match_id)
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temp_path, path)
@@ -0,0 +1,289 @@
+import os
+import json
+import argparse
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+
+# 인덱스 컬럼과 타입 (match_id 오름차순으로 정렬해 저장)
+INDEX_COLUMNS = {
+    "match_id": "int64",
+    "match_date": "datetime64[ns]",
+    "kick_off": "string",
+    "competition_name": "string",
+    "season_id": "int32",
+    "season_name": "string",
+    "match_week": "Int16",
+    "home_team_id": "int32",
+    "home_team_name": "string",
+    "away_team_id": "int32",
+    "away_team_name": "string",
+    "home_score": "int16",
+    "away_score": "int16",
+    "result": "category",
+    "match_status": "string",
+    "stadium": "string",
+    "has_events": "bool",
+}
+
+# 경기 결과 (홈 승, 원정 승, 무승부)
+RESULTS = ["Home", "Away", "Draw"]
+
+DEFAULT_INDEX_PATH = "./cache/match_index.parquet"
+
+# 인덱스를 만든 원본 폴더를 기록하는 Parquet 메타데이터 키
+SOURCES_METADATA_KEY = b"match_index_sources"
+
+
+def _match_row(match):
+    home_score = match["home_score"]
+    away_score = match["away_score"]
+    if home_score > away_score:
+        result = "Home"
+    elif away_score > home_score:
+        result = "Away"
+    else:
+        result = "Draw"
+
+    stadium = match.get("stadium") or {}
+    return {
+        "match_id": match["match_id"],
+        "match_date": match.get("match_date"),
+        "kick_off": match.get("kick_off"),
+        "competition_name": match["competition"]["competition_name"],
+        "season_id": match["season"]["season_id"],
+        "season_name": match["season"]["season_name"],
+        "match_week": match.get("match_week"),
+        "home_team_id": match["home_team"]["home_team_id"],
+        "home_team_name": match["home_team"]["home_team_name"],
+        "away_team_id": match["away_team"]["away_team_id"],
+        "away_team_name": match["away_team"]["away_team_name"],
+        "home_score": home_score,
+        "away_score": away_score,
+        "result": result,
+        "match_status": match.get("match_status"),
+        "stadium": stadium.get("name"),
+    }
+
+
+def _match_files(folder_path_matches):
+    return [
+        os.path.join(folder_path_matches, f)
+        for f in sorted(os.listdir(folder_path_matches))
+        if f.endswith(".json")
+    ]
+
+
+def build_match_index(folder_path_matches, folder_path_events=None):
+    """
+    시즌별 경기 정보 JSON 폴더(ex. Laliga_10_21)를 한 번 읽어 경기 인덱스를 만드는 함수
+
+    매개변수:
+    - folder_path_matches (str): 경기 정보 JSON 파일이 위치한 폴더 경로
+    - folder_path_events (str | None): 이벤트 JSON 폴더 경로 (이벤트 파일 유무 확인용)
+
+    반환값:
+    - pd.DataFrame: match_id 오름차순으로 정렬된 경기 인덱스 (컬럼/타입은 INDEX_COLUMNS)
+    """
+    rows = []
+    for file_path in _match_files(folder_path_matches):
+        with open(file_path, "r", encoding="utf-8") as f:
+            rows.extend(_match_row(match) for match in json.load(f))
+
+    # 이벤트 파일 유무는 폴더 목록 한 번으로 확인 (경기마다 파일 시스템 조회하지 않음)
+    event_ids = set()
+    if folder_path_events is not None and os.path.isdir(folder_path_events):
+        for filename in os.listdir(folder_path_events):
+            stem, ext = os.path.splitext(filename)
+            if ext == ".json" and stem.isdigit():
+                event_ids.add(int(stem))
+
+    index = pd.DataFrame(rows, columns=list(INDEX_COLUMNS)[:-1])
+    index["has_events"] = index["match_id"].isin(event_ids)
+    index["match_date"] = pd.to_datetime(index["match_date"])
+    index["result"] = pd.Categorical(index["result"], categories=RESULTS)
+    index = index.astype(INDEX_COLUMNS)
+
+    # 여러 파일에 같은 경기가 있으면 하나만 유지
+    index = index.drop_duplicates("match_id", keep="last")
+    return index.sort_values("match_id", kind="stable").reset_index(drop=True)
+
+
+def _index_sources(folder_path_matches, folder_path_events=None):
+    # 인덱스를 만든 원본 폴더 (다른 폴더로 만든 인덱스를 잘못 재사용하지 않도록 기록)
+    return json.dumps(
+        {
+            "matches": os.path.abspath(folder_path_matches),
+            "events": os.path.abspath(folder_path_events) if folder_path_events else None,
+        }
+    ).encode()
+
+
+def save_match_index(index, index_path, sources=None):
+    """
+    경기 인덱스를 Parquet 파일로 저장하는 함수
+    (임시 파일에 쓴 뒤 교체하므로 저장 도중 중단되어도 깨진 인덱스가 남지 않음)
+
+    매개변수:
+    - index (pd.DataFrame): 경기 인덱스
+    - index_path (str): 저장할 Parquet 파일 경로
+    - sources (bytes | None): 원본 폴더 정보 (Parquet 메타데이터로 저장)
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(index_path)), exist_ok=True)
+    table = pa.Table.from_pandas(index, preserve_index=False)
+    if sources is not None:
+        metadata = dict(table.schema.metadata or {})
+        metadata[SOURCES_METADATA_KEY] = sources
+        table = table.replace_schema_metadata(metadata)
+
+    temp_path = f"{index_path}.{os.getpid()}.tmp"
+    pq.write_table(table, temp_path)
+    os.replace(temp_path, index_path)
+
+
+def load_match_index(index_path):
+    """
+    저장된 경기 인덱스를 읽는 함수
+    """
+    return pd.read_parquet(index_path).astype(INDEX_COLUMNS)
+
+
+def index_is_stale(index_path, folder_path_matches, folder_path_events=None):
+    """
+    저장된 인덱스가 원본보다 오래되었는지 확인하는 함수
+    (다른 폴더로 만든 인덱스이거나, 경기 정보 JSON이 수정되었거나,
+     이벤트 폴더에 파일이 추가/삭제된 경우)
+    """
+    if not os.path.exists(index_path):
+        return True
+
+    metadata = pq.read_schema(index_path).metadata or {}
+    if metadata.get(SOURCES_METADATA_KEY) != _index_sources(
+        folder_path_matches, folder_path_events
+    ):
+        return True
+
+    index_mtime = os.stat(index_path).st_mtime_ns
+    sources = _match_files(folder_path_matches) + [folder_path_matches]
+    if folder_path_events is not None and os.path.isdir(folder_path_events):
+        sources.append(folder_path_events)
+    return any(os.stat(path).st_mtime_ns > index_mtime for path in sources)
+
+
+def get_match_index(
+    folder_path_matches,
+    folder_path_events=None,
+    index_path=DEFAULT_INDEX_PATH,
+    rebuild=False,
+):
+    """
+    경기 인덱스를 반환하는 함수 (경기 선택의 단일 진입점)
+    저장된 인덱스가 최신이면 그대로 읽고, 아니면 다시 만들어 저장
+
+    매개변수:
+    - folder_path_matches (str): 경기 정보 JSON 파일이 위치한 폴더 경로
+    - folder_path_events (str | None): 이벤트 JSON 폴더 경로
+    - index_path (str | None): 인덱스 Parquet 파일 경로 (None이면 저장하지 않음)
+    - rebuild (bool): True이면 저장된 인덱스를 무시하고 다시 생성
+
+    반환값:
+    - pd.DataFrame: 경기 인덱스
+    """
+    if index_path is None:
+        return build_match_index(folder_path_matches, folder_path_events)
+
+    if not rebuild and not index_is_stale(
+        index_path, folder_path_matches, folder_path_events
+    ):
+        return load_match_index(index_path)
+
+    index = build_match_index(folder_path_matches, folder_path_events)
+    save_match_index(
+        index, index_path, _index_sources(folder_path_matches, folder_path_events)
+    )
+    return index
+
+
+def _as_list(value):
+    if value is None:
+        return None
+    if isinstance(value, (str, int, np.integer)):
+        return [value]
+    return list(value)
+
+
+def filter_matches(index, seasons=None, teams=None, results=None, has_events=None):
+    """
+    경기 인덱스를 시즌, 팀, 결과로 필터링하는 함수 (조건은 모두 AND, None이면 무시)
+
+    매개변수:
+    - index (pd.DataFrame): 경기 인덱스
+    - seasons (str | list | None): 시즌 이름(ex. "2020/2021") 또는 season_id 목록
+    - teams (str | list | None): 팀 이름 목록 (홈/원정 중 한 팀이라도 포함되면 선택)
+    - results (str | list | None): "Home", "Away", "Draw" 중 선택
+    - has_events (bool | None): 이벤트 파일 유무
+
+    반환값:
+    - pd.DataFrame: 필터링된 경기 인덱스 (match_id 순서 유지)
+    """
+    mask = np.ones(len(index), dtype=bool)
+
+    seasons = _as_list(seasons)
+    if seasons is not None:
+        names = [s for s in seasons if isinstance(s, str)]
+        ids = [int(s) for s in seasons if not isinstance(s, str)]
+        mask &= (index["season_name"].isin(names) | index["season_id"].isin(ids)).to_numpy()
+
+    teams = _as_list(teams)
+    if teams is not None:
+        mask &= (
+            index["home_team_name"].isin(teams) | index["away_team_name"].isin(teams)
+        ).to_numpy()
+
+    results = _as_list(results)
+    if results is not None:
+        mask &= index["result"].isin(results).to_numpy()
+
+    if has_events is not None:
+        mask &= (index["has_events"] == has_events).to_numpy()
+
+    return index[mask]
+
+
+def match_results(index):
+    """
+    승패가 갈린 경기의 승리/패배 팀 정보를 추출하는 함수 (무승부 제외)
+
+    매개변수:
+    - index (pd.DataFrame): 경기 인덱스 (filter_matches 결과 등)
+
+    반환값:
+    - list: {"match_id", "winner", "loser"} 딕셔너리 리스트 (winner/loser는 "Home" 또는 "Away")
+    """
+    decided = index[index["result"] != "Draw"]
+    return [
+        {
+            "match_id": int(match_id),
+            "winner": result,
+            "loser": "Away" if result == "Home" else "Home",
+        }
+        for match_id, result in zip(decided["match_id"], decided["result"])
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시즌별 경기 인덱스 생성")
+    parser.add_argument("--matches", default="./Laliga_10_21", help="경기 정보 JSON 폴더")
+    parser.add_argument("--events", default="./data/events", help="이벤트 JSON 폴더")
+    parser.add_argument("--out", default=DEFAULT_INDEX_PATH, help="인덱스 Parquet 파일 경로")
+    args = parser.parse_args()
+
+    index = get_match_index(args.matches, args.events, args.out, rebuild=True)
+    print(f"{len(index)}개 경기 인덱스 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
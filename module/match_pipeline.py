@@ -0,0 +1,280 @@
+import os
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import module.match_table as mt
+import module.turnovermap as to
+import module.event_store as es
+import module.match_cache as mc
+import module.event_model as em
+import module.profiling as prof
+from module.event_model import load_event_records
+
+# 히트맵에 사용하는 슛 결과 (골, 세이브, 포스트)
+SHOT_MAP_OUTCOMES = frozenset([em.GOAL, em.SAVED, em.POST])
+
+
+@prof.profiled()
+def extract_location_data(events_data, team_name):
+    """
+    팀의 패스(시작/도착) 위치와 유효슛 위치를 추출하는 함수
+
+    매개변수:
+    - events_data (list): Event 레코드 리스트 (event_model.load_event_records 결과)
+    - team_name (str): 대상 팀 이름
+
+    반환값:
+    - list: 패스 시작/도착 위치 리스트
+    - list: 유효슛(골, 세이브, 포스트) 위치 리스트
+    """
+    team = em.TEAMS.get(team_name)
+
+    pass_locations = []
+    shot_locations = []
+    for event in events_data:
+        if event.team != team:
+            continue
+        if event.type == em.PASS:
+            if not math.isnan(event.x):
+                pass_locations.append((event.x, event.y))
+            if not math.isnan(event.end_x):
+                pass_locations.append((event.end_x, event.end_y))
+        elif event.type == em.SHOT:
+            if event.outcome in SHOT_MAP_OUTCOMES and not math.isnan(event.x):
+                shot_locations.append((event.x, event.y))
+
+    return pass_locations, shot_locations
+
+
+def summarize_team(metrics, team_name, side):
+    """
+    한 팀의 경기 지표(통계, 턴오버, 패스/슛 위치)를 하나의 딕셔너리로 정리하는 함수
+
+    매개변수:
+    - metrics (dict): compute_match_metrics가 반환한 경기 지표
+    - team_name (str): 대상 팀 이름
+    - side (str): "home" 또는 "away"
+
+    반환값:
+    - dict: 팀의 경기 지표
+    """
+    teams, _, possession_percentages = metrics["match_data"]
+    turnover = metrics["turnovers"][side]
+    pass_locations, shot_locations = metrics["locations"][team_name]
+
+    fp = turnover["failed_passes"]
+    ld = turnover["lost_duels"]
+    dl = turnover["dribble_losts"]
+
+    # 하프라인 이전 (x<60)에 발생한 턴오버
+    half_turnover = sum(1 for x, y in fp + ld + dl if x < 60)
+
+    return {
+        "team_name": team_name,
+        "pass_locations": pass_locations,
+        "shot_locations": shot_locations,
+        "turnover_locations": fp + ld + dl,
+        "turnover_count_total": len(fp) + len(ld) + len(dl),
+        "turnover_count": half_turnover,
+        "passes": teams[team_name]["passes"],
+        "pass_success_rate": teams[team_name]["pass_success_rate"],
+        "on_target": teams[team_name]["on_target"],
+        "possession": possession_percentages[team_name],
+        "fouls": teams[team_name]["fouls"],
+    }
+
+
+def match_source_path(match_id, folder_path_events, store_path=None):
+    """
+    경기 이벤트 원본 파일 경로를 반환하는 함수
+    store_path가 주어지면 Parquet 저장소(event_store)의 파일, 아니면 JSON 파일
+
+    반환값:
+    - str | None: 원본 파일 경로 (이벤트 데이터가 없으면 None)
+    """
+    if store_path is not None:
+        return es.find_match_path(store_path, match_id)
+
+    event_file_path = os.path.join(folder_path_events, f"{match_id}.json")
+    if not os.path.exists(event_file_path):
+        return None
+    return event_file_path
+
+
+def load_match(match_id, folder_path_events, store_path=None, source_path=None):
+    """
+    경기 이벤트를 한 번 로드하는 함수
+    store_path가 주어지면 Parquet 저장소(event_store)에서, 아니면 JSON 파일에서 읽음
+
+    매개변수:
+    - match_id (int): 경기 ID
+    - folder_path_events (str): 이벤트 JSON 파일이 위치한 폴더 경로
+    - store_path (str | None): Parquet 저장소 경로
+    - source_path (str | None): 이미 찾은 원본 파일 경로 (match_source_path 결과, None이면 여기서 찾음)
+
+    반환값:
+    - list | None: Event 레코드 리스트 (이벤트 데이터가 없으면 None)
+    """
+    if source_path is None:
+        source_path = match_source_path(match_id, folder_path_events, store_path)
+    if source_path is None:
+        return None
+    if store_path is not None:
+        return es.load_match_records(match_id, store_path, path=source_path)
+    # 스트리밍으로 읽으면서 바로 압축 Event 레코드로 변환 (워커당 메모리 절감)
+    return load_event_records(source_path)
+
+
+@prof.profiled()
+def compute_match_metrics(events_data):
+    """
+    파싱된 이벤트 리스트 하나로 경기의 모든 파생 지표를 계산하는 함수
+
+    매개변수:
+    - events_data (list): Event 레코드 리스트
+
+    반환값:
+    - dict: {"match_data": extract_match_data 결과,
+             "turnovers": extract_turnovers 결과,
+             "locations": {팀 이름: (패스 위치, 유효슛 위치)}}
+    """
+    match_data = mt.extract_match_data(events_data)
+    _, team_names, _ = match_data
+
+    return {
+        "match_data": match_data,
+        "turnovers": to.extract_turnovers(events_data),
+        "locations": {
+            team_name: extract_location_data(events_data, team_name)
+            for team_name in team_names
+        },
+    }
+
+
+def get_match_metrics(match_id, folder_path_events, store_path=None, cache_dir=None):
+    """
+    경기 지표를 반환하는 함수
+    cache_dir가 주어지면 원본 파일과 코드가 바뀌지 않은 경기는 캐시에서 읽고,
+    바뀐 경기만 이벤트를 파싱해 다시 계산한 뒤 캐시에 저장
+
+    매개변수:
+    - match_id (int): 경기 ID
+    - folder_path_events (str): 이벤트 JSON 파일이 위치한 폴더 경로
+    - store_path (str | None): Parquet 저장소 경로 (주어지면 JSON 대신 사용)
+    - cache_dir (str | None): 경기 지표 캐시 폴더 경로 (None이면 캐시 사용 안 함)
+
+    반환값:
+    - dict | None: compute_match_metrics 결과 (이벤트 데이터가 없으면 None)
+    """
+    source_path = match_source_path(match_id, folder_path_events, store_path)
+    if source_path is None:
+        return None
+
+    if cache_dir is not None:
+        with prof.stage("cache.load"):
+            metrics = mc.load_cached_metrics(cache_dir, match_id, source_path)
+        if metrics is not None:
+            return metrics
+
+    # 이벤트 파일은 경기당 한 번만 파싱
+    with prof.stage("load_match") as s:
+        events_data = load_match(match_id, folder_path_events, store_path, source_path)
+        if prof.is_enabled():
+            s.bytes_read += os.path.getsize(source_path)
+            s.events += len(events_data)
+    metrics = compute_match_metrics(events_data)
+
+    if cache_dir is not None:
+        with prof.stage("cache.save"):
+            mc.save_cached_metrics(cache_dir, match_id, source_path, metrics)
+    return metrics
+
+
+def process_match(match_result, folder_path_events, store_path=None, cache_dir=None):
+    """
+    경기 지표를 (캐시 또는 이벤트 파일 1회 파싱으로) 구한 뒤 승리팀/패배팀 지표로 나누는 함수
+
+    매개변수:
+    - match_result (dict): match_id, winner, loser 정보를 담은 딕셔너리
+    - folder_path_events (str): 이벤트 JSON 파일이 위치한 폴더 경로
+    - store_path (str | None): Parquet 저장소 경로 (주어지면 JSON 대신 사용)
+    - cache_dir (str | None): 경기 지표 캐시 폴더 경로 (None이면 캐시 사용 안 함)
+
+    반환값:
+    - dict | None: {"winner": 승리팀 지표, "loser": 패배팀 지표}
+                   (이벤트 파일이 없으면 None)
+    """
+    match_id = match_result["match_id"]
+    winner_side = match_result["winner"]
+    loser_side = match_result["loser"]
+
+    metrics = get_match_metrics(match_id, folder_path_events, store_path, cache_dir)
+    if metrics is None:
+        return None
+
+    # winner_team, loser_team 이름 결정
+    _, team_names, _ = metrics["match_data"]
+    if winner_side == "Home":
+        winner_team = team_names[0]  # 홈팀
+        loser_team = team_names[1]  # 어웨이팀
+    else:
+        winner_team = team_names[1]  # 어웨이팀
+        loser_team = team_names[0]  # 홈팀
+
+    return {
+        "winner": summarize_team(metrics, winner_team, winner_side.lower()),
+        "loser": summarize_team(metrics, loser_team, loser_side.lower()),
+    }
+
+
+def run_matches(
+    match_results,
+    folder_path_events,
+    workers=1,
+    chunksize=8,
+    store_path=None,
+    cache_dir=None,
+    process=process_match,
+):
+    """
+    여러 경기를 처리하여 경기별 결과를 match_results와 같은 순서로 반환하는 함수
+    workers가 2 이상이면 프로세스 풀에 chunksize 단위로 경기를 나누어 병렬 처리
+
+    매개변수:
+    - match_results (list): match_id, winner, loser 정보를 담은 딕셔너리 리스트
+    - folder_path_events (str): 이벤트 JSON 파일이 위치한 폴더 경로
+    - workers (int): 워커 프로세스 수 (1이면 직렬 처리, 0 이하면 CPU 코어 수)
+    - chunksize (int): 워커 하나에 한 번에 전달할 경기 수
+    - store_path (str | None): Parquet 저장소 경로 (주어지면 JSON 대신 사용)
+    - cache_dir (str | None): 경기 지표 캐시 폴더 경로 (None이면 캐시 사용 안 함)
+    - process (callable): 경기별 처리 함수 (process_match와 같은 인자, ex. 워커에서 결과를 요약하는 함수)
+
+    반환값:
+    - iterator: 경기별 process 결과 (이벤트 파일이 없는 경기는 None)
+    """
+    worker = partial(
+        process,
+        folder_path_events=folder_path_events,
+        store_path=store_path,
+        cache_dir=cache_dir,
+    )
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        yield from map(worker, match_results)
+        return
+
+    # executor.map은 제출 순서대로 결과를 반환하므로 직렬 처리와 결과 순서가 동일
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        if not prof.is_enabled():
+            yield from executor.map(worker, match_results, chunksize=chunksize)
+            return
+
+        # 계측 중이면 워커의 단계별 통계를 결과와 함께 받아 합침
+        collecting = partial(prof.call_collecting, worker)
+        for result, stats in executor.map(collecting, match_results, chunksize=chunksize):
+            prof.merge(stats)
+            yield result
@@ -0,0 +1,143 @@
+import os
+from functools import cached_property
+
+import matplotlib.pyplot as plt
+
+import module.pass_networkmap_def as pnm
+import module.shot_map_def as sm
+import module.match_table as mt
+import module.eventchain_map as ec
+import module.match_pipeline as mp
+import module.lineup_registry as lr
+
+
+SIDES = ("home", "away")
+
+# 리포트 그림 이름 (그리는 순서, batch_render 저장 파일 이름)
+FIGURE_NAMES = (
+    "pass_network_home",
+    "pass_network_away",
+    "shot_map_home",
+    "shot_map_away",
+    "match_table",
+    "most_player",
+    "event_chain_home",
+    "event_chain_away",
+)
+
+
+class MatchReport:
+    """
+    경기 하나의 리포트 (패스 네트워크, 슛 맵, 경기 통계 표, Most Player, 이벤트 체인)
+    이벤트와 라인업은 경기당 한 번만 로드하고, 파생 데이터(경기 통계, 이벤트 인덱스)는
+    처음 사용할 때 한 번 계산해 모든 그림이 공유
+
+    사용 예:
+        report = MatchReport(3773457)
+        for name, fig in report.figures():
+            ...
+    """
+
+    def __init__(
+        self,
+        match_id,
+        folder_path_events="./data/events",
+        folder_path_lineups="./data/lineups",
+        store_path=None,
+        registry=None,
+    ):
+        """
+        매개변수:
+        - match_id (int): 경기 ID
+        - folder_path_events (str): 이벤트 JSON 폴더 경로
+        - folder_path_lineups (str): 라인업 JSON 폴더 경로
+        - store_path (str | None): 이벤트 Parquet 저장소 경로 (지정 시 JSON 대신 사용)
+        - registry (LineupRegistry | None): 라인업 저장소 (None이면 라인업 폴더의 공유 저장소)
+        """
+        self.match_id = match_id
+        self.folder_path_events = folder_path_events
+        self.store_path = store_path
+        self.lineup_file_path = os.path.join(folder_path_lineups, f"{match_id}.json")
+        self.registry = registry if registry is not None else lr.get_registry(folder_path_lineups)
+
+    def has_data(self):
+        """
+        이벤트와 라인업 데이터가 모두 있는지 확인하는 함수 (파일을 읽지 않음)
+        """
+        return self.source_path is not None and os.path.exists(self.lineup_file_path)
+
+    @cached_property
+    def source_path(self):
+        # 이벤트 원본 파일 경로 (저장소 경로 탐색은 한 번만)
+        return mp.match_source_path(self.match_id, self.folder_path_events, self.store_path)
+
+    @cached_property
+    def events(self):
+        # Event 레코드 리스트 (경기당 한 번 로드)
+        events = mp.load_match(self.match_id, self.folder_path_events, self.store_path, self.source_path)
+        if events is None:
+            raise FileNotFoundError(f"{self.match_id}: event data not found")
+        return events
+
+    @cached_property
+    def lineups(self):
+        # MatchLineup (라인업 저장소에서 경기당 한 번 파싱)
+        lineup = self.registry.get(self.match_id)
+        if lineup is None:
+            raise FileNotFoundError(self.lineup_file_path)
+        return lineup
+
+    @cached_property
+    def match_stats(self):
+        # extract_match_data 결과 (팀별 경기 통계, 팀 이름 리스트, 팀별 볼 점유율)
+        return mt.extract_match_data(self.events)
+
+    @cached_property
+    def event_index(self):
+        # 이벤트 체인용 인덱스 (홈/원정 공유)
+        return ec.build_event_index(self.events)
+
+    def pass_network(self, side, show=False):
+        return pnm.draw_pass_network(self.events, self.lineups, side, show=show)
+
+    def shot_map(self, side, show=False):
+        return sm.draw_shot_map(self.events, self.lineups, side, show=show)
+
+    def match_table(self, show=False):
+        match_data, team_names, possession_percentages = self.match_stats
+        return mt.create_match_table(match_data, team_names, possession_percentages, show=show)
+
+    def most_player(self, show=False):
+        return mt.extract_record_data(self.events, show=show)
+
+    def event_chain(self, side, show=False):
+        return ec.draw_event_chain(self.events, self.lineups, side, show=show, event_index=self.event_index)
+
+    def figure(self, name, show=False):
+        """
+        이름(FIGURE_NAMES)으로 리포트 그림 하나를 그리는 함수
+
+        반환값:
+        - matplotlib.figure.Figure
+        """
+        if name not in FIGURE_NAMES:
+            raise ValueError(f"unknown figure: {name}")
+        kind, _, side = name.rpartition("_")
+        if side in SIDES:
+            return getattr(self, kind)(side, show=show)
+        return getattr(self, name)(show=show)
+
+    def figures(self, names=FIGURE_NAMES, show=False):
+        """
+        리포트 그림을 차례로 그려 (이름, Figure)를 반환하는 제너레이터
+        (Figure는 받는 쪽에서 저장 후 닫음)
+        """
+        for name in names:
+            yield name, self.figure(name, show=show)
+
+    def show(self, names=FIGURE_NAMES):
+        """
+        리포트 그림을 차례로 화면에 출력하는 함수 (single_final.py)
+        """
+        for _, fig in self.figures(names, show=True):
+            plt.close(fig)
@@ -1,36 +1,51 @@
-import json
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 from collections import Counter
 
+import module.event_model as em
+import module.event_store as es
+import module.profiling as prof
+from module.event_model import iter_event_records
+
+# 유효슛으로 집계하는 슛 결과 코드
+ON_TARGET_OUTCOMES = frozenset(
+    [
+        em.GOAL,
+        em.SAVED,
+        em.POST,
+        em.SAVED_OFF_TARGET,
+        em.SAVED_TO_POST,
+        em.BLOCKED,
+    ]
+)
+
 
+@prof.profiled()
 def extract_match_data(events_file_path):
     """
     JSON 데이터를 기반으로 경기 통계를 추출하는 함수
 
     매개변수:
-    - events_file_path (str): JSON 파일 경로
+    - events_file_path (str | list | iterator): JSON 파일 경로(스트리밍으로 읽음),
+      이벤트 딕셔너리/Event 레코드의 리스트 또는 반복자
 
     반환값:
     - dict: 팀별 경기 통계
-    - list: 추출된 팀 이름 리스트
+    - list: 추출된 팀 이름 리스트 (등장 순서: 홈팀, 어웨이팀)
     - dict: 팀별 볼 점유율
     """
-    with open(events_file_path, "r", encoding="utf-8") as f:
-        events_data = json.load(f)
-
     teams = {}
-    team_names = set()
     team_possession = {}
     total_duration = 0
 
-    for event in events_data:
-        team_name = event["team"]["name"]
-        team_names.add(team_name)
+    # 팀/이벤트 종류/결과는 정수 코드로 비교하고, 팀 이름은 마지막에 한 번만 변환
+    for event in iter_event_records(events_file_path):
+        team = event.team
 
-        # 팀별 초기화
-        if team_name not in teams:
-            teams[team_name] = {
+        # 팀별 초기화 (팀은 처음 등장한 순서대로 저장)
+        if team not in teams:
+            teams[team] = {
                 "shots": 0,
                 "on_target": 0,
                 "fouls": 0,
@@ -43,52 +58,44 @@ def extract_match_data(events_file_path):
                 "pass_success_rate": 0,
                 "turnover_count": 0,
             }
+        team_stats = teams[team]
 
-        event_type = event["type"]["name"]
+        event_type = event.type
         # 볼 점유율 계산
-        possession_team = event.get("possession_team", {}).get("name", None)
-        duration = event.get("duration", 0)
+        duration = event.duration
         total_duration += duration
-        team_possession[possession_team] = (
-            team_possession.get(possession_team, 0) + duration
+        team_possession[event.possession_team] = (
+            team_possession.get(event.possession_team, 0) + duration
         )
 
         # 경기 통계 계산
-        if event_type == "Shot":
-            teams[team_name]["shots"] += 1
-            outcome = event.get("shot", {}).get("outcome", {}).get("name", "")
-            if outcome in [
-                "Goal",
-                "Saved",
-                "Post",
-                "Saved Off Target",
-                "Saved to Post",
-                "Blocked",
-            ]:
-                teams[team_name]["on_target"] += 1
-        elif event_type == "Pass":
-            teams[team_name]["passes"] += 1
-            if "outcome" not in event.get("pass", {}):
-                teams[team_name]["pass_success"] += 1
-            elif event["pass"]["outcome"]["name"] == "Pass Offside":
-                teams[team_name]["offsides"] += 1
-            elif event["pass"].get("type", {}).get("name", "") == "Corner":
-                teams[team_name]["corners"] += 1
-        if event_type in ["Foul Committed", "Bad Behaviour"]:
-            teams[team_name]["fouls"] += 1
-            card_type1 = event.get("foul_committed", {}).get("card", {}).get("name", "")
-            card_type2 = event.get("bad_behaviour", {}).get("card", {}).get("name", "")
-            if card_type1 == "Yellow Card" or card_type2 == "Yellow Card":
-                teams[team_name]["yellow_cards"] += 1
-            elif card_type1 in ["Red Card", "Second Yellow"] or card_type2 in [
-                "Red Card",
-                "Second Yellow",
-            ]:
-                teams[team_name]["red_cards"] += 1
-
-                # 볼 점유율 계산
+        if event_type == em.SHOT:
+            team_stats["shots"] += 1
+            if event.outcome in ON_TARGET_OUTCOMES:
+                team_stats["on_target"] += 1
+        elif event_type == em.PASS:
+            team_stats["passes"] += 1
+            if event.outcome == 0:
+                team_stats["pass_success"] += 1
+            elif event.outcome == em.PASS_OFFSIDE:
+                team_stats["offsides"] += 1
+            elif event.pass_type == em.CORNER:
+                team_stats["corners"] += 1
+        if event_type == em.FOUL_COMMITTED or event_type == em.BAD_BEHAVIOUR:
+            team_stats["fouls"] += 1
+            if event.card == em.YELLOW_CARD:
+                team_stats["yellow_cards"] += 1
+            elif event.card == em.RED_CARD or event.card == em.SECOND_YELLOW:
+                team_stats["red_cards"] += 1
+
+    # 팀 코드 -> 팀 이름
+    team_names = [em.TEAMS.name(team) for team in teams]
+    teams = {em.TEAMS.name(team): team_stats for team, team_stats in teams.items()}
+
+    # 볼 점유율 계산
     possession_percentages = {
-        team: (time / total_duration) * 100 for team, time in team_possession.items()
+        em.TEAMS.name(team): (time / total_duration) * 100
+        for team, time in team_possession.items()
     }
 
     # 패스 성공률 계산
@@ -97,12 +104,164 @@ def extract_match_data(events_file_path):
             (teams[team]["pass_success"] / teams[team]["passes"]) * 100, 2
         )
 
-    return teams, list(team_names), possession_percentages
+    return teams, team_names, possession_percentages
+
+
+# 경기 통계 표의 통계 항목 (extract_match_data의 팀별 통계 키 + 볼 점유율)
+TABLE_STATS = [
+    "shots",
+    "on_target",
+    "possession",
+    "passes",
+    "pass_success",
+    "pass_success_rate",
+    "fouls",
+    "yellow_cards",
+    "red_cards",
+    "offsides",
+    "corners",
+]
+
+# 컬럼 기반 통계 계산에 필요한 이벤트 컬럼 (event_store.EVENT_SCHEMA 이름)
+STAT_COLUMNS = [
+    "type",
+    "team",
+    "possession_team",
+    "duration",
+    "pass_outcome",
+    "pass_type",
+    "shot_outcome",
+    "foul_card",
+    "bad_behaviour_card",
+]
+
+_ON_TARGET_NAMES = [em.OUTCOMES.name(code) for code in ON_TARGET_OUTCOMES]
+
+
+@prof.profiled()
+def match_stats_frame(frame):
+    """
+    컬럼 형식 이벤트 데이터프레임에서 경기별/팀별 통계를 한 번에 계산하는 함수
+    이벤트를 하나씩 순회하지 않고 컬럼 비교로 만든 플래그를 (match_id, 팀)별로 합산하므로
+    여러 경기(ex. event_store.load_season_frame 결과)를 한 번에 처리할 수 있음
 
+    매개변수:
+    - frame (pd.DataFrame): STAT_COLUMNS를 포함하는 이벤트 데이터프레임
+      (match_id 컬럼이 없으면 한 경기로 보고 match_id를 0으로 둠)
 
-def create_match_table(match_data, team_names, possession_percentages):
+    반환값:
+    - pd.DataFrame: match_id, team, stat, value 컬럼의 긴 형식(tidy) 데이터프레임
+      (경기 안에서 팀은 처음 등장한 순서: 홈팀, 어웨이팀 / stat은 TABLE_STATS 순서)
+    """
+    if "match_id" in frame.columns:
+        match_id = frame["match_id"].to_numpy()
+    else:
+        match_id = np.zeros(len(frame), dtype=np.int64)
+
+    event_type = frame["type"]
+    is_shot = (event_type == "Shot").to_numpy()
+    is_pass = (event_type == "Pass").to_numpy()
+    is_foul = event_type.isin(["Foul Committed", "Bad Behaviour"]).to_numpy()
+
+    pass_outcome = frame["pass_outcome"]
+    pass_success = is_pass & pass_outcome.isna().to_numpy()
+    offside = is_pass & (pass_outcome == "Pass Offside").to_numpy()
+    # 실패한 패스 중 오프사이드가 아닌 코너킥만 집계 (extract_match_data와 같은 규칙)
+    corner = is_pass & ~pass_success & ~offside & (frame["pass_type"] == "Corner").to_numpy()
+    card = frame["foul_card"].fillna(frame["bad_behaviour_card"])
+
+    counters = {
+        "shots": is_shot,
+        "on_target": is_shot & frame["shot_outcome"].isin(_ON_TARGET_NAMES).to_numpy(),
+        "fouls": is_foul,
+        "yellow_cards": is_foul & (card == "Yellow Card").to_numpy(),
+        "red_cards": is_foul & card.isin(["Red Card", "Second Yellow"]).to_numpy(),
+        "offsides": offside,
+        "corners": corner,
+        "passes": is_pass,
+        "pass_success": pass_success,
+    }
+
+    # (경기, 팀) 그룹 번호: 팀 이름을 factorize한 코드와 경기 코드를 합침
+    # (pd.factorize는 처음 등장한 순서로 번호를 매기므로 경기 안의 팀 순서가 유지됨)
+    match_codes, match_values = pd.factorize(match_id)
+    team_codes, team_values = pd.factorize(frame["team"])
+    num_teams = max(len(team_values), 1)
+    pair_codes = match_codes * num_teams + team_codes
+    has_team = team_codes >= 0
+    group_codes, group_pairs = pd.factorize(pair_codes[has_team])
+    num_groups = len(group_pairs)
+
+    table = pd.DataFrame(
+        {
+            name: np.bincount(group_codes, weights=flag[has_team], minlength=num_groups)
+            for name, flag in counters.items()
+        }
+    )
+
+    # 볼 점유율: 점유 팀별 duration 합 / 경기 전체 duration 합 (점유 팀 이름은 팀 코드로 변환)
+    duration = frame["duration"].fillna(0.0).to_numpy(dtype=float)
+    possession_codes, possession_values = pd.factorize(frame["possession_team"])
+    possession_codes = np.where(
+        possession_codes >= 0,
+        pd.Index(team_values).get_indexer(possession_values)[possession_codes],
+        -1,
+    )
+    possession_pairs = match_codes * num_teams + possession_codes
+    has_possession = possession_codes >= 0
+    possession_time = np.bincount(
+        possession_pairs[has_possession],
+        weights=duration[has_possession],
+        minlength=len(match_values) * num_teams,
+    )
+    total_time = np.bincount(match_codes, weights=duration, minlength=len(match_values))
+    table["possession"] = possession_time[group_pairs] / total_time[group_pairs // num_teams] * 100
+    table["pass_success_rate"] = [
+        round(success / passes * 100, 2) if passes else np.nan
+        for success, passes in zip(table["pass_success"], table["passes"])
+    ]
+
+    # (경기, 팀) 행 x 통계 열 -> (경기, 팀, 통계) 행
+    num_stats = len(TABLE_STATS)
+    return pd.DataFrame(
+        {
+            "match_id": np.repeat(match_values[group_pairs // num_teams], num_stats),
+            "team": np.repeat(team_values[group_pairs % num_teams], num_stats),
+            "stat": np.tile(TABLE_STATS, len(table)),
+            "value": table[TABLE_STATS].to_numpy().ravel(),
+        }
+    )
+
+
+def load_match_stats(match_ids, store_path=None, folder_path_events=None):
+    """
+    여러 경기의 통계를 한 번에 계산하는 함수
+    Parquet 저장소가 주어지면 통계에 필요한 컬럼만 읽고, 아니면 이벤트 JSON을 컬럼 형식으로 변환
+    (이벤트 파일이 없는 경기는 건너뜀)
+
+    매개변수:
+    - match_ids (list): 경기 ID 리스트
+    - store_path (str | None): Parquet 저장소 경로 (python -m module.event_store로 생성)
+    - folder_path_events (str | None): 이벤트 JSON 폴더 경로 (store_path가 없을 때 사용)
+
+    반환값:
+    - pd.DataFrame: match_id, team, stat, value 컬럼의 긴 형식 데이터프레임
+    """
+    frame = es.load_matches_frame(match_ids, STAT_COLUMNS, store_path, folder_path_events)
+    if frame.empty:
+        return pd.DataFrame(columns=["match_id", "team", "stat", "value"])
+    return match_stats_frame(frame)
+
+
+def create_match_table(match_data, team_names, possession_percentages, show=True):
     """
     주어진 경기 데이터를 표로 출력하는 함수
+
+    매개변수:
+    - show (bool): True이면 plt.show()로 화면에 출력 (False이면 출력하지 않고 Figure만 반환)
+
+    반환값:
+    - matplotlib.figure.Figure: 경기 통계 표 Figure
     """
     columns = ["Category", team_names[0], team_names[1]]
     rows = [
@@ -172,41 +331,38 @@ def create_match_table(match_data, team_names, possession_percentages):
     table.scale(1, 1.5)
 
     plt.title("Match Statistics", fontsize=16, fontweight="bold")
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
-def extract_record_data(events_file_path):
+@prof.profiled()
+def extract_record_data(events_file_path, show=True):
     """
     JSON 데이터를 기반으로 선수별 데이터를 추출하는 함수
 
     매개변수:
-    - events_file_path (str): JSON 파일 경로
+    - events_file_path (str | list | iterator): JSON 파일 경로(스트리밍으로 읽음),
+      이벤트 딕셔너리/Event 레코드의 리스트 또는 반복자
+    - show (bool): True이면 plt.show()로 화면에 출력 (False이면 출력하지 않고 Figure만 반환)
 
     반환값:
-    - None: 분야별 Most Player를 표로 출력
+    - matplotlib.figure.Figure: 분야별 Most Player 표 Figure
 
     """
-    with open(events_file_path, "r", encoding="utf-8") as f:
-        events_data = json.load(f)
-
     record_count = Counter()
 
     # 이벤트 데이터를 순회하면서 'Shot', 'Dribble', 'Pass' 카운트
-    for event in events_data:
-        event_type = event.get("type", {}).get("name", None)
-        player_name = event.get("player", {}).get("name", None)
+    for event in iter_event_records(events_file_path):
+        event_type = event.type
+        player_name = event.player
 
-        if event_type == "Shot":
+        if event_type == em.SHOT:
             record_count[(player_name, "Shot")] += 1
-        elif (
-            event_type == "Dribble"
-            and event.get("dribble", {}).get("outcome", {}).get("name", None)
-            == "Complete"
-        ):
+        elif event_type == em.DRIBBLE and event.outcome == em.COMPLETE:
             record_count[(player_name, "Dribble")] += 1
-        elif event_type == "Pass" and "outcome" not in event.get(
-            "pass", {}
-        ):  # pass.outcome이 없을 때 -> 성공한 패스
+        elif event_type == em.PASS and event.outcome == 0:
+            # pass.outcome이 없을 때 -> 성공한 패스
             record_count[(player_name, "Pass")] += 1
 
     player_record = {}
@@ -279,7 +435,9 @@ def extract_record_data(events_file_path):
     table.scale(1, 1.5)
     ax[2].set_title("Most Passer", fontsize=16, fontweight="bold")
 
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 
 if __name__ == "__main__":
@@ -0,0 +1,467 @@
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.csgraph import shortest_path, connected_components
+import matplotlib.pyplot as plt
+
+import module.event_store as es
+import module.match_index as mi
+import module.batch_render as br
+import module.stats_engine as se
+import module.profiling as prof
+from module.pitch import draw_soccer_field
+
+
+# 패스 그래프에 필요한 이벤트 컬럼 (event_store.EVENT_SCHEMA 이름)
+PASS_COLUMNS = [
+    "type",
+    "team",
+    "player_id",
+    "player",
+    "pass_recipient_id",
+    "pass_recipient",
+    "pass_outcome",
+    "location_x",
+    "location_y",
+    "pass_end_x",
+    "pass_end_y",
+]
+
+# 매개 중심성 계산에서 한 번에 만드는 (출발 x 선수 x 선수) 배열의 최대 원소 수 (메모리 제한)
+BETWEENNESS_BLOCK_ELEMENTS = 1 << 22
+
+# 선수별 지표 표 컬럼 (metrics_frame)
+METRIC_COLUMNS = [
+    "team_name",
+    "player_id",
+    "player_name",
+    "matches",
+    "passes_made",
+    "passes_received",
+    "out_degree",
+    "in_degree",
+    "betweenness",
+    "pagerank",
+    "x",
+    "y",
+]
+
+
+class PassGraph:
+    """
+    팀 하나의 패스 네트워크 (선수 ID 인덱스의 희소 정수 인접 행렬)
+    adjacency[i, j]는 player_ids[i] -> player_ids[j] 패스 수이며,
+    경기별 인접 행렬(match_adjacency)을 모두 더한 시즌 합계
+    """
+
+    __slots__ = ("team_name", "player_ids", "player_names", "positions", "match_adjacency", "adjacency")
+
+    def __init__(self, team_name, player_ids, player_names, positions, match_adjacency):
+        self.team_name = team_name
+        self.player_ids = player_ids
+        self.player_names = player_names
+        self.positions = positions
+        self.match_adjacency = match_adjacency
+
+        n = len(player_ids)
+        adjacency = sp.csr_matrix((n, n), dtype=np.int32)
+        for matrix in match_adjacency.values():
+            adjacency = adjacency + matrix
+        self.adjacency = adjacency
+
+    @property
+    def match_ids(self):
+        return list(self.match_adjacency)
+
+    def index(self, player_id):
+        """
+        선수 ID의 행렬 인덱스 (없으면 -1)
+        """
+        positions = np.flatnonzero(self.player_ids == player_id)
+        return int(positions[0]) if len(positions) else -1
+
+    def __repr__(self):
+        return f"PassGraph({self.team_name!r}, players={len(self.player_ids)}, matches={len(self.match_adjacency)}, passes={int(self.adjacency.sum())})"
+
+
+def pass_edges(frame, completed_only=True):
+    """
+    이벤트 데이터프레임에서 패스한 선수와 받은 선수가 모두 있는 패스만 골라내는 함수
+
+    매개변수:
+    - frame (pd.DataFrame): PASS_COLUMNS를 포함하는 이벤트 데이터프레임 (match_id 컬럼이 없으면 한 경기로 봄)
+    - completed_only (bool): True이면 성공한 패스(pass_outcome 없음)만 사용
+
+    반환값:
+    - pd.DataFrame: match_id, team, passer_id, recipient_id, passer, recipient, x, y, end_x, end_y
+    """
+    mask = (
+        (frame["type"] == "Pass").to_numpy()
+        & frame["player_id"].notna().to_numpy()
+        & frame["pass_recipient_id"].notna().to_numpy()
+    )
+    if completed_only:
+        mask = mask & frame["pass_outcome"].isna().to_numpy()
+    passes = frame[mask]
+
+    if "match_id" in passes.columns:
+        match_id = passes["match_id"].to_numpy(np.int64)
+    else:
+        match_id = np.zeros(len(passes), dtype=np.int64)
+
+    return pd.DataFrame(
+        {
+            "match_id": match_id,
+            "team": passes["team"].to_numpy(object),
+            "passer_id": passes["player_id"].to_numpy(np.int64),
+            "recipient_id": passes["pass_recipient_id"].to_numpy(np.int64),
+            "passer": passes["player"].to_numpy(object),
+            "recipient": passes["pass_recipient"].to_numpy(object),
+            "x": passes["location_x"].to_numpy(float),
+            "y": passes["location_y"].to_numpy(float),
+            "end_x": passes["pass_end_x"].to_numpy(float),
+            "end_y": passes["pass_end_y"].to_numpy(float),
+        }
+    )
+
+
+def _average_positions(codes, x, y, n):
+    # 선수별 평균 위치 (좌표가 없는 패스는 제외, 좌표가 하나도 없으면 nan)
+    valid = ~(np.isnan(x) | np.isnan(y))
+    counts = np.bincount(codes[valid], minlength=n)
+    with np.errstate(invalid="ignore"):
+        mean_x = np.bincount(codes[valid], weights=x[valid], minlength=n) / counts
+        mean_y = np.bincount(codes[valid], weights=y[valid], minlength=n) / counts
+    return np.column_stack([mean_x, mean_y])
+
+
+def _team_graph(team_name, edges):
+    num_passes = len(edges)
+
+    # 보낸 선수/받은 선수 ID를 한 번에 factorize해 팀 안의 행렬 인덱스로 변환
+    codes, player_ids = pd.factorize(np.concatenate([edges["passer_id"].to_numpy(), edges["recipient_id"].to_numpy()]))
+    n = len(player_ids)
+    passer, recipient = codes[:num_passes], codes[num_passes:]
+
+    names = np.concatenate([edges["passer"].to_numpy(object), edges["recipient"].to_numpy(object)])
+    player_names = pd.Series(names).groupby(codes, sort=True).first().tolist()
+
+    # 패스한 선수는 패스 시작 위치, 받은 선수는 패스 도착 위치 (draw_pass_network와 같은 규칙)
+    positions = _average_positions(
+        codes,
+        np.concatenate([edges["x"].to_numpy(), edges["end_x"].to_numpy()]),
+        np.concatenate([edges["y"].to_numpy(), edges["end_y"].to_numpy()]),
+        n,
+    )
+
+    # 경기 순서로 정렬한 뒤 경기별 구간마다 희소 행렬을 만듦 (중복 (i, j)는 tocsr에서 합산)
+    match_codes, match_ids = pd.factorize(edges["match_id"].to_numpy(), sort=True)
+    order = np.argsort(match_codes, kind="stable")
+    offsets = np.concatenate([[0], np.cumsum(np.bincount(match_codes, minlength=len(match_ids)))])
+    ones = np.ones(num_passes, dtype=np.int32)
+    match_adjacency = {}
+    for m, match_id in enumerate(match_ids):
+        rows = order[offsets[m]:offsets[m + 1]]
+        match_adjacency[int(match_id)] = sp.coo_matrix(
+            (ones[rows], (passer[rows], recipient[rows])), shape=(n, n)
+        ).tocsr()
+
+    return PassGraph(team_name, np.asarray(player_ids, dtype=np.int64), player_names, positions, match_adjacency)
+
+
+@prof.profiled()
+def build_pass_graphs(frame, completed_only=True):
+    """
+    이벤트 데이터프레임(여러 경기 가능)으로 팀별 패스 그래프를 만드는 함수
+
+    매개변수:
+    - frame (pd.DataFrame): PASS_COLUMNS를 포함하는 이벤트 데이터프레임
+      (ex. event_store.load_matches_frame(match_ids, PASS_COLUMNS, ...) 결과)
+    - completed_only (bool): True이면 성공한 패스만 사용
+
+    반환값:
+    - dict: {팀 이름: PassGraph} (팀 이름 순)
+    """
+    edges = pass_edges(frame, completed_only)
+    return {
+        team_name: _team_graph(team_name, team_edges)
+        for team_name, team_edges in edges.groupby("team", sort=True)
+    }
+
+
+def season_pass_graphs(match_ids, store_path=None, folder_path_events=None, completed_only=True):
+    """
+    여러 경기(ex. 한 시즌)의 팀별 패스 그래프를 만드는 함수 (Parquet 저장소에서는 필요한 컬럼만 읽음)
+
+    반환값:
+    - dict: {팀 이름: PassGraph}
+    """
+    frame = es.load_matches_frame(match_ids, PASS_COLUMNS, store_path, folder_path_events)
+    return build_pass_graphs(frame, completed_only)
+
+
+def degree_centrality(adjacency):
+    """
+    선수별 보낸/받은 패스 수(가중 차수)와 패스를 주고받은 상대 선수 수(차수)
+
+    반환값:
+    - dict: {"passes_made", "passes_received", "out_degree", "in_degree"} 배열
+    """
+    linked = (adjacency > 0).astype(np.int32)
+    return {
+        "passes_made": np.asarray(adjacency.sum(axis=1)).ravel(),
+        "passes_received": np.asarray(adjacency.sum(axis=0)).ravel(),
+        "out_degree": np.asarray(linked.sum(axis=1)).ravel(),
+        "in_degree": np.asarray(linked.sum(axis=0)).ravel(),
+    }
+
+
+def pagerank(adjacency, alpha=0.85, tol=1e-10, max_iter=200):
+    """
+    패스 수를 가중치로 한 PageRank (희소 행렬 곱 반복, 패스를 보내지 않은 선수의 점수는 모든 선수에게 균등 분배)
+
+    매개변수:
+    - adjacency (scipy.sparse matrix): (n, n) 패스 수 인접 행렬
+    - alpha (float): 감쇠 계수
+    - tol (float): 수렴 기준 (반복 간 L1 변화량)
+    - max_iter (int): 최대 반복 횟수
+
+    반환값:
+    - np.ndarray: 선수별 PageRank (합 1)
+    """
+    n = adjacency.shape[0]
+    if n == 0:
+        return np.empty(0)
+
+    out_weight = np.asarray(adjacency.sum(axis=1), dtype=float).ravel()
+    dangling = out_weight == 0
+    scale = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+    # 행 정규화한 전이 행렬의 전치 (rank @ P 대신 P.T @ rank)
+    transition_t = (sp.diags(scale) @ adjacency.astype(float)).T.tocsr()
+
+    rank = np.full(n, 1.0 / n)
+    for _ in range(max_iter):
+        updated = alpha * (transition_t @ rank + rank[dangling].sum() / n) + (1 - alpha) / n
+        converged = np.abs(updated - rank).sum() < tol
+        rank = updated
+        if converged:
+            break
+    return rank / rank.sum()
+
+
+def betweenness_centrality(adjacency, normalized=True):
+    """
+    패스 수가 많을수록 가까운(거리 = 1 / 패스 수) 방향 그래프의 매개 중심성
+    전체 최단 거리(Dijkstra)를 구한 뒤, 최단 경로 수를 거리 순서대로 (출발 선수 묶음 단위로 한 번에) 세고
+    (출발, 경유, 도착) 3차원 배열 연산으로 합산
+    (3차원 배열은 BETWEENNESS_BLOCK_ELEMENTS 이하가 되도록 출발 선수를 나눠 만들므로 메모리 사용량이 일정,
+     최단 경로는 연결 요소를 넘지 않으므로 연결 요소가 여러 개이면 요소별로 계산)
+
+    매개변수:
+    - adjacency (scipy.sparse matrix): (n, n) 패스 수 인접 행렬
+    - normalized (bool): True이면 (n - 1)(n - 2)로 나눔
+
+    반환값:
+    - np.ndarray: 선수별 매개 중심성
+    """
+    n = adjacency.shape[0]
+    if n < 3:
+        return np.zeros(n)
+
+    weights = sp.csr_matrix(adjacency, dtype=float)
+    weights.setdiag(0)
+    weights.eliminate_zeros()
+
+    num_components, labels = connected_components(weights, directed=True, connection="weak")
+    if num_components > 1:
+        between = np.zeros(n)
+        for component in range(num_components):
+            members = np.flatnonzero(labels == component)
+            if len(members) >= 3:
+                between[members] = betweenness_centrality(weights[members][:, members], normalized=False)
+        return between / ((n - 1) * (n - 2)) if normalized else between
+
+    lengths = weights.copy()
+    lengths.data = 1.0 / lengths.data
+    distance = shortest_path(lengths, method="D", directed=True)
+
+    edge_length = np.full((n, n), np.inf)
+    edges = lengths.tocoo()
+    edge_length[edges.row, edges.col] = edges.data
+
+    block = max(1, BETWEENNESS_BLOCK_ELEMENTS // (n * n))
+    blocks = [np.arange(start, min(start + block, n)) for start in range(0, n, block)]
+
+    # 최단 경로 수 sigma[s, t]: 출발 선수마다 가까운 순서로, 직전 선수들의 경로 수를 더함
+    sigma = np.zeros((n, n))
+    for sources in blocks:
+        sigma[sources] = _path_counts(distance[sources], edge_length, sources)
+
+    between = np.zeros(n)
+    eye = np.eye(n, dtype=bool)
+    for sources in blocks:
+        d = distance[sources]
+        is_source = sources[:, None] == np.arange(n)[None, :]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            # on_path[s, v, t]: v가 s에서 t까지의 최단 경로 위에 있음
+            on_path = _on_shortest_path(d[:, :, None] + distance[None, :, :], d)
+            share = sigma[sources][:, :, None] * sigma[None, :, :] / sigma[sources][:, None, :]
+        # 출발/경유/도착 선수가 모두 다른 경우만 합산
+        on_path &= ~(is_source[:, :, None] | eye[None, :, :] | is_source[:, None, :])
+        between += np.where(on_path & np.isfinite(share), share, 0.0).sum(axis=(0, 2))
+
+    if normalized:
+        between = between / ((n - 1) * (n - 2))
+    return between
+
+
+def _on_shortest_path(through, d):
+    # through[s, w, t] (w를 거친 거리)가 d[s, t]와 같은지 (도달할 수 없는 (s, t)는 거리가 inf이고
+    # isclose(inf, inf)는 참이므로 따로 제외)
+    return np.isfinite(d)[:, None, :] & np.isclose(through, d[:, None, :], rtol=1e-9, atol=0)
+
+
+def _path_counts(d, edge_length, sources):
+    # d: (출발 선수 묶음, n) 최단 거리 -> 같은 크기의 최단 경로 수
+    rows = np.arange(len(sources))
+    with np.errstate(invalid="ignore"):
+        # on_edge[s, w, t]: 간선 w -> t가 s에서 t까지의 최단 경로 위에 있음
+        on_edge = _on_shortest_path(d[:, :, None] + edge_length[None, :, :], d)
+
+    sigma = np.zeros_like(d)
+    sigma[rows, sources] = 1
+    # 간선 길이가 양수이므로 직전 선수는 항상 더 가까움 (가까운 순서로 처리하면 이미 계산되어 있음)
+    order = np.argsort(d, axis=1, kind="stable")
+    for k in range(1, d.shape[1]):
+        targets = order[:, k]
+        sigma[rows, targets] = (sigma * on_edge[rows, :, targets]).sum(axis=1)
+    return sigma
+
+
+def metrics_frame(graph):
+    """
+    패스 그래프의 선수별 네트워크 지표 표를 만드는 함수
+
+    반환값:
+    - pd.DataFrame: METRIC_COLUMNS 형식 (선수 1행)
+    """
+    degree = degree_centrality(graph.adjacency)
+    appearances = np.zeros(len(graph.player_ids), dtype=np.int64)
+    for matrix in graph.match_adjacency.values():
+        involved = np.asarray(matrix.sum(axis=1)).ravel() + np.asarray(matrix.sum(axis=0)).ravel()
+        appearances += involved > 0
+
+    return pd.DataFrame(
+        {
+            "team_name": graph.team_name,
+            "player_id": graph.player_ids,
+            "player_name": graph.player_names,
+            "matches": appearances,
+            **degree,
+            "betweenness": betweenness_centrality(graph.adjacency),
+            "pagerank": pagerank(graph.adjacency),
+            "x": graph.positions[:, 0],
+            "y": graph.positions[:, 1],
+        }
+    )[METRIC_COLUMNS]
+
+
+def metrics_table(graphs):
+    """
+    여러 팀 패스 그래프의 선수별 지표 표를 하나로 합치는 함수
+    """
+    if not graphs:
+        return pd.DataFrame(columns=METRIC_COLUMNS)
+    return pd.concat([metrics_frame(graph) for graph in graphs.values()], ignore_index=True)
+
+
+def draw_pass_graph(graph, max_players=11, show=True):
+    """
+    패스 그래프를 필드 위에 그리는 함수 (주고받은 패스가 많은 max_players명만 표시)
+
+    매개변수:
+    - graph (PassGraph): 팀 패스 그래프
+    - max_players (int): 표시할 선수 수
+    - show (bool): True이면 plt.show()로 화면에 출력 (False이면 출력하지 않고 Figure만 반환)
+
+    반환값:
+    - matplotlib.figure.Figure: 패스 네트워크 Figure
+    """
+    degree = degree_centrality(graph.adjacency)
+    involvement = degree["passes_made"] + degree["passes_received"]
+    players = np.argsort(-involvement, kind="stable")[:max_players]
+    players = players[~np.isnan(graph.positions[players, 0])]
+
+    sub = graph.adjacency[players][:, players].tocoo()
+    positions = graph.positions[players]
+    max_count = sub.data.max() if sub.nnz else 1
+
+    fig, ax = plt.subplots(figsize=(12, 8))
+    ax = draw_soccer_field(ax)
+    for i, j, count in zip(sub.row, sub.col, sub.data):
+        if i == j:
+            continue
+        ax.plot(
+            [positions[i, 0], positions[j, 0]], [positions[i, 1], positions[j, 1]],
+            color="blue", linewidth=6 * count / max_count, alpha=0.7,
+        )
+
+    sizes = involvement[players] / max(involvement[players].max(), 1) * 600
+    ax.scatter(positions[:, 0], positions[:, 1], c="red", s=sizes, edgecolor="black", zorder=5)
+    for k, player in enumerate(players):
+        ax.text(positions[k, 0], positions[k, 1] + 2, graph.player_names[player], fontsize=10, ha="center", zorder=6)
+
+    plt.title(f"{graph.team_name} Pass Network ({len(graph.match_adjacency)} matches)", fontsize=14)
+    plt.axis("off")
+    if show:
+        plt.show()
+    return fig
+
+
+def main():
+    parser = argparse.ArgumentParser(description="시즌 단위 팀 패스 네트워크와 선수별 네트워크 지표 계산")
+    parser.add_argument("--season", action="append", default=None, help="시즌 이름 (여러 번 지정 가능)")
+    parser.add_argument("--team", action="append", default=None, help="팀 이름 (여러 번 지정 가능)")
+    parser.add_argument("--matches", default="./Laliga_10_21", help="경기 정보 JSON 폴더")
+    parser.add_argument("--events", default="./data/events", help="이벤트 JSON 폴더")
+    parser.add_argument("--event-store", default=None, help="이벤트 Parquet 저장소 경로 (지정 시 필요한 컬럼만 읽음)")
+    parser.add_argument("--all-passes", action="store_true", help="실패한 패스도 포함")
+    parser.add_argument("--out", default="pass_network_metrics.csv", help="선수별 지표 CSV/Parquet 저장 경로")
+    parser.add_argument("--figures", default=None, help="팀별 패스 네트워크 그림 저장 폴더 (생략 시 그리지 않음)")
+    parser.add_argument("--format", nargs="+", default=["png"], choices=["png", "svg", "pdf"], help="그림 저장 형식")
+    args = parser.parse_args()
+
+    index = mi.get_match_index(args.matches, args.events)
+    selected = mi.filter_matches(
+        index,
+        seasons=args.season,
+        teams=args.team,
+        has_events=None if args.event_store else True,
+    )
+    match_ids = selected["match_id"].tolist()
+    if args.event_store is not None:
+        # 저장소에 없는 경기는 읽지 않으므로 경기 수에서 제외
+        match_ids = [match_id for match_id in match_ids if es.find_match_path(args.event_store, match_id) is not None]
+
+    start = time.perf_counter()
+    graphs = season_pass_graphs(match_ids, args.event_store, args.events, completed_only=not args.all_passes)
+    if args.team:
+        graphs = {team: graph for team, graph in graphs.items() if team in args.team}
+    table = metrics_table(graphs)
+    elapsed = time.perf_counter() - start
+
+    se.save_results(table, args.out)
+    print(f"{len(match_ids)}개 경기, {len(graphs)}개 팀 패스 네트워크 ({elapsed:.2f}초): {args.out}")
+
+    if args.figures is not None:
+        br.use_headless_backend()
+        for team_name, graph in graphs.items():
+            name = "pass_graph_" + "".join(c if c.isalnum() else "_" for c in team_name)
+            br.save_figure(draw_pass_graph(graph, show=False), args.figures, name, args.format)
+
+
+if __name__ == "__main__":
+    main()
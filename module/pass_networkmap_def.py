@@ -1,121 +1,54 @@
-import json
 import matplotlib.pyplot as plt
 from collections import Counter, defaultdict
 
-# def draw_soccer_field(ax, field_dimen=(120, 80), show_sides = True):
-def draw_soccer_field(ax, side, field_dimen=(120, 80)):
+import module.event_model as em
+from module.event_model import load_event_records
+from module.lineup_registry import match_lineup
+from module.pitch import draw_soccer_field
 
-    """
-    축구 필드 그리기
-
-    매개변수:
-    - ax (matplotlib.axes): 필드를 그릴 matplotlib 축
-    - field_dimen (tuple): 필드의 크기 (길이, 너비)
-
-    반환값:
-    - ax (matplotlib.axes): 축구 필드가 그려진 matplotlib 축
-    """
-    field_length, field_width = field_dimen
-
-    # 필드 외곽선
-    ax.plot([0, 0, field_length, field_length, 0], [0, field_width, field_width, 0, 0], color="black")
-
-    # 홈/어웨이 진영 배경색 표시
-    if side == 'home':
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-    elif side == 'away':
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-
-    # 센터 라인
-    ax.plot([field_length / 2, field_length / 2], [0, field_width], color="black")
-
-    # 센터 서클
-    center_circle = plt.Circle((field_length / 2, field_width / 2), 9.15, color="black", fill=False)
-    ax.add_patch(center_circle)
-    ax.scatter(field_length / 2, field_width / 2, color="black", s=20)  # 센터 스팟
-
-    # 페널티 구역
-    ax.plot([0, 16.5, 16.5, 0], [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-                                  (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-    ax.plot([field_length, field_length - 16.5, field_length - 16.5, field_length],
-            [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-             (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-
-    # 골키퍼 구역
-    ax.plot([0, 5.5, 5.5, 0], [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-                                (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-    ax.plot([field_length, field_length - 5.5, field_length - 5.5, field_length],
-            [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-             (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-
-    # 골대
-    ax.plot([0, -2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([0, -2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-
-    ax.set_xlim(-5, field_length + 5)
-    ax.set_ylim(-5, field_width + 5)
-    ax.set_aspect("equal", adjustable="box")
-    return ax
-
-def draw_pass_network(events_file_path, lineup_file_path, side):
+def draw_pass_network(events_file_path, lineup_file_path, side, show=True):
     """
     홈팀 또는 원정팀의 선발 명단(Starting XI)에 대해 패스 네트워크를 시각화
 
     매개변수:
-    - events_file_path (str): 경기 이벤트 데이터를 포함한 JSON 파일 경로
-    - lineup_file_path (str): 라인업 데이터를 포함한 JSON 파일 경로
+    - events_file_path (str | list): 경기 이벤트 JSON 파일 경로, 파싱된 이벤트 리스트
+                                     또는 Event 레코드 리스트 (ex. event_store.load_match_records 결과)
+    - lineup_file_path (str | list | MatchLineup): 라인업 데이터를 포함한 JSON 파일 경로, 파싱된 라인업 리스트
+                                                 또는 lineup_registry.MatchLineup
     - side (str): "home" 또는 "away"를 지정해 특정 팀 선택
+    - show (bool): True이면 plt.show()로 화면에 출력 (False이면 출력하지 않고 Figure만 반환)
 
     반환값:
-    - None: 패스 네트워크 맵을 화면에 출력
+    - matplotlib.figure.Figure: 패스 네트워크 맵 Figure
     """
 
     # 데이터 로드
-    with open(events_file_path, 'r', encoding='utf-8') as f:
-        events_data = json.load(f)
-    with open(lineup_file_path, 'r', encoding='utf-8') as f:
-        lineup_data = json.load(f)
-
-    # 팀과 선발 명단 확인
-    if side == 'home':
-        lineup_info = lineup_data[0]
-    else:
-        side == 'away'
-        lineup_info = lineup_data[1]
-    
-    team_name = lineup_info["team_name"]
-    
-    starting_players = []
-    for player in lineup_info['lineup']:
-        if any(position["start_reason"] == "Starting XI" for position in player.get("positions", [])):
-            starting_players.append(player['player_name'])
-    
-    # starting_players = set()
-    # for player in lineup_info['lineup']:
-    #     if any(position["start_reason"] == "Starting XI" for position in player.get("positions", [])):
-    #         starting_players.add(player['player_name'])
+    events_data = load_event_records(events_file_path)
+    lineup = match_lineup(lineup_file_path)
+
+    # 팀과 선발 명단 확인 (선발 선수 ID 집합, 이벤트마다 O(1) 조회)
+    team_name = lineup.team_name(side)
+    starting_ids = lineup.starting_ids[side]
 
     # 선택된 팀과 선수의 패스 필터링
     team_passes = []
     for event in events_data:
-        if event["type"]["name"] == "Pass" and event["team"]["name"] == team_name:
+        if event.type == em.PASS and event.team_name == team_name:
             team_passes.append(event)
     
     # 각 선수의 패스 위치 수집
     player_positions = defaultdict(list)
     pass_counter = Counter()
     for event in team_passes:
-        passer = event["player"]["name"]
-        recipient = event["pass"].get("recipient", {}).get("name")
-        if passer in starting_players:
-            player_positions[passer].append(event["location"])
-        if recipient in starting_players:
-            player_positions[recipient].append(event["pass"]["end_location"])
-        if passer in starting_players and recipient in starting_players:
+        passer = event.player
+        recipient = event.recipient
+        passer_starting = event.player_id in starting_ids
+        recipient_starting = event.recipient_id in starting_ids
+        if passer_starting:
+            player_positions[passer].append(event.location)
+        if recipient_starting:
+            player_positions[recipient].append(event.end_location)
+        if passer_starting and recipient_starting:
             pass_counter[(passer, recipient)] += 1
 
     # 선수별 평균 위치 계산
@@ -158,7 +91,9 @@ def draw_pass_network(events_file_path, lineup_file_path, side):
     ax.legend()
     plt.title(f"{team_name} Pass Network (Starting XI)", fontsize=14)
     plt.axis("off")
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 if __name__ == "__main__":
     draw_pass_network("./data/events/3773457.json",
@@ -0,0 +1,94 @@
+from functools import lru_cache
+
+import numpy as np
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+
+# 필드의 크기 (길이, 너비)
+FIELD_DIMEN = (120, 80)
+
+# 홈/어웨이 진영 배경색
+HOME_COLOR = "lightblue"
+AWAY_COLOR = "lightcoral"
+
+
+@lru_cache(maxsize=None)
+def pitch_segments(field_dimen=FIELD_DIMEN):
+    """
+    필드 라인(외곽선, 센터 라인/서클, 페널티/골키퍼 구역, 골대)의 선분 좌표를 계산하는 함수
+    (필드 크기별로 한 번만 계산하고 재사용)
+
+    매개변수:
+    - field_dimen (tuple): 필드의 크기 (길이, 너비)
+
+    반환값:
+    - tuple: 각 선의 (N, 2) 좌표 배열
+    """
+    field_length, field_width = field_dimen
+    half = field_length / 2
+    penalty_low, penalty_high = (field_width - 40.3) / 2, (field_width + 40.3) / 2
+    six_low, six_high = (field_width - 18.32) / 2, (field_width + 18.32) / 2
+    goal_low, goal_high = (field_width - 7.32) / 2, (field_width + 7.32) / 2
+
+    theta = np.linspace(0, 2 * np.pi, 97)
+    center_circle = np.column_stack(
+        [half + 9.15 * np.cos(theta), field_width / 2 + 9.15 * np.sin(theta)]
+    )
+
+    lines = [
+        # 필드 외곽선
+        [(0, 0), (0, field_width), (field_length, field_width), (field_length, 0), (0, 0)],
+        # 센터 라인
+        [(half, 0), (half, field_width)],
+        # 페널티 구역
+        [(0, penalty_low), (16.5, penalty_low), (16.5, penalty_high), (0, penalty_high)],
+        [(field_length, penalty_low), (field_length - 16.5, penalty_low),
+         (field_length - 16.5, penalty_high), (field_length, penalty_high)],
+        # 골키퍼 구역
+        [(0, six_low), (5.5, six_low), (5.5, six_high), (0, six_high)],
+        [(field_length, six_low), (field_length - 5.5, six_low),
+         (field_length - 5.5, six_high), (field_length, six_high)],
+        # 골대
+        [(0, goal_low), (-2, goal_low)],
+        [(0, goal_high), (-2, goal_high)],
+        [(field_length, goal_low), (field_length + 2, goal_low)],
+        [(field_length, goal_high), (field_length + 2, goal_high)],
+    ]
+    segments = tuple(np.asarray(line, dtype=float) for line in lines)
+    return segments + (center_circle,)
+
+
+def draw_soccer_field(ax, side=None, field_dimen=FIELD_DIMEN):
+    """
+    축구 필드 그리기 (모든 맵 모듈이 공유하는 필드 배경)
+    필드 라인 좌표는 필드 크기별로 한 번만 계산해 캐시하고, 그림마다 라인 전체를
+    LineCollection 하나로 추가 (선마다 ax.plot을 호출하지 않으므로 그리는 비용이 작음)
+
+    매개변수:
+    - ax (matplotlib.axes): 필드를 그릴 matplotlib 축
+    - side (str | None): "home" 또는 "away"이면 해당 팀 기준으로 홈/어웨이 진영 배경색 표시
+    - field_dimen (tuple): 필드의 크기 (길이, 너비)
+
+    반환값:
+    - ax (matplotlib.axes): 축구 필드가 그려진 matplotlib 축
+    """
+    field_length, field_width = field_dimen
+    half = field_length / 2
+
+    # 홈/어웨이 진영 배경색 표시 (범례에 쓰이도록 label 지정)
+    if side in ("home", "away"):
+        home_x, away_x = (0, half) if side == "home" else (half, 0)
+        ax.add_patch(plt.Rectangle((home_x, 0), half, field_width, color=HOME_COLOR, alpha=0.2, label="Home Side"))
+        ax.add_patch(plt.Rectangle((away_x, 0), half, field_width, color=AWAY_COLOR, alpha=0.2, label="Away Side"))
+
+    # 필드 라인과 센터 스팟 (데이터 이미지/패치보다 위에 오도록 선과 같은 zorder)
+    ax.add_collection(
+        LineCollection(pitch_segments(field_dimen), colors="black", linewidths=1.5, zorder=2)
+    )
+    ax.add_patch(plt.Circle((half, field_width / 2), 0.5, color="black"))
+
+    ax.set_xlim(-5, field_length + 5)
+    ax.set_ylim(-5, field_width + 5)
+    ax.set_aspect("equal", adjustable="box")
+    return ax
@@ -0,0 +1,358 @@
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+import module.event_store as es
+import module.match_index as mi
+import module.stats_engine as se
+import module.profiling as prof
+
+
+# 점유 구간 분할에 필요한 이벤트 컬럼 (event_store.EVENT_SCHEMA 이름)
+POSSESSION_COLUMNS = [
+    "id",
+    "index",
+    "period",
+    "minute",
+    "second",
+    "type",
+    "possession",
+    "possession_team",
+    "play_pattern",
+    "team",
+    "location_x",
+    "location_y",
+    "duration",
+    "pass_end_x",
+    "pass_end_y",
+    "pass_outcome",
+    "shot_outcome",
+    "shot_key_pass_id",
+]
+
+# 점유 구간 표 컬럼 (PossessionTable.sequences)
+SEQUENCE_COLUMNS = [
+    "match_id",
+    "possession",
+    "team",
+    "period",
+    "play_pattern",
+    "start_time",
+    "duration",
+    "events",
+    "passes",
+    "completed_passes",
+    "shots",
+    "end_event",
+    "start_x",
+    "start_y",
+    "end_x",
+    "end_y",
+    "progression",
+]
+
+# 슛 체인 표 컬럼 (shot_chains)
+CHAIN_COLUMNS = [
+    "match_id",
+    "sequence",
+    "team",
+    "shot_outcome",
+    "shot_x",
+    "shot_y",
+    "key_pass_x",
+    "key_pass_y",
+    "previous_pass_x",
+    "previous_pass_y",
+]
+
+
+class PossessionTable:
+    """
+    경기별 이벤트를 StatsBomb 점유 번호(possession)로 나눈 점유 구간 표
+    events는 (match_id, index) 순서로 정렬된 이벤트 데이터프레임이고,
+    i번째 점유 구간의 이벤트는 events의 offsets[i]:offsets[i + 1] 행
+    (sequences는 점유 구간별 집계, 1행 = 점유 구간 하나)
+    """
+
+    __slots__ = ("events", "offsets", "sequences")
+
+    def __init__(self, events, offsets, sequences):
+        self.events = events
+        self.offsets = offsets
+        self.sequences = sequences
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def lengths(self):
+        # 점유 구간별 이벤트 수
+        return np.diff(self.offsets)
+
+    @property
+    def sequence_codes(self):
+        # 이벤트별 점유 구간 번호 (events 행 순서)
+        return np.repeat(np.arange(len(self)), self.lengths)
+
+    def __repr__(self):
+        return f"PossessionTable(matches={self.events['match_id'].nunique()}, sequences={len(self)}, events={len(self.events)})"
+
+
+def _first(values, starts):
+    # 점유 구간별 첫 값 (구간은 비어 있지 않음)
+    return values[starts]
+
+
+def _last_index(candidates, starts):
+    # 점유 구간별 조건을 만족하는 마지막 행 (없으면 -1)
+    rows = np.where(candidates, np.arange(len(candidates)), -1)
+    return np.maximum.reduceat(rows, starts)
+
+
+def _first_index(candidates, starts, ends):
+    # 점유 구간별 조건을 만족하는 첫 행 (없으면 -1)
+    rows = np.where(candidates, np.arange(len(candidates)), len(candidates))
+    first = np.minimum.reduceat(rows, starts)
+    return np.where(first < ends, first, -1)
+
+
+def _take(values, rows):
+    # rows가 -1인 곳은 nan
+    taken = values[np.maximum(rows, 0)].astype(float)
+    taken[rows < 0] = np.nan
+    return taken
+
+
+@prof.profiled()
+def segment_possessions(frame):
+    """
+    이벤트 데이터프레임(여러 경기 가능)을 점유 구간으로 나누고 구간별 집계를 계산하는 함수
+    (match_id, possession)이 바뀌는 행을 경계로 오프셋 배열을 만들고,
+    집계는 np.add.reduceat / np.maximum.reduceat으로 모든 구간을 한 번에 계산
+
+    매개변수:
+    - frame (pd.DataFrame): POSSESSION_COLUMNS를 포함하는 이벤트 데이터프레임
+      (ex. event_store.load_matches_frame 결과, match_id 컬럼이 없으면 한 경기로 봄)
+
+    반환값:
+    - PossessionTable: 점유 구간 표
+      (duration: 이벤트 duration 합, passes/shots: 점유 팀의 패스/슛 수,
+       end_event: 점유 팀의 마지막 이벤트 종류, start/end: 점유 팀 이벤트의 첫 위치/마지막 위치
+       (패스는 도착 위치), progression: end_x - start_x)
+    """
+    if "match_id" not in frame.columns:
+        frame = frame.assign(match_id=0)
+    events = frame.sort_values(["match_id", "index"], kind="stable", ignore_index=True)
+
+    match_id = events["match_id"].to_numpy(np.int64)
+    possession = events["possession"].fillna(-1).to_numpy(np.int64)
+    n = len(events)
+    if n == 0:
+        return PossessionTable(events, np.zeros(1, dtype=np.int64), pd.DataFrame(columns=SEQUENCE_COLUMNS))
+
+    # 경기 또는 점유 번호가 바뀌는 행이 새 점유 구간의 시작
+    changed = np.ones(n, dtype=bool)
+    changed[1:] = (match_id[1:] != match_id[:-1]) | (possession[1:] != possession[:-1])
+    starts = np.flatnonzero(changed)
+    offsets = np.append(starts, n).astype(np.int64)
+    ends = offsets[1:]
+
+    event_type = events["type"].to_numpy(object)
+    team = events["team"].to_numpy(object)
+    possession_team = events["possession_team"].to_numpy(object)
+    by_team = team == possession_team
+    is_pass = by_team & (event_type == "Pass")
+    is_shot = by_team & (event_type == "Shot")
+    completed = is_pass & events["pass_outcome"].isna().to_numpy()
+
+    x = events["location_x"].to_numpy(float)
+    y = events["location_y"].to_numpy(float)
+    # 패스는 도착 위치까지 진행한 것으로 봄
+    pass_end_x = events["pass_end_x"].to_numpy(float)
+    pass_end_y = events["pass_end_y"].to_numpy(float)
+    end_x = np.where(np.isnan(pass_end_x), x, pass_end_x)
+    end_y = np.where(np.isnan(pass_end_y), y, pass_end_y)
+
+    located = by_team & ~np.isnan(x)
+    first_located = _first_index(located, starts, ends)
+    last_located = _last_index(located, starts)
+    # 점유 팀 이벤트가 없는 구간은 구간의 마지막 이벤트
+    last_event = _last_index(by_team, starts)
+    last_event = np.where(last_event >= 0, last_event, ends - 1)
+
+    # 시간이 비어 있는 행(일부만 채워진 저장소)은 0으로 봄
+    seconds = events["minute"].fillna(0).to_numpy(np.int64) * 60 + events["second"].fillna(0).to_numpy(np.int64)
+    duration = events["duration"].fillna(0.0).to_numpy(float)
+
+    sequences = pd.DataFrame(
+        {
+            "match_id": _first(match_id, starts),
+            "possession": _first(possession, starts),
+            "team": _first(possession_team, starts),
+            "period": _first(events["period"].to_numpy(), starts),
+            "play_pattern": _first(events["play_pattern"].to_numpy(object), starts),
+            "start_time": _first(seconds, starts),
+            "duration": np.add.reduceat(duration, starts),
+            "events": np.diff(offsets),
+            "passes": np.add.reduceat(is_pass.astype(np.int64), starts),
+            "completed_passes": np.add.reduceat(completed.astype(np.int64), starts),
+            "shots": np.add.reduceat(is_shot.astype(np.int64), starts),
+            "end_event": event_type[last_event],
+            "start_x": _take(x, first_located),
+            "start_y": _take(y, first_located),
+            "end_x": _take(end_x, last_located),
+            "end_y": _take(end_y, last_located),
+        }
+    )
+    sequences["progression"] = sequences["end_x"] - sequences["start_x"]
+    return PossessionTable(events, offsets, sequences[SEQUENCE_COLUMNS])
+
+
+def load_possessions(match_ids, store_path=None, folder_path_events=None):
+    """
+    여러 경기의 이벤트를 읽어 점유 구간으로 나누는 함수 (Parquet 저장소에서는 필요한 컬럼만 읽음)
+
+    반환값:
+    - PossessionTable
+    """
+    frame = es.load_matches_frame(match_ids, POSSESSION_COLUMNS, store_path, folder_path_events)
+    return segment_possessions(frame)
+
+
+def possession_share(table):
+    """
+    경기별/팀별 볼 점유율 (점유 구간 duration 합 / 경기 전체 duration 합 * 100,
+    match_table.extract_match_data의 볼 점유율과 같은 값)
+
+    반환값:
+    - pd.DataFrame: match_id, team, possession
+    """
+    sequences = table.sequences
+    by_team = sequences.groupby(["match_id", "team"], sort=False)["duration"].sum()
+    total = sequences.groupby("match_id", sort=False)["duration"].sum()
+    share = by_team / total.reindex(by_team.index.get_level_values("match_id")).to_numpy() * 100
+    return share.rename("possession").reset_index()
+
+
+def team_summary(table):
+    """
+    경기별/팀별 점유 구간 요약 (점유 횟수, 평균 점유 시간, 점유당 패스 수, 슛으로 끝난 점유 비율, 평균 전진 거리)
+
+    반환값:
+    - pd.DataFrame: match_id, team, sequences, mean_duration, passes_per_sequence, shot_share, mean_progression
+    """
+    sequences = table.sequences.assign(ended_in_shot=table.sequences["shots"] > 0)
+    summary = sequences.groupby(["match_id", "team"], sort=False).agg(
+        sequences=("possession", "size"),
+        mean_duration=("duration", "mean"),
+        passes_per_sequence=("passes", "mean"),
+        shot_share=("ended_in_shot", "mean"),
+        mean_progression=("progression", "mean"),
+    )
+    return summary.reset_index()
+
+
+def shot_chains(table):
+    """
+    슛마다 키 패스와 그 직전 패스(같은 점유 구간, 같은 팀)의 위치를 찾는 함수
+    (eventchain_map.get_locations의 슛 -> 키 패스 -> 직전 패스 추적을 모든 경기에 대해 배열 연산으로 처리,
+     직전 패스는 점유 구간을 넘어가지 않음)
+
+    반환값:
+    - pd.DataFrame: CHAIN_COLUMNS 형식 (키 패스가 있는 슛 1행, 직전 패스가 없으면 nan)
+    """
+    events = table.events
+    n = len(events)
+    if n == 0:
+        return pd.DataFrame(columns=CHAIN_COLUMNS)
+
+    event_type = events["type"].to_numpy(object)
+    team = events["team"].to_numpy(object)
+    x = events["location_x"].to_numpy(float)
+    y = events["location_y"].to_numpy(float)
+    codes = table.sequence_codes
+    rows = np.arange(n)
+
+    # 키 패스 id -> 행 번호 (경기마다 id가 다르므로 전체에서 한 번에 조회)
+    key_pass_id = events["shot_key_pass_id"].to_numpy(object)
+    shots = np.flatnonzero((event_type == "Shot") & pd.notna(key_pass_id))
+    key_rows = pd.Index(events["id"].to_numpy(object)).get_indexer(key_pass_id[shots])
+    found = key_rows >= 0
+    shots, key_rows = shots[found], key_rows[found]
+
+    # 행마다 그 행 이전(자기 자신 제외)에 나온 가장 가까운 패스 행 (팀별로 누적 최대값)
+    previous = np.full(n, -1)
+    is_pass = event_type == "Pass"
+    for team_name in pd.unique(team[is_pass]):
+        team_pass = np.where(is_pass & (team == team_name), rows, -1)
+        latest = np.maximum.accumulate(team_pass)
+        before = np.concatenate([[-1], latest[:-1]])
+        mine = team == team_name
+        previous[mine] = before[mine]
+
+    previous_rows = previous[key_rows]
+    same_sequence = (previous_rows >= 0) & (codes[np.maximum(previous_rows, 0)] == codes[key_rows])
+    previous_rows = np.where(same_sequence, previous_rows, -1)
+
+    return pd.DataFrame(
+        {
+            "match_id": events["match_id"].to_numpy(np.int64)[shots],
+            "sequence": codes[shots],
+            "team": team[shots],
+            "shot_outcome": events["shot_outcome"].to_numpy(object)[shots],
+            "shot_x": x[shots],
+            "shot_y": y[shots],
+            "key_pass_x": x[key_rows],
+            "key_pass_y": y[key_rows],
+            "previous_pass_x": _take(x, previous_rows),
+            "previous_pass_y": _take(y, previous_rows),
+        }
+    )[CHAIN_COLUMNS]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경기 이벤트를 점유 구간으로 나누고 점유 구간별 집계 저장")
+    parser.add_argument("--season", action="append", default=None, help="시즌 이름 (여러 번 지정 가능)")
+    parser.add_argument("--team", action="append", default=None, help="팀 이름 (여러 번 지정 가능)")
+    parser.add_argument("--matches", default="./Laliga_10_21", help="경기 정보 JSON 폴더")
+    parser.add_argument("--events", default="./data/events", help="이벤트 JSON 폴더")
+    parser.add_argument("--event-store", default=None, help="이벤트 Parquet 저장소 경로 (지정 시 필요한 컬럼만 읽음)")
+    parser.add_argument("--out", default="possessions.parquet", help="점유 구간 표 CSV/Parquet 저장 경로")
+    parser.add_argument("--summary", default=None, help="경기별/팀별 점유 요약 CSV/Parquet 저장 경로")
+    parser.add_argument("--share", default=None, help="경기별/팀별 볼 점유율 CSV/Parquet 저장 경로")
+    parser.add_argument("--chains", default=None, help="슛 체인 표 CSV/Parquet 저장 경로")
+    args = parser.parse_args()
+
+    index = mi.get_match_index(args.matches, args.events)
+    selected = mi.filter_matches(
+        index,
+        seasons=args.season,
+        teams=args.team,
+        has_events=None if args.event_store else True,
+    )
+    match_ids = selected["match_id"].tolist()
+    if args.event_store is not None:
+        # 저장소에 없는 경기는 읽지 않으므로 경기 수에서 제외
+        match_ids = [match_id for match_id in match_ids if es.find_match_path(args.event_store, match_id) is not None]
+
+    start = time.perf_counter()
+    table = load_possessions(match_ids, args.event_store, args.events)
+    elapsed = time.perf_counter() - start
+
+    se.save_results(table.sequences, args.out)
+    print(f"{len(match_ids)}개 경기, {len(table)}개 점유 구간 ({elapsed:.2f}초): {args.out}")
+    if args.summary is not None:
+        se.save_results(team_summary(table), args.summary)
+        print(f"점유 요약 저장: {args.summary}")
+    if args.share is not None:
+        se.save_results(possession_share(table), args.share)
+        print(f"볼 점유율 저장: {args.share}")
+    if args.chains is not None:
+        se.save_results(shot_chains(table), args.chains)
+        print(f"슛 체인 저장: {args.chains}")
+
+
+if __name__ == "__main__":
+    main()
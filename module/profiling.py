@@ -0,0 +1,206 @@
+import io
+import json
+import time
+import pstats
+import cProfile
+import functools
+
+
+# 프로파일링 활성화 여부 (비활성화 상태에서는 stage/profiled가 거의 비용 없이 통과)
+_enabled = False
+
+# 단계 이름 -> [호출 수, 경과 시간(초), 읽은 바이트 수, 이벤트 수]
+_stats = {}
+
+CALLS, WALL_TIME, BYTES_READ, EVENTS = range(4)
+
+
+def enable(on=True):
+    """
+    단계별 계측을 켜거나 끄는 함수
+    """
+    global _enabled
+    _enabled = on
+
+
+def is_enabled():
+    return _enabled
+
+
+def reset():
+    """
+    지금까지 기록한 단계별 통계를 지우는 함수
+    """
+    _stats.clear()
+
+
+def _entry(name):
+    entry = _stats.get(name)
+    if entry is None:
+        entry = _stats[name] = [0, 0.0, 0, 0]
+    return entry
+
+
+def add(name, calls=0, wall_time=0.0, bytes_read=0, events=0):
+    """
+    단계 통계에 값을 더하는 함수 (시간 측정 없이 바이트 수/이벤트 수만 기록할 때도 사용)
+    """
+    if not _enabled:
+        return
+    entry = _entry(name)
+    entry[CALLS] += calls
+    entry[WALL_TIME] += wall_time
+    entry[BYTES_READ] += bytes_read
+    entry[EVENTS] += events
+
+
+class stage:
+    """
+    with 블록의 경과 시간과 호출 수를 단계 이름으로 기록하는 컨텍스트 매니저
+    블록 안에서 bytes_read, events 속성에 값을 더하면 함께 기록됨
+
+    사용 예:
+        with profiling.stage("load_events") as s:
+            events = load_events(path)
+            s.events += len(events)
+    """
+
+    __slots__ = ("name", "bytes_read", "events", "_start")
+
+    def __init__(self, name, bytes_read=0, events=0):
+        self.name = name
+        self.bytes_read = bytes_read
+        self.events = events
+        self._start = None
+
+    def __enter__(self):
+        if _enabled:
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self._start is not None:
+            add(self.name, 1, time.perf_counter() - self._start, self.bytes_read, self.events)
+        return False
+
+
+def profiled(name=None):
+    """
+    함수 호출의 경과 시간과 호출 수를 기록하는 데코레이터
+    첫 번째 인자가 이벤트 리스트이면 그 길이를 이벤트 수로 기록
+
+    매개변수:
+    - name (str | None): 단계 이름 (None이면 "모듈.함수" 이름 사용)
+    """
+    def decorator(func):
+        stage_name = name or f"{func.__module__.rsplit('.', 1)[-1]}.{func.__name__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            events = len(args[0]) if args and isinstance(args[0], list) else 0
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                add(stage_name, 1, time.perf_counter() - start, 0, events)
+
+        return wrapper
+
+    return decorator
+
+
+def snapshot():
+    """
+    현재까지 기록한 단계별 통계를 딕셔너리로 반환하는 함수
+
+    반환값:
+    - dict: {단계 이름: {"calls", "wall_time", "bytes_read", "events"}}
+    """
+    return {
+        name: {
+            "calls": entry[CALLS],
+            "wall_time": entry[WALL_TIME],
+            "bytes_read": entry[BYTES_READ],
+            "events": entry[EVENTS],
+        }
+        for name, entry in _stats.items()
+    }
+
+
+def merge(other):
+    """
+    다른 프로세스에서 기록한 통계(snapshot 결과)를 현재 통계에 합치는 함수
+    """
+    for name, values in other.items():
+        add(name, values["calls"], values["wall_time"], values["bytes_read"], values["events"])
+
+
+def call_collecting(func, *args, **kwargs):
+    """
+    워커 프로세스에서 계측을 켠 채 함수를 실행하고, 결과와 그 호출의 통계를 함께 반환하는 함수
+    (부모 프로세스는 merge로 통계를 합침)
+
+    반환값:
+    - tuple: (함수 결과, snapshot 결과)
+    """
+    enable(True)
+    reset()
+    result = func(*args, **kwargs)
+    return result, snapshot()
+
+
+def summary_table(stats=None):
+    """
+    단계별 통계를 표 형식 문자열로 만드는 함수 (경과 시간이 긴 순서)
+    """
+    stats = snapshot() if stats is None else stats
+    lines = [
+        f"{'stage':<36}{'calls':>8}{'total s':>10}{'ms/call':>10}{'MiB read':>10}{'events':>11}",
+        "-" * 85,
+    ]
+    for name, values in sorted(stats.items(), key=lambda item: -item[1]["wall_time"]):
+        calls = values["calls"]
+        per_call = values["wall_time"] / calls * 1000 if calls else 0.0
+        lines.append(
+            f"{name:<36}{calls:>8}{values['wall_time']:>10.3f}{per_call:>10.2f}"
+            f"{values['bytes_read'] / 2**20:>10.1f}{values['events']:>11}"
+        )
+    return "\n".join(lines)
+
+
+def print_summary():
+    print(summary_table())
+
+
+def dump_json(path):
+    """
+    단계별 통계를 JSON 파일로 저장하는 함수
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"stages": snapshot()}, f, indent=2)
+
+
+def profile_call(func, *args, output_path=None, sort="cumulative", limit=30, **kwargs):
+    """
+    함수 한 번의 실행을 cProfile로 프로파일링하는 함수 (ex. 한 경기 처리)
+
+    매개변수:
+    - func (callable): 프로파일링할 함수
+    - output_path (str | None): 지정하면 pstats 파일(.prof)로 저장 (snakeviz 등으로 확인)
+    - sort (str): 출력 정렬 기준
+    - limit (int): 출력할 함수 수
+
+    반환값:
+    - object: 함수 결과
+    - str: 상위 limit개 함수의 프로파일 통계 문자열
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    if output_path is not None:
+        profiler.dump_stats(output_path)
+
+    stream = io.StringIO()
+    pstats.Stats(profiler, stream=stream).sort_stats(sort).print_stats(limit)
+    return result, stream.getvalue()
@@ -0,0 +1,175 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
+
+from module.aggregates import METRICS
+from module.stats_engine import bootstrap_means
+
+
+# 재표본을 나누어 처리하는 단위 (청크마다 독립된 난수 스트림을 사용하므로
+# 워커 수와 관계없이 같은 시드면 같은 결과)
+DEFAULT_CHUNK_SIZE = 1000
+
+# 모든 부호 조합을 한 번에 만드는 최대 개수 (2^n이 이 값 이하이면 정확한 순열 검정)
+MAX_EXACT_PERMUTATIONS = 1 << 16
+
+RESULT_COLUMNS = [
+    "metric",
+    "n",
+    "mean_diff",
+    "permutation_p",
+    "permutation_exact",
+    "bootstrap_p",
+    "ci_low",
+    "ci_high",
+]
+
+
+def paired_differences(values, metrics=METRICS):
+    """
+    같은 경기의 승리팀 - 패배팀 지표 차이 행렬을 만드는 함수
+
+    매개변수:
+    - values (dict): {"winner"/"loser": {지표: 경기별 값 리스트}} (aggregates.aggregate_matches 결과)
+    - metrics (list): 지표 목록
+
+    반환값:
+    - np.ndarray: (경기 수, 지표 수) 차이 행렬
+    """
+    winner = np.column_stack([np.asarray(values["winner"][m], dtype=float) for m in metrics])
+    loser = np.column_stack([np.asarray(values["loser"][m], dtype=float) for m in metrics])
+    return winner - loser
+
+
+def _chunk_sizes(n_resamples, chunk_size):
+    return [min(chunk_size, n_resamples - start) for start in range(0, n_resamples, chunk_size)]
+
+
+def _map_chunks(func, seeds, sizes, workers):
+    # 청크별 (시드, 재표본 수)를 직렬 또는 프로세스 풀에서 처리 (결과 순서는 청크 순서)
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers == 1 or len(sizes) == 1:
+        return list(map(func, seeds, sizes))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, seeds, sizes))
+
+
+def _sign_flip_exceedances(seed, size, diffs, observed):
+    # 승/패 라벨을 경기마다 무작위로 바꾸는 것은 차이의 부호를 뒤집는 것과 같음
+    rng = np.random.default_rng(seed)
+    signs = rng.integers(0, 2, size=(size, len(diffs)), dtype=np.int8) * 2 - 1
+    statistics = signs @ diffs / len(diffs)
+    return _count_extreme(statistics, observed)
+
+
+def _count_extreme(statistics, observed):
+    # 양측 검정: |통계량| >= |관측값| (부동소수점 오차 허용)
+    threshold = np.abs(observed) * (1 - 1e-12)
+    return (np.abs(statistics) >= threshold).sum(axis=0)
+
+
+def _bootstrap_chunk(seed, size, diffs):
+    return bootstrap_means(diffs, size, np.random.default_rng(seed))
+
+
+def permutation_test(diffs, n_resamples=10000, seed=0, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    대응 표본 순열 검정 (경기마다 승/패 라벨을 바꾸는 부호 뒤집기, 통계량: 평균 차이)
+    경기 수가 적어 모든 부호 조합(2^n)이 MAX_EXACT_PERMUTATIONS 이하이면 전부 계산한 정확한 p-value,
+    아니면 n_resamples개 무작위 조합으로 계산한 p-value ((초과 수 + 1) / (재표본 수 + 1))
+
+    매개변수:
+    - diffs (np.ndarray): (경기 수, 지표 수) 승리팀 - 패배팀 차이 행렬
+    - n_resamples (int): 무작위 부호 조합 수
+    - seed (int): 난수 시드
+    - workers (int): 워커 프로세스 수 (1이면 직렬, 0 이하면 CPU 코어 수)
+    - chunk_size (int): 청크당 재표본 수
+
+    반환값:
+    - np.ndarray: 지표별 양측 p-value
+    - bool: 정확한 순열 검정 여부
+    """
+    diffs = np.asarray(diffs, dtype=float)
+    n = len(diffs)
+    observed = diffs.mean(axis=0)
+
+    if 2**n <= MAX_EXACT_PERMUTATIONS:
+        # 0 ~ 2^n - 1의 비트로 모든 부호 조합을 만듦
+        bits = (np.arange(2**n)[:, None] >> np.arange(n)) & 1
+        signs = (1 - 2 * bits).astype(np.int8)
+        statistics = signs @ diffs / n
+        return _count_extreme(statistics, observed) / len(signs), True
+
+    sizes = _chunk_sizes(n_resamples, chunk_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    func = partial(_sign_flip_exceedances, diffs=diffs, observed=observed)
+    exceedances = sum(_map_chunks(func, seeds, sizes, workers))
+    return (exceedances + 1) / (n_resamples + 1), False
+
+
+def paired_bootstrap(diffs, n_resamples=10000, ci=0.95, seed=0, workers=1, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    대응 표본 부트스트랩 (경기 단위로 복원 추출해 승리팀 - 패배팀 평균 차이의 분포를 구함)
+
+    매개변수:
+    - diffs (np.ndarray): (경기 수, 지표 수) 승리팀 - 패배팀 차이 행렬
+    - n_resamples (int): 재표본 수
+    - ci (float): 신뢰수준
+    - seed (int): 난수 시드
+    - workers (int): 워커 프로세스 수 (1이면 직렬, 0 이하면 CPU 코어 수)
+    - chunk_size (int): 청크당 재표본 수
+
+    반환값:
+    - np.ndarray: 지표별 양측 p-value (평균을 0으로 옮긴 부트스트랩 분포 기준)
+    - np.ndarray: 신뢰구간 하한
+    - np.ndarray: 신뢰구간 상한
+    """
+    diffs = np.asarray(diffs, dtype=float)
+    observed = diffs.mean(axis=0)
+
+    sizes = _chunk_sizes(n_resamples, chunk_size)
+    seeds = np.random.SeedSequence([seed, 1]).spawn(len(sizes))
+    func = partial(_bootstrap_chunk, diffs=diffs)
+    means = np.concatenate(_map_chunks(func, seeds, sizes, workers))
+
+    alpha = (1 - ci) / 2
+    low, high = np.quantile(means, [alpha, 1 - alpha], axis=0)
+    p_value = (_count_extreme(means - observed, observed) + 1) / (n_resamples + 1)
+    return p_value, low, high
+
+
+def resampling_table(values, metrics=METRICS, n_resamples=10000, ci=0.95, seed=0, workers=1):
+    """
+    모든 지표의 대응 표본 순열 검정/부트스트랩 결과 표를 만드는 함수
+
+    매개변수:
+    - values (dict): {"winner"/"loser": {지표: 경기별 값 리스트}}
+    - metrics (list): 지표 목록
+    - n_resamples (int): 재표본 수
+    - ci (float): 부트스트랩 신뢰수준
+    - seed (int): 난수 시드
+    - workers (int): 워커 프로세스 수
+
+    반환값:
+    - pd.DataFrame: RESULT_COLUMNS 형식의 결과 표 (지표 1행)
+    """
+    metrics = list(metrics)
+    diffs = paired_differences(values, metrics)
+    permutation_p, exact = permutation_test(diffs, n_resamples, seed, workers)
+    bootstrap_p, ci_low, ci_high = paired_bootstrap(diffs, n_resamples, ci, seed, workers)
+    return pd.DataFrame(
+        {
+            "metric": metrics,
+            "n": len(diffs),
+            "mean_diff": diffs.mean(axis=0),
+            "permutation_p": permutation_p,
+            "permutation_exact": exact,
+            "bootstrap_p": bootstrap_p,
+            "ci_low": ci_low,
+            "ci_high": ci_high,
+        }
+    )[RESULT_COLUMNS]
@@ -1,95 +1,34 @@
-import json
 import matplotlib.pyplot as plt
 
-def draw_soccer_field(ax, side, field_dimen=(120, 80)):
-    """
-    축구 필드 그리기
-
-    매개변수:
-    - ax (matplotlib.axes): 필드를 그릴 matplotlib 축
-    - field_dimen (tuple): 필드의 크기 (길이, 너비)
-
-    반환값:
-    - ax (matplotlib.axes): 축구 필드가 그려진 matplotlib 축
-    """
-    field_length, field_width = field_dimen
-
-    # 필드 외곽선
-    ax.plot([0, 0, field_length, field_length, 0], [0, field_width, field_width, 0, 0], color="black")
-
-    # 홈/어웨이 진영 배경색 표시
-    # 홈/어웨이 진영 배경색 표시
-    if side == 'home':
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-    elif side == 'away':
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
+import module.event_model as em
+from module.event_model import load_event_records
+from module.lineup_registry import match_lineup
+from module.pitch import draw_soccer_field
 
-    # 센터 라인
-    ax.plot([field_length / 2, field_length / 2], [0, field_width], color="black")
-
-    # 센터 서클
-    center_circle = plt.Circle((field_length / 2, field_width / 2), 9.15, color="black", fill=False)
-    ax.add_patch(center_circle)
-    ax.scatter(field_length / 2, field_width / 2, color="black", s=20)  # 센터 스팟
-
-    # 페널티 구역
-    ax.plot([0, 16.5, 16.5, 0], [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-                                  (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-    ax.plot([field_length, field_length - 16.5, field_length - 16.5, field_length],
-            [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-             (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-
-    # 골키퍼 구역
-    ax.plot([0, 5.5, 5.5, 0], [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-                                (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-    ax.plot([field_length, field_length - 5.5, field_length - 5.5, field_length],
-            [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-             (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-
-    # 골대
-    ax.plot([0, -2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([0, -2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-
-    ax.set_xlim(-5, field_length + 5)
-    ax.set_ylim(-5, field_width + 5)
-    ax.set_aspect("equal", adjustable="box")
-    return ax
-
-def draw_shot_map(events_file_path, lineup_file_path, side="home"):
+def draw_shot_map(events_file_path, lineup_file_path, side="home", show=True):
     """
     홈팀 또는 원정팀의 슛 위치를 시각화
     슛을 득점, 유효 슛(막힘, 골대 맞음), 비유효 슛으로 구분
 
     매개변수:
-    - events_file_path (str): 경기 이벤트 데이터를 포함한 JSON 파일 경로
+    - events_file_path (str | list): 경기 이벤트 JSON 파일 경로, 파싱된 이벤트 리스트
+                                     또는 Event 레코드 리스트 (ex. event_store.load_match_records 결과)
+    - lineup_file_path (str | list | MatchLineup): 라인업 JSON 파일 경로, 파싱된 라인업 리스트 또는 MatchLineup
     - side (str): "home" 또는 "away"를 지정해 특정 팀 선택
+    - show (bool): True이면 plt.show()로 화면에 출력 (False이면 출력하지 않고 Figure만 반환)
 
     반환값:
-    - None: 슛 맵을 화면에 출력
+    - matplotlib.figure.Figure: 슛 맵 Figure
     """
     
     # 데이터 로드
-    with open(events_file_path, 'r', encoding='utf-8') as f:
-        events_data = json.load(f)
-    with open(lineup_file_path, 'r', encoding='utf-8') as f:
-        lineup_data = json.load(f)
-
-    # 팀과 선발 명단 확인
-    if side == 'home':
-        lineup_info = lineup_data[0]
-    else:
-        side == 'away'
-        lineup_info = lineup_data[1]
-    
-    side_team = lineup_info["team_name"]
+    events_data = load_event_records(events_file_path)
+    # 팀 확인 (라인업 파일은 lineup_registry에서 경기당 한 번만 파싱)
+    side_team = match_lineup(lineup_file_path).team_name(side)
 
     team_shots =[]
     for event in events_data:
-        if event["type"]["name"] == "Shot" and event["team"]["name"] == side_team:
+        if event.type == em.SHOT and event.team_name == side_team:
             team_shots.append(event)
     
 
@@ -97,8 +36,8 @@ def draw_shot_map(events_file_path, lineup_file_path, side="home"):
     shot_locations = []
     shot_outcomes = []
     for shot in team_shots:
-        shot_locations.append(shot['location'])
-        shot_outcomes.append(shot['shot']['outcome']['name'])
+        shot_locations.append(shot.location)
+        shot_outcomes.append(shot.outcome_name)
 
     shot_categories = []  # 카테고리: "Goal", "On Target", "Off Target"
     for outcome in shot_outcomes:
@@ -127,7 +66,9 @@ def draw_shot_map(events_file_path, lineup_file_path, side="home"):
     ax.legend()
     plt.title(f"{side_team} Shot Map", fontsize=14)
     plt.axis("off")
-    plt.show()
+    if show:
+        plt.show()
+    return fig
 
 if __name__ == "__main__":
     draw_shot_map("./data/events/3773457.json",
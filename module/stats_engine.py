@@ -0,0 +1,272 @@
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from module.aggregates import METRICS
+
+
+# 결과 표 컬럼 순서
+RESULT_COLUMNS = [
+    "grouping",
+    "group",
+    "metric",
+    "n_a",
+    "n_b",
+    "mean_a",
+    "mean_b",
+    "mean_diff",
+    "t_stat",
+    "df",
+    "p_value",
+    "cohen_d",
+    "hedges_g",
+    "ci_low",
+    "ci_high",
+]
+
+# 기본 그룹화 (None: 전체 경기)
+DEFAULT_GROUPINGS = [None, ["season_name"], ["team"], ["side"]]
+
+# 부트스트랩 한 번에 만드는 가중치 행렬의 최대 원소 수 (메모리 제한)
+BOOTSTRAP_BLOCK_ELEMENTS = 1 << 22
+
+
+def observation_frame(match_ids, values, match_index):
+    """
+    경기별 승리팀/패배팀 지표를 (경기 x 팀) 1행의 관측 데이터프레임으로 만드는 함수
+
+    매개변수:
+    - match_ids (list): 경기 ID 리스트 (values의 각 리스트와 같은 순서)
+    - values (dict): {"winner"/"loser": {지표: 경기별 값 리스트}} (aggregates.aggregate_matches 결과)
+    - match_index (pd.DataFrame): 경기 인덱스 (시즌, 홈/원정 팀, 결과)
+
+    반환값:
+    - pd.DataFrame: match_id, season_name, outcome(winner/loser), side(home/away), team, opponent
+                    와 지표 컬럼 (승리팀 행 다음에 패배팀 행)
+    """
+    info = match_index.set_index("match_id").loc[list(match_ids)]
+    home_won = (info["result"] == "Home").to_numpy()
+    home = info["home_team_name"].to_numpy(object)
+    away = info["away_team_name"].to_numpy(object)
+
+    frames = []
+    for outcome, is_home in (("winner", home_won), ("loser", ~home_won)):
+        frame = pd.DataFrame(
+            {
+                "match_id": np.asarray(match_ids, dtype=np.int64),
+                "season_name": info["season_name"].to_numpy(object),
+                "outcome": outcome,
+                "side": np.where(is_home, "home", "away"),
+                "team": np.where(is_home, home, away),
+                "opponent": np.where(is_home, away, home),
+            }
+        )
+        for metric, metric_values in values[outcome].items():
+            frame[metric] = np.asarray(metric_values, dtype=float)
+        frames.append(frame)
+    return pd.concat(frames, ignore_index=True)
+
+
+def welch_ttest(mean_a, var_a, n_a, mean_b, var_b, n_b):
+    """
+    요약 통계 배열로 Welch t-test를 한 번에 계산하는 함수 (배열 원소별로 독립된 검정)
+
+    반환값:
+    - tuple: (t-statistic, 자유도, 양측 p-value) 배열
+    """
+    se2_a = var_a / n_a
+    se2_b = var_b / n_b
+    se2 = se2_a + se2_b
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t_stat = (mean_a - mean_b) / np.sqrt(se2)
+        df = se2**2 / (se2_a**2 / (n_a - 1) + se2_b**2 / (n_b - 1))
+    p_value = 2 * stats.t.sf(np.abs(t_stat), df)
+    return t_stat, df, p_value
+
+
+def effect_sizes(mean_a, var_a, n_a, mean_b, var_b, n_b):
+    """
+    Cohen's d (합동 표준편차 기준)와 Hedges' g (소표본 보정)를 계산하는 함수
+
+    반환값:
+    - tuple: (cohen_d, hedges_g) 배열
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pooled = np.sqrt(((n_a - 1) * var_a + (n_b - 1) * var_b) / (n_a + n_b - 2))
+        cohen_d = (mean_a - mean_b) / pooled
+        hedges_g = cohen_d * (1 - 3 / (4 * (n_a + n_b) - 9))
+    return cohen_d, hedges_g
+
+
+def bootstrap_mean_diff(data_a, data_b, n_boot=1000, ci=0.95, rng=None):
+    """
+    두 그룹 평균 차이의 부트스트랩 백분위 신뢰구간을 모든 지표에 대해 한 번에 계산하는 함수
+    재표본 인덱스를 관측별 선택 횟수 행렬(재표본 x 관측)로 바꾼 뒤
+    행렬 곱 한 번으로 모든 재표본/지표의 평균을 구함
+
+    매개변수:
+    - data_a (np.ndarray): 그룹 A 관측값 (관측 수, 지표 수)
+    - data_b (np.ndarray): 그룹 B 관측값 (관측 수, 지표 수)
+    - n_boot (int): 재표본 수
+    - ci (float): 신뢰수준
+    - rng (np.random.Generator | None): 난수 생성기
+
+    반환값:
+    - tuple: (하한, 상한) 배열 (지표 수,)
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    diffs = bootstrap_means(data_a, n_boot, rng) - bootstrap_means(data_b, n_boot, rng)
+    alpha = (1 - ci) / 2
+    low, high = np.quantile(diffs, [alpha, 1 - alpha], axis=0)
+    return low, high
+
+
+def bootstrap_means(data, n_boot, rng):
+    """
+    관측 행(data의 행)을 복원 추출한 재표본의 지표별 평균을 계산하는 함수
+
+    매개변수:
+    - data (np.ndarray): 관측값 (관측 수, 지표 수)
+    - n_boot (int): 재표본 수
+    - rng (np.random.Generator): 난수 생성기
+
+    반환값:
+    - np.ndarray: (재표본 수, 지표 수) 평균 행렬
+    """
+    n = len(data)
+    if n == 0:
+        return np.full((n_boot, data.shape[1]), np.nan)
+
+    # 가중치 행렬이 너무 커지지 않도록 재표본을 블록 단위로 나눠 계산
+    block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // n)
+    means = np.empty((n_boot, data.shape[1]))
+    for start in range(0, n_boot, block):
+        size = min(block, n_boot - start)
+        # 재표본별 인덱스에 (재표본 번호 * n)을 더해 bincount 한 번으로 선택 횟수를 셈
+        index = rng.integers(0, n, size=(size, n)) + (np.arange(size) * n)[:, None]
+        counts = np.bincount(index.ravel(), minlength=size * n).reshape(size, n)
+        means[start:start + size] = counts @ data / n
+    return means
+
+
+def compare_groups(
+    frame,
+    metrics=METRICS,
+    by=None,
+    contrast="outcome",
+    levels=("winner", "loser"),
+    n_boot=1000,
+    ci=0.95,
+    seed=0,
+):
+    """
+    그룹별로 두 수준(기본: 승리팀 vs 패배팀)의 지표를 비교하는 함수
+    모든 그룹/지표의 평균, 분산, 개수를 groupby 한 번으로 구한 뒤
+    Welch t-test와 효과 크기를 배열 연산으로 계산
+
+    매개변수:
+    - frame (pd.DataFrame): observation_frame 결과 (또는 같은 형식의 관측 데이터프레임)
+    - metrics (list): 비교할 지표 컬럼
+    - by (list | None): 그룹화 컬럼 (ex. ["season_name"], ["team"], ["side"], None이면 전체)
+    - contrast (str): 비교할 두 수준이 들어 있는 컬럼
+    - levels (tuple): (A, B) 수준 이름 (결과의 _a, _b 컬럼)
+    - n_boot (int): 부트스트랩 재표본 수 (0이면 신뢰구간 생략)
+    - ci (float): 신뢰수준
+    - seed (int): 난수 시드 (그룹마다 (seed, 그룹 번호)로 독립된 난수 생성)
+
+    반환값:
+    - pd.DataFrame: RESULT_COLUMNS 형식의 결과 표 (그룹 x 지표 1행)
+    """
+    metrics = list(metrics)
+    level_a, level_b = levels
+    frame = frame[frame[contrast].isin(levels)]
+    grouping = "+".join(by) if by else "all"
+    if not by:
+        # 전체 경기는 값이 하나뿐인 그룹 컬럼으로 처리
+        frame = frame.assign(all="all")
+        by = ["all"]
+    by = list(by)
+
+    grouped = frame.groupby(by + [contrast], sort=True, observed=True)[metrics]
+    summary = grouped.agg(["mean", "var", "count"])
+
+    # 그룹 x (A, B) 요약 통계를 (그룹, 지표) 배열로 정렬
+    summary = summary.unstack(contrast)
+    groups = summary.index
+
+    def column(stat, level):
+        if (metrics[0], stat, level) not in summary.columns:
+            return np.full((len(groups), len(metrics)), np.nan)
+        return summary.xs((stat, level), axis=1, level=[1, 2])[metrics].to_numpy(float)
+
+    mean_a, var_a, n_a = column("mean", level_a), column("var", level_a), column("count", level_a)
+    mean_b, var_b, n_b = column("mean", level_b), column("var", level_b), column("count", level_b)
+    n_a, n_b = np.nan_to_num(n_a), np.nan_to_num(n_b)
+
+    t_stat, df, p_value = welch_ttest(mean_a, var_a, n_a, mean_b, var_b, n_b)
+    cohen_d, hedges_g = effect_sizes(mean_a, var_a, n_a, mean_b, var_b, n_b)
+
+    ci_low = np.full_like(mean_a, np.nan)
+    ci_high = np.full_like(mean_a, np.nan)
+    if n_boot > 0:
+        positions = {group: i for i, group in enumerate(groups)}
+        for key, cell in frame.groupby(by, sort=True, observed=True):
+            i = positions[key[0] if len(by) == 1 else key]
+            rng = np.random.default_rng([seed, i])
+            is_a = (cell[contrast] == level_a).to_numpy()
+            data = cell[metrics].to_numpy(float)
+            ci_low[i], ci_high[i] = bootstrap_mean_diff(data[is_a], data[~is_a], n_boot, ci, rng)
+
+    num_groups, num_metrics = mean_a.shape
+    group_labels = [" / ".join(map(str, g)) if isinstance(g, tuple) else str(g) for g in groups]
+    table = pd.DataFrame(
+        {
+            "grouping": grouping,
+            "group": np.repeat(group_labels, num_metrics),
+            "metric": np.tile(metrics, num_groups),
+            "n_a": n_a.ravel(),
+            "n_b": n_b.ravel(),
+            "mean_a": mean_a.ravel(),
+            "mean_b": mean_b.ravel(),
+            "mean_diff": (mean_a - mean_b).ravel(),
+            "t_stat": t_stat.ravel(),
+            "df": df.ravel(),
+            "p_value": p_value.ravel(),
+            "cohen_d": cohen_d.ravel(),
+            "hedges_g": hedges_g.ravel(),
+            "ci_low": ci_low.ravel(),
+            "ci_high": ci_high.ravel(),
+        }
+    )
+    return table[RESULT_COLUMNS]
+
+
+def run_comparisons(frame, groupings=DEFAULT_GROUPINGS, metrics=METRICS, n_boot=1000, ci=0.95, seed=0):
+    """
+    여러 그룹화 조건에 대해 compare_groups를 실행해 하나의 결과 표로 합치는 함수
+
+    매개변수:
+    - frame (pd.DataFrame): observation_frame 결과
+    - groupings (list): 그룹화 컬럼 리스트의 리스트 (None: 전체)
+
+    반환값:
+    - pd.DataFrame: RESULT_COLUMNS 형식의 결과 표
+    """
+    tables = [
+        compare_groups(frame, metrics, by, n_boot=n_boot, ci=ci, seed=seed)
+        for by in groupings
+    ]
+    return pd.concat(tables, ignore_index=True)
+
+
+def save_results(table, path):
+    """
+    결과 표를 확장자에 따라 CSV 또는 Parquet 파일로 저장하는 함수
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    if path.endswith(".parquet"):
+        table.to_parquet(path, index=False)
+    else:
+        table.to_csv(path, index=False)
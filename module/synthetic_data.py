@@ -0,0 +1,520 @@
+import os
+import json
+import uuid
+import random
+import argparse
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+
+import module.match_index as mi
+
+
+# 필드의 크기 (길이, 너비)
+FIELD_DIMEN = (120, 80)
+
+# 한 팀의 선수 구성 (선발 11명 + 교체 선수)
+STARTERS = 11
+SQUAD_SIZE = 16
+
+PLAY_PATTERNS = ["Regular Play", "From Throw In", "From Goal Kick", "From Free Kick", "From Corner"]
+SHOT_OUTCOMES = ["Goal", "Saved", "Post", "Off T", "Blocked", "Wayward", "Saved Off Target", "Saved to Post"]
+SHOT_OUTCOME_WEIGHTS = [10, 25, 2, 30, 20, 8, 3, 2]
+
+# 복제 경기 ID = 복제 번호 * REPLICA_ID_OFFSET + 원본 match_id (원본 ID와 겹치지 않도록)
+REPLICA_ID_OFFSET = 100_000_000
+
+
+class _EventWriter:
+    """
+    경기 이벤트를 시간 순서대로 만들어 가는 도우미 (index, 시간, 점유 번호 관리)
+    """
+
+    def __init__(self, rng, home, away, n_events):
+        self.rng = rng
+        self.home = home
+        self.away = away
+        self.n_events = n_events
+        self.events = []
+        self.possession = 0
+        self.possession_team = home
+        self.play_pattern = "Regular Play"
+        self.clock = 0.0
+
+    def new_id(self):
+        return str(uuid.UUID(int=self.rng.getrandbits(128), version=4))
+
+    def add(self, type_name, team, player=None, location=None, duration=0.0, **fields):
+        # 전/후반은 이벤트 수의 절반을 기준으로 나눔
+        period = 1 if len(self.events) < self.n_events / 2 else 2
+        self.clock += duration + self.rng.uniform(0.2, 2.0)
+        minute, second = divmod(int(self.clock), 60)
+        event = {
+            "id": self.new_id(),
+            "index": len(self.events) + 1,
+            "period": period,
+            "timestamp": f"00:{minute % 60:02d}:{second:02d}.000",
+            "minute": minute,
+            "second": second,
+            "type": {"name": type_name},
+            "possession": self.possession,
+            "possession_team": {"id": self.possession_team["id"], "name": self.possession_team["name"]},
+            "play_pattern": {"name": self.play_pattern},
+            "team": {"id": team["id"], "name": team["name"]},
+            "duration": round(duration, 3),
+        }
+        if player is not None:
+            event["player"] = {"id": player["id"], "name": player["name"]}
+        if location is not None:
+            event["location"] = location
+        event.update(fields)
+        self.events.append(event)
+        return event
+
+
+def _relate(*events):
+    # StatsBomb의 related_events는 양방향으로 연결
+    for event in events:
+        others = [other["id"] for other in events if other is not event]
+        event.setdefault("related_events", []).extend(others)
+
+
+def _point(rng, x_range=(0, 120), y_range=(0, 80)):
+    return [round(rng.uniform(*x_range), 1), round(rng.uniform(*y_range), 1)]
+
+
+def make_team(team_id, team_name, first_player_id):
+    """
+    합성 팀(선수 명단 포함)을 만드는 함수
+
+    매개변수:
+    - team_id (int): 팀 ID
+    - team_name (str): 팀 이름
+    - first_player_id (int): 첫 선수의 ID (이후 선수는 1씩 증가)
+
+    반환값:
+    - dict: {"id", "name", "players": [{"id", "name", "jersey_number"}, ...]}
+    """
+    players = [
+        {
+            "id": first_player_id + k,
+            "name": f"{team_name} Player {k + 1}",
+            "jersey_number": k + 1,
+        }
+        for k in range(SQUAD_SIZE)
+    ]
+    return {"id": team_id, "name": team_name, "players": players}
+
+
+def generate_lineups(home, away, rng):
+    """
+    StatsBomb 라인업 형식(data/lineups/<id>.json)의 합성 라인업을 만드는 함수
+    선발 11명 중 한 명은 후반에 교체되어 나가고, 교체 선수 한 명이 들어옴
+
+    반환값:
+    - list: [홈팀 라인업, 원정팀 라인업]
+    """
+    lineups = []
+    for team in (home, away):
+        substituted = rng.randrange(1, STARTERS)
+        lineup = []
+        for k, player in enumerate(team["players"]):
+            positions = []
+            if k < STARTERS:
+                off = k == substituted
+                positions.append({
+                    "position_id": k + 1,
+                    "position": "Goalkeeper" if k == 0 else "Outfield",
+                    "from": "00:00",
+                    "to": "65:00" if off else None,
+                    "from_period": 1,
+                    "to_period": 2 if off else None,
+                    "start_reason": "Starting XI",
+                    "end_reason": "Substitution - Off (Tactical)" if off else "Final Whistle",
+                })
+            elif k == STARTERS:
+                positions.append({
+                    "position_id": substituted + 1,
+                    "position": "Outfield",
+                    "from": "65:00",
+                    "to": None,
+                    "from_period": 2,
+                    "to_period": None,
+                    "start_reason": "Substitution - On (Tactical)",
+                    "end_reason": "Final Whistle",
+                })
+            lineup.append({
+                "player_id": player["id"],
+                "player_name": player["name"],
+                "player_nickname": None,
+                "jersey_number": player["jersey_number"],
+                "country": {"id": 214, "name": "Spain"},
+                "cards": [],
+                "positions": positions,
+            })
+        lineups.append({"team_id": team["id"], "team_name": team["name"], "lineup": lineup})
+    return lineups
+
+
+def generate_events(home, away, n_events=3500, rng=None, score=None):
+    """
+    StatsBomb 이벤트 형식(data/events/<id>.json)의 합성 이벤트를 만드는 함수
+    점유(possession) 단위로 패스 -> 볼 받기 -> 드리블(Carry)이 이어지고,
+    점유는 실패한 패스, 듀얼 패배, 드리블 실패, 슛, 파울 중 하나로 끝남
+
+    매개변수:
+    - home (dict): 홈팀 (make_team 결과)
+    - away (dict): 원정팀
+    - n_events (int): 대략적인 이벤트 수
+    - rng (random.Random | None): 난수 생성기
+    - score (tuple | None): (홈 득점, 원정 득점)을 지정하면 득점한 슛 수를 스코어와 맞춤
+
+    반환값:
+    - list: 이벤트 리스트 (첫 두 이벤트는 홈, 원정 순서의 Starting XI)
+    """
+    rng = rng or random.Random(0)
+    writer = _EventWriter(rng, home, away, n_events)
+
+    for team in (home, away):
+        starters = team["players"][:STARTERS]
+        writer.add(
+            "Starting XI",
+            team,
+            tactics={
+                "formation": 433,
+                "lineup": [
+                    {"player": {"id": p["id"], "name": p["name"]}, "jersey_number": p["jersey_number"]}
+                    for p in starters
+                ],
+            },
+        )
+
+    team = home
+    while len(writer.events) < n_events:
+        opponent = away if team is home else home
+        writer.possession += 1
+        writer.possession_team = team
+        writer.play_pattern = rng.choice(PLAY_PATTERNS)
+        _generate_possession(writer, team, opponent)
+        team = opponent
+
+    if score is not None:
+        for team, goals in zip((home, away), score):
+            _set_goals(writer, team, goals)
+
+    return writer.events
+
+
+def _set_goals(writer, team, goals):
+    # 팀의 슛 중 goals개만 골로 바꾸고 나머지 골은 다른 결과로 바꿈
+    rng = writer.rng
+    shots = [e for e in writer.events if e["type"]["name"] == "Shot" and e["team"]["id"] == team["id"]]
+    goal_shots = set(map(id, rng.sample(shots, min(goals, len(shots)))))
+    for shot in shots:
+        if id(shot) in goal_shots:
+            shot["shot"]["outcome"] = {"name": "Goal"}
+        elif shot["shot"]["outcome"]["name"] == "Goal":
+            shot["shot"]["outcome"] = {"name": rng.choices(SHOT_OUTCOMES[1:], SHOT_OUTCOME_WEIGHTS[1:])[0]}
+
+
+def _generate_possession(writer, team, opponent):
+    rng = writer.rng
+    squad = team["players"][:STARTERS + 1]
+    player = rng.choice(squad)
+    location = _point(rng, (5, 70))
+    last_pass = None
+
+    for _ in range(rng.randint(1, 10)):
+        recipient = rng.choice([p for p in squad if p is not player])
+        end_location = _point(rng, (max(0, location[0] - 20), min(120, location[0] + 30)))
+        pass_info = {
+            "recipient": {"id": recipient["id"], "name": recipient["name"]},
+            "length": round(abs(end_location[0] - location[0]), 1),
+            "end_location": end_location,
+        }
+        if writer.play_pattern == "From Corner" and last_pass is None:
+            pass_info["type"] = {"name": "Corner"}
+
+        roll = rng.random()
+        if roll < 0.14:
+            # 실패한 패스 -> 점유 종료
+            del pass_info["recipient"]
+            pass_info["outcome"] = {"name": "Incomplete"}
+            writer.add("Pass", team, player, location, rng.uniform(0.5, 2), **{"pass": pass_info})
+            return
+        if roll < 0.16:
+            pass_info["outcome"] = {"name": "Pass Offside"}
+            writer.add("Pass", team, player, location, rng.uniform(0.5, 2), **{"pass": pass_info})
+            return
+
+        last_pass = writer.add("Pass", team, player, location, rng.uniform(0.5, 2), **{"pass": pass_info})
+        receipt = writer.add("Ball Receipt*", team, recipient, end_location)
+        _relate(last_pass, receipt)
+
+        player = recipient
+        location = end_location
+        if rng.random() < 0.6:
+            carry_end = _point(rng, (location[0], min(120, location[0] + 15)))
+            carry = writer.add(
+                "Carry", team, player, location, rng.uniform(0.5, 4), carry={"end_location": carry_end}
+            )
+            _relate(receipt, carry)
+            location = carry_end
+
+    _end_possession(writer, team, opponent, player, location, last_pass)
+
+
+def _end_possession(writer, team, opponent, player, location, last_pass):
+    rng = writer.rng
+    defender = rng.choice(opponent["players"][:STARTERS])
+    mirrored = [round(120 - location[0], 1), round(80 - location[1], 1)]
+    roll = rng.random()
+
+    if roll < 0.35:
+        # 듀얼 패배 (공을 가진 팀이 짐)
+        lost = writer.add("Duel", team, player, location, duel={
+            "type": {"name": "Tackle"},
+            "outcome": {"name": rng.choice(["Lost In Play", "Lost Out"])},
+        })
+        won = writer.add("Duel", opponent, defender, mirrored, duel={
+            "type": {"name": "Tackle"},
+            "outcome": {"name": rng.choice(["Won", "Success In Play"])},
+        })
+        _relate(lost, won)
+    elif roll < 0.55:
+        # 드리블 실패: 상대 팀 이벤트(Pressure)와 연결된 Carry
+        carry_end = _point(rng, (location[0], min(120, location[0] + 10)))
+        carry = writer.add("Carry", team, player, location, rng.uniform(0.5, 3), carry={"end_location": carry_end})
+        pressure = writer.add("Pressure", opponent, defender, mirrored, rng.uniform(0.2, 1))
+        _relate(carry, pressure)
+        writer.add("Dribble", team, player, carry_end, dribble={"outcome": {"name": "Incomplete"}})
+    elif roll < 0.75:
+        # 슛 (직전 패스가 있으면 키 패스로 연결)
+        shot_location = _point(rng, (88, 118), (18, 62))
+        shot = {
+            "statsbomb_xg": round(rng.uniform(0.01, 0.6), 3),
+            "end_location": [120, round(rng.uniform(30, 50), 1), round(rng.uniform(0, 3), 1)],
+            "outcome": {"name": rng.choices(SHOT_OUTCOMES, SHOT_OUTCOME_WEIGHTS)[0]},
+            "type": {"name": "Open Play"},
+        }
+        if last_pass is not None:
+            shot["key_pass_id"] = last_pass["id"]
+            last_pass["pass"]["shot_assist"] = True
+        writer.add("Shot", team, player, shot_location, rng.uniform(0.5, 1.5), shot=shot)
+    elif roll < 0.85:
+        writer.add("Dribble", team, player, location, dribble={"outcome": {"name": "Complete"}})
+        writer.add("Foul Committed", opponent, defender, mirrored, **_card(rng, "foul_committed"))
+    else:
+        writer.add("Foul Committed", opponent, defender, mirrored, **_card(rng, "foul_committed"))
+
+
+def _card(rng, key):
+    roll = rng.random()
+    if roll < 0.15:
+        return {key: {"card": {"name": "Yellow Card"}}}
+    if roll < 0.16:
+        return {key: {"card": {"name": rng.choice(["Red Card", "Second Yellow"])}}}
+    return {}
+
+
+def generate_match(match_id, home, away, n_events=3500, seed=None, score=None):
+    """
+    한 경기의 합성 이벤트와 라인업을 만드는 함수 (같은 seed면 같은 결과)
+    score (홈 득점, 원정 득점)를 지정하면 골 이벤트 수가 스코어와 일치
+
+    반환값:
+    - list: 이벤트 리스트
+    - list: 라인업 리스트
+    """
+    rng = random.Random(match_id if seed is None else seed)
+    lineups = generate_lineups(home, away, rng)
+    events = generate_events(home, away, n_events, rng, score)
+    return events, lineups
+
+
+def write_match(match_id, events, lineups, folder_path_events, folder_path_lineups):
+    """
+    합성 경기 데이터를 data/events/<id>.json, data/lineups/<id>.json 형식으로 저장하는 함수
+    """
+    os.makedirs(folder_path_events, exist_ok=True)
+    os.makedirs(folder_path_lineups, exist_ok=True)
+    with open(os.path.join(folder_path_events, f"{match_id}.json"), "w", encoding="utf-8") as f:
+        json.dump(events, f, ensure_ascii=False)
+    with open(os.path.join(folder_path_lineups, f"{match_id}.json"), "w", encoding="utf-8") as f:
+        json.dump(lineups, f, ensure_ascii=False)
+
+
+def write_synthetic_matches(folder_path, n_matches, n_events=3500, seed=0):
+    """
+    합성 경기 여러 개를 <folder_path>/events, <folder_path>/lineups에 저장하는 함수
+
+    매개변수:
+    - folder_path (str): 저장 폴더 경로
+    - n_matches (int): 경기 수
+    - n_events (int): 경기당 대략적인 이벤트 수
+    - seed (int): 난수 시드
+
+    반환값:
+    - list: {"match_id", "winner", "loser"} 딕셔너리 리스트 (multi_final.py의 match_results 형식)
+    """
+    teams = [make_team(team_id, f"Team {team_id}", team_id * 100) for team_id in range(1, 21)]
+    rng = random.Random(seed)
+
+    match_results = []
+    for match_id in range(1, n_matches + 1):
+        home, away = rng.sample(teams, 2)
+        events, lineups = generate_match(match_id, home, away, n_events, seed=seed * 1_000_003 + match_id)
+        write_match(
+            match_id,
+            events,
+            lineups,
+            os.path.join(folder_path, "events"),
+            os.path.join(folder_path, "lineups"),
+        )
+        winner = rng.choice(["Home", "Away"])
+        match_results.append({
+            "match_id": match_id,
+            "winner": winner,
+            "loser": "Away" if winner == "Home" else "Home",
+        })
+    return match_results
+
+
+def season_team(team_id, team_name):
+    """
+    경기 정보의 팀 ID로 합성 선수 명단을 만드는 함수
+    (선수 ID가 팀 ID로 정해지므로 같은 팀은 모든 경기에서 같은 선수 명단을 가짐)
+    """
+    return make_team(team_id, team_name, team_id * 100)
+
+
+def _generate_index_match(match, folder_path_events, folder_path_lineups, n_events, overwrite):
+    # 워커 프로세스에서 실행: 경기 하나를 생성해 저장 (이미 있으면 건너뜀)
+    match_id = match["match_id"]
+    events_path = os.path.join(folder_path_events, f"{match_id}.json")
+    if not overwrite and os.path.exists(events_path):
+        return False
+
+    home = season_team(match["home_team_id"], match["home_team_name"])
+    away = season_team(match["away_team_id"], match["away_team_name"])
+    events, lineups = generate_match(
+        match_id, home, away, n_events, score=(match["home_score"], match["away_score"])
+    )
+    write_match(match_id, events, lineups, folder_path_events, folder_path_lineups)
+    return True
+
+
+def replicate_match_files(folder_path_matches, folder_path_out, scale):
+    """
+    경기 정보 JSON(ex. Laliga_10_21/*.json)을 scale배로 복제해 저장하는 함수
+    복제 경기는 REPLICA_ID_OFFSET으로 새 match_id를 받으며 팀/스코어/시즌은 원본과 같음
+
+    반환값:
+    - list: 복제된 경기 정보 딕셔너리 리스트 (원본 포함)
+    """
+    os.makedirs(folder_path_out, exist_ok=True)
+    replicated = []
+    for filename in sorted(os.listdir(folder_path_matches)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(folder_path_matches, filename), "r", encoding="utf-8") as f:
+            matches = json.load(f)
+
+        out = []
+        for replica in range(scale):
+            for match in matches:
+                copy = dict(match)
+                copy["match_id"] = replica * REPLICA_ID_OFFSET + match["match_id"]
+                out.append(copy)
+        with open(os.path.join(folder_path_out, filename), "w", encoding="utf-8") as f:
+            json.dump(out, f, ensure_ascii=False)
+        replicated.extend(out)
+    return replicated
+
+
+def generate_season_data(
+    folder_path_matches,
+    folder_path_out,
+    n_events=3500,
+    scale=1,
+    limit=None,
+    workers=1,
+    chunksize=16,
+    overwrite=False,
+):
+    """
+    경기 정보 JSON 폴더(ex. Laliga_10_21)의 match_id와 일치하는 합성 이벤트/라인업을 만드는 함수
+    <folder_path_out>/events/<id>.json, <folder_path_out>/lineups/<id>.json에 저장하고,
+    scale > 1이면 복제 경기 정보를 <folder_path_out>/matches/에 함께 저장
+    (이미 생성된 경기는 건너뛰므로 중단 후 다시 실행해도 이어서 생성)
+
+    매개변수:
+    - folder_path_matches (str): 경기 정보 JSON 폴더 경로
+    - folder_path_out (str): 저장 폴더 경로 (ex. "./data")
+    - n_events (int): 경기당 대략적인 이벤트 수
+    - scale (int): 경기 수 배율 (10, 100 등, 원본 경기 수 x scale 경기를 생성)
+    - limit (int | None): 생성할 최대 경기 수 (match_id 순)
+    - workers (int): 워커 프로세스 수 (1: 직렬 처리, 0 이하: CPU 코어 수)
+    - chunksize (int): 워커 하나에 한 번에 전달할 경기 수
+    - overwrite (bool): True이면 이미 있는 파일도 다시 생성
+
+    반환값:
+    - int: 새로 생성한 경기 수
+    """
+    if scale > 1:
+        folder_path_matches_out = os.path.join(folder_path_out, "matches")
+        replicate_match_files(folder_path_matches, folder_path_matches_out, scale)
+        folder_path_matches = folder_path_matches_out
+
+    index = mi.build_match_index(folder_path_matches)
+    if limit is not None:
+        index = index.head(limit)
+    columns = ["match_id", "home_team_id", "home_team_name", "away_team_id", "away_team_name", "home_score", "away_score"]
+    matches = [
+        dict(zip(columns, values))
+        for values in index[columns].astype(object).itertuples(index=False, name=None)
+    ]
+
+    generate = partial(
+        _generate_index_match,
+        folder_path_events=os.path.join(folder_path_out, "events"),
+        folder_path_lineups=os.path.join(folder_path_out, "lineups"),
+        n_events=n_events,
+        overwrite=overwrite,
+    )
+
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    if workers == 1:
+        return sum(generate(match) for match in matches)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return sum(executor.map(generate, matches, chunksize=chunksize))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Laliga_10_21 경기 ID와 일치하는 합성 이벤트/라인업 데이터 생성")
+    parser.add_argument("--matches", default="./Laliga_10_21", help="경기 정보 JSON 폴더")
+    parser.add_argument("--out", default="./data", help="저장 폴더 (events/, lineups/ 생성)")
+    parser.add_argument("--events", type=int, default=3500, help="경기당 이벤트 수")
+    parser.add_argument("--scale", type=int, default=1, help="경기 수 배율 (ex. 10, 100)")
+    parser.add_argument("--limit", type=int, default=None, help="생성할 최대 경기 수")
+    parser.add_argument("--workers", type=int, default=1, help="워커 프로세스 수 (0: CPU 코어 수)")
+    parser.add_argument("--overwrite", action="store_true", help="이미 있는 파일도 다시 생성")
+    args = parser.parse_args()
+
+    created = generate_season_data(
+        args.matches,
+        args.out,
+        n_events=args.events,
+        scale=args.scale,
+        limit=args.limit,
+        workers=args.workers,
+        overwrite=args.overwrite,
+    )
+    print(f"{created}개 경기 생성: {args.out}")
+    if args.scale > 1:
+        matches_dir = os.path.join(args.out, "matches")
+        print(f"복제 경기 정보: {matches_dir} (multi_final.py --matches-dir {matches_dir})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,123 +1,95 @@
-import json
 import matplotlib.pyplot as plt
 
-def draw_soccer_field(ax, side, field_dimen=(120, 80)):
+import module.event_model as em
+import module.profiling as prof
+from module.event_model import iter_event_records
+from module.pitch import draw_soccer_field
+
+# 턴오버로 집계하는 듀얼 결과 코드
+LOST_DUEL_OUTCOMES = frozenset([em.LOST_IN_PLAY, em.LOST_OUT])
+
+@prof.profiled()
+def extract_turnovers(events_file_path):
     """
-    축구 필드 그리기
+    홈팀과 어웨이팀의 턴오버 이벤트를 이벤트 리스트 한 번 순회로 함께 추출
+    턴오버를 실패한 패스, 패배한 듀얼, 드리블 실패로 구분
+    (이벤트를 하나씩만 보므로 스트리밍 반복자도 그대로 처리)
 
     매개변수:
-    - ax (matplotlib.axes): 필드를 그릴 matplotlib 축
-    - field_dimen (tuple): 필드의 크기 (길이, 너비)
+    - events_file_path (str | list | iterator): 경기 이벤트 JSON 파일 경로(스트리밍으로 읽음),
+      이벤트 딕셔너리/Event 레코드의 리스트 또는 반복자
 
     반환값:
-    - ax (matplotlib.axes): 축구 필드가 그려진 matplotlib 축
+    - dict: {"home": 홈팀 턴오버, "away": 어웨이팀 턴오버}
+            각 값은 {"team_name", "failed_passes", "lost_duels", "dribble_losts"} 딕셔너리
     """
-    field_length, field_width = field_dimen
-
-    # 필드 외곽선
-    ax.plot([0, 0, field_length, field_length, 0], [0, field_width, field_width, 0, 0], color="black")
-
-    # 홈/어웨이 진영 배경색 표시
-    if side == 'home':
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-    elif side == 'away':
-        ax.add_patch(plt.Rectangle((field_length / 2, 0), field_length / 2, field_width, color="lightblue", alpha=0.2, label="Home Side"))
-        ax.add_patch(plt.Rectangle((0, 0), field_length / 2, field_width, color="lightcoral", alpha=0.2, label="Away Side"))
-
-
-    # 센터 라인
-    ax.plot([field_length / 2, field_length / 2], [0, field_width], color="black")
-
-    # 센터 서클
-    center_circle = plt.Circle((field_length / 2, field_width / 2), 9.15, color="black", fill=False)
-    ax.add_patch(center_circle)
-    ax.scatter(field_length / 2, field_width / 2, color="black", s=20)  # 센터 스팟
-
-    # 페널티 구역
-    ax.plot([0, 16.5, 16.5, 0], [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-                                  (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-    ax.plot([field_length, field_length - 16.5, field_length - 16.5, field_length],
-            [(field_width - 40.3) / 2, (field_width - 40.3) / 2,
-             (field_width + 40.3) / 2, (field_width + 40.3) / 2], color="black")
-
-    # 골키퍼 구역
-    ax.plot([0, 5.5, 5.5, 0], [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-                                (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-    ax.plot([field_length, field_length - 5.5, field_length - 5.5, field_length],
-            [(field_width - 18.32) / 2, (field_width - 18.32) / 2,
-             (field_width + 18.32) / 2, (field_width + 18.32) / 2], color="black")
-
-    # 골대
-    ax.plot([0, -2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([0, -2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width - 7.32) / 2, (field_width - 7.32) / 2], color="black")
-    ax.plot([field_length, field_length + 2], [(field_width + 7.32) / 2, (field_width + 7.32) / 2], color="black")
-
-    ax.set_xlim(-5, field_length + 5)
-    ax.set_ylim(-5, field_width + 5)
-    ax.set_aspect("equal", adjustable="box")
-    return ax
+
+    turnovers = {}
+    side_of_team = {}
+
+    # event id -> 팀 코드 (드리블 실패 판정에서 상대 팀 이벤트인지 바로 조회)
+    team_of_event = {}
+    # 드리블 실패 후보 (관련 이벤트가 뒤에 나올 수 있으므로 순회가 끝난 뒤 판정)
+    carries = []
+
+    for i, event in enumerate(iter_event_records(events_file_path)):
+        event_type = event.type
+        team = event.team
+        team_of_event[event.id] = team
+
+        # 홈/어웨이 팀 (첫 두 이벤트는 홈, 어웨이 순서의 Starting XI)
+        if i < 2:
+            side = ('home', 'away')[i]
+            side_of_team[team] = side
+            turnovers[side] = {
+                "team_name": event.team_name,
+                "failed_passes": [],
+                "lost_duels": [],
+                "dribble_losts": [],
+            }
+
+        side = side_of_team.get(team)
+        if side is None:
+            continue
+
+        # 실패한 패스 필터링
+        if event_type == em.PASS and event.outcome == em.INCOMPLETE:
+            turnovers[side]["failed_passes"].append(event.location)
+
+        # 패배한 듀얼 필터링
+        elif event_type == em.DUEL and event.outcome in LOST_DUEL_OUTCOMES:
+            turnovers[side]["lost_duels"].append(event.location)
+
+        elif event_type == em.CARRY and event.related_events:
+            carries.append((side, team, event.location, event.related_events))
+
+    # 드리블 실패 필터링: 관련 이벤트 중 상대 팀 이벤트가 있는 Carry
+    for side, team, location, related_event_list in carries:
+        if any(related_event in team_of_event and team_of_event[related_event] != team
+               for related_event in related_event_list):
+            turnovers[side]["dribble_losts"].append(location)
+
+    return turnovers
+
 
 def extract_turnover_data(events_file_path, side):
     """
-    홈팀 또는 어웨이팀의 턴오버 이벤트를 시각화
-    턴오버를 실패한 패스, 패배한 듀얼, 드리블 실패로 구분
+    홈팀 또는 어웨이팀의 턴오버 이벤트 위치를 추출 (extract_turnovers 결과에서 한 팀만 반환)
 
     매개변수:
-    - events_file_path (str): 경기 이벤트 데이터를 포함한 JSON 파일 경로
-    - lineup_file_path (str): 라인업 데이터 파일 경로
+    - events_file_path (str | list): 경기 이벤트 JSON 파일 경로 또는 파싱된 이벤트 리스트
     - side (str): "home" 또는 "away"를 지정해 특정 팀 선택
 
     반환값:
-    - None: 턴오버 맵을 화면에 출력
+    - list: 실패한 패스 위치
+    - list: 패배한 듀얼 위치
+    - list: 드리블 실패 위치
+    - str: 팀 이름
+    - str: side
     """
-    
-    # 데이터 로드
-    with open(events_file_path, 'r', encoding='utf-8') as f:
-        events_data = json.load(f)
-    
-
-    # 선택된 팀 이름
-    if side == 'home':
-        team_name = events_data[0]['team']['name']
-    elif side == 'away':
-        team_name = events_data[1]['team']['name']
-
-
-    # 전체 event id 추출 -> 드리블 실패 데이터 추출에서 사용
-    event_id = [event['id'] for event in events_data if event.get('team',{}).get('name') != team_name]
-    
-    # 위치 데이터 추출
-    failed_passes_location = []
-    lost_duels_location = []
-    dribble_losts_location = []
-    for event in events_data:
-        
-        related_event_list = event.get('related_events',[])
-        
-        # 실패한 패스 필터링
-        if event["type"]["name"] == "Pass" and "outcome" in event.get("pass", {}) and\
-        event["pass"]["outcome"]["name"] == "Incomplete" and event["team"]["name"] == team_name:
-        
-            failed_passes_location.append(event['location']) 
-        
-
-        # 패배한 듀얼 필터링
-        elif event["type"]["name"] == "Duel" and "outcome" in event.get("duel", {}) and\
-            event["duel"]["outcome"]["name"] in {"Lost In Play", "Lost Out"} and event["team"]["name"] == team_name:
-            
-            lost_duels_location.append(event['location'])
-        
-        # 드리블 실패 필터링
-        elif event["type"]["name"] == "Carry" and event["team"]["name"] == team_name and\
-                any(related_event in event_id for related_event in related_event_list):
-            
-            dribble_losts_location.append(event['location'])
-    
-
-    
-    return failed_passes_location, lost_duels_location, dribble_losts_location, team_name, side
+    turnover = extract_turnovers(events_file_path)[side]
+    return turnover["failed_passes"], turnover["lost_duels"], turnover["dribble_losts"],\
+        turnover["team_name"], side
 
 events_file_path = "./data/events/3773457.json"
 
@@ -1,237 +1,186 @@
+import module.match_pipeline as mp
 import module.match_table as mt
-import module.turnovermap as to
 import module.heatmap as hm
-
-import os
-import json
+import module.match_index as mi
+import module.batch_render as br
+import module.profiling as prof
+import module.incremental as inc
+import module.aggregates as agg
+import module.stats_engine as se
+import module.resampling as rs
+
+import argparse
+from functools import partial
 import numpy as np
 from scipy import stats
 import seaborn as sns
 import matplotlib.pyplot as plt
-from tqdm import tqdm
-
-
-# match_id 및 승패 정보 추출
-folder_path_laliga = "./Laliga_10_21"
-json_files_laliga = [f for f in os.listdir(folder_path_laliga) if f.endswith(".json")]
-
-match_results = []
-for filename in os.listdir(folder_path_laliga):
-    if filename.endswith(".json"):
-        file_path = os.path.join(folder_path_laliga, filename)
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        for match in data:
-            home_team = match["home_team"]
-            away_team = match["away_team"]
-            home_score = match["home_score"]
-            away_score = match["away_score"]
-            if home_score > away_score:
-                winner = "Home"
-                loser = "Away"
-            elif away_score > home_score:
-                winner = "Away"
-                loser = "Home"
-            else:
-                continue
-            match_result = {
-                "match_id": match["match_id"],
-                "winner": winner,
-                "loser": loser,
-            }
-            match_results.append(match_result)
-
-folder_path_events = ".data/events"
-
-# 데이터 저장용 리스트 초기화
-winning_pass_locations = []
-losing_pass_locations = []
-
-winning_shot_locations = []
-losing_shot_locations = []
-
-winning_turnover_locations = []
-losing_turnover_locations = []
-
-winning_passes = []
-losing_passes = []
-
-winning_passes_success_rates = []
-losing_passes_success_rates = []
-
-winning_shots = []
-losing_shots = []
-
-winning_possession_rates = []
-losing_possession_rates = []
-
-winner_turnover_count = []
-loser_turnover_count = []
-winner_turnover_count_total = []
-loser_turnover_count_total = []
-
-winner_foul_count = []
-loser_foul_count = []
-
-total_matches = len(match_results)
-
-# 메인 루프: 모든 경기 데이터 처리
-for i, match_result in tqdm(
-    enumerate(match_results),
-    total=total_matches,
-    desc="Processing matches",
-    unit="match",
-):
 
-    match_id = match_result["match_id"]
-    winner_side = match_result["winner"]
-    loser_side = match_result["loser"]
 
-    event_file_path = os.path.join(folder_path_events, f"{match_id}.json")
-    if not os.path.exists(event_file_path):
-        continue
-
-    with open(event_file_path, "r", encoding="utf-8") as f:
-        event_data = json.load(f)
-
-    # 팀 데이터 추출
-    teams, team_names, possession_percentages = mt.extract_match_data(event_file_path)
-
-    # winner_team, loser_team 이름 결정
-    if winner_side == "Home":
-        winner_team = team_names[0]  # 홈팀
-        loser_team = team_names[1]  # 어웨이팀
-    else:
-        winner_team = team_names[1]  # 어웨이팀
-        loser_team = team_names[0]  # 홈팀
-
-    # 턴오버 데이터 추출 (승리팀)
-    fp_w, ld_w, dl_w, _, _ = to.extract_turnover_data(
-        event_file_path, winner_side.lower()
+def parse_args():
+    parser = argparse.ArgumentParser(description="다수 경기 승패 비교 분석")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="경기 처리 워커 프로세스 수 (1: 직렬 처리, 0: CPU 코어 수)",
     )
-    winning_turnover_locations.extend(fp_w)
-    winning_turnover_locations.extend(ld_w)
-    winning_turnover_locations.extend(dl_w)
-
-    # 턴오버 데이터 추출 (패배팀)
-    fp_l, ld_l, dl_l, _, _ = to.extract_turnover_data(
-        event_file_path, loser_side.lower()
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=8,
+        help="워커 하나에 한 번에 전달할 경기 수",
     )
-    losing_turnover_locations.extend(fp_l)
-    losing_turnover_locations.extend(ld_l)
-    losing_turnover_locations.extend(dl_l)
-
-    # 패스, 슛 위치 추출
-    for event in event_data:
-        if event["team"]["name"] == winner_team:
-            if event["type"]["name"] == "Pass":
-                location = event.get("location")
-                end_location = event.get("pass", {}).get("end_location")
-                if location:
-                    winning_pass_locations.append(tuple(location))
-                if end_location:
-                    winning_pass_locations.append(tuple(end_location))
-            elif event["type"]["name"] == "Shot":
-                outcome = event.get("shot", {}).get("outcome", {}).get("name", "")
-                if outcome in ["Goal", "Saved", "Post"]:
-                    location = event.get("location")
-                    if location:
-                        winning_shot_locations.append(tuple(location))
-
-        elif event["team"]["name"] == loser_team:
-            if event["type"]["name"] == "Pass":
-                location = event.get("location")
-                end_location = event.get("pass", {}).get("end_location")
-                if location:
-                    losing_pass_locations.append(tuple(location))
-                if end_location:
-                    losing_pass_locations.append(tuple(end_location))
-            elif event["type"]["name"] == "Shot":
-                outcome = event.get("shot", {}).get("outcome", {}).get("name", "")
-                if outcome in ["Goal", "Saved", "Post"]:
-                    location = event.get("location")
-                    if location:
-                        losing_shot_locations.append(tuple(location))
-
-    # 턴오버 개수 계산
-    # 전체 턴오버
-    winner_total_turnover = len(fp_w) + len(ld_w) + len(dl_w)
-    loser_total_turnover = len(fp_l) + len(ld_l) + len(dl_l)
-    winner_turnover_count_total.append(winner_total_turnover)
-    loser_turnover_count_total.append(loser_total_turnover)
-
-    # 하프라인 이전 (x<60)에 발생한 턴오버
-    fp_w_half = [(x, y) for x, y in fp_w if x < 60]
-    ld_w_half = [(x, y) for x, y in ld_w if x < 60]
-    dl_w_half = [(x, y) for x, y in dl_w if x < 60]
-    fp_l_half = [(x, y) for x, y in fp_l if x < 60]
-    ld_l_half = [(x, y) for x, y in ld_l if x < 60]
-    dl_l_half = [(x, y) for x, y in dl_l if x < 60]
-
-    winner_half_turnover = len(fp_w_half) + len(ld_w_half) + len(dl_w_half)
-    loser_half_turnover = len(fp_l_half) + len(ld_l_half) + len(dl_l_half)
-
-    winner_turnover_count.append(winner_half_turnover)
-    loser_turnover_count.append(loser_half_turnover)
-
-    # 통계치 추출
-    winning_passes.append(teams[winner_team]["passes"])
-    losing_passes.append(teams[loser_team]["passes"])
-
-    winning_passes_success_rates.append(teams[winner_team]["pass_success_rate"])
-    losing_passes_success_rates.append(teams[loser_team]["pass_success_rate"])
-
-    winning_shots.append(teams[winner_team]["on_target"])
-    losing_shots.append(teams[loser_team]["on_target"])
-
-    winning_possession_rates.append(possession_percentages[winner_team])
-    losing_possession_rates.append(possession_percentages[loser_team])
-
-    winner_foul_count.append(teams[winner_team]["fouls"])
-    loser_foul_count.append(teams[loser_team]["fouls"])
-
-    # 진행 상황 출력
-    # print(f"Progress: {i + 1}/{total_matches}")
-
-# 히트맵 생성
-hm.draw_heatmap(winning_pass_locations, "Winning Team Pass Heatmap", "pass")
-hm.draw_heatmap(losing_pass_locations, "Losing Team Pass Heatmap", "pass")
-
-hm.draw_heatmap(winning_shot_locations, "Winning Team Shot Heatmap", "shot")
-hm.draw_heatmap(losing_shot_locations, "Losing Team Shot Heatmap", "shot")
-hm.draw_heatmap(winning_turnover_locations, "Winning Team Turnover Heatmap", "turnover")
-hm.draw_heatmap(losing_turnover_locations, "Losing Team Turnover Heatmap", "turnover")
-
-# 평균 계산
-winning_pass_average = np.mean(winning_passes)
-losing_pass_average = np.mean(losing_passes)
-
-winning_passes_success_rate_average = np.mean(winning_passes_success_rates)
-losing_passes_success_rate_average = np.mean(losing_passes_success_rates)
-
-winning_shots_average = np.mean(winning_shots)
-losing_shots_average = np.mean(losing_shots)
-
-winning_possession_rate_average = np.mean(winning_possession_rates)
-losing_possession_rate_average = np.mean(losing_possession_rates)
+    parser.add_argument(
+        "--event-store",
+        default=None,
+        help="이벤트 Parquet 저장소 경로 (python -m module.event_store로 생성, 지정 시 JSON 대신 사용)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default="./cache/match_metrics",
+        help="경기별 파생 지표 캐시 폴더 (원본 파일/코드가 바뀐 경기만 다시 계산)",
+    )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="경기 지표 캐시를 사용하지 않음"
+    )
+    parser.add_argument(
+        "--matches-dir",
+        default="./Laliga_10_21",
+        help="경기 정보 JSON 폴더 (ex. 합성 데이터 생성기가 만든 복제 경기 정보)",
+    )
+    parser.add_argument(
+        "--events-dir", default="./data/events", help="경기 이벤트 JSON 폴더"
+    )
+    parser.add_argument(
+        "--match-index",
+        default=mi.DEFAULT_INDEX_PATH,
+        help="경기 인덱스 Parquet 파일 경로 (경기 정보 JSON이 바뀌면 자동으로 다시 생성)",
+    )
+    parser.add_argument(
+        "--season",
+        action="append",
+        default=None,
+        help="분석할 시즌 이름 (ex. 2020/2021, 여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "--team",
+        action="append",
+        default=None,
+        help="분석할 팀 이름 (해당 팀이 홈/원정으로 뛴 경기만, 여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="그림을 화면에 띄우지 않고 이 폴더에 파일로 저장 (headless 서버용)",
+    )
+    parser.add_argument(
+        "--format",
+        nargs="+",
+        default=list(br.DEFAULT_FORMATS),
+        choices=["png", "svg", "pdf"],
+        help="--output-dir 저장 형식",
+    )
+    parser.add_argument(
+        "--match-stats",
+        default=None,
+        help="선택한 경기의 경기 통계(match_id x 팀 x 통계)를 한 번에 계산해 CSV로 저장",
+    )
+    parser.add_argument(
+        "--stats-table",
+        default=None,
+        help="그룹별 승/패 Welch t-test, 효과 크기, 부트스트랩 신뢰구간 결과 표 저장 경로 (.csv 또는 .parquet)",
+    )
+    parser.add_argument(
+        "--group-by",
+        action="append",
+        default=None,
+        help="--stats-table 그룹화 (all, season_name, team, side, 여러 컬럼은 season_name+side 형식, 여러 번 지정 가능)",
+    )
+    parser.add_argument(
+        "--bootstrap",
+        type=int,
+        default=1000,
+        help="--stats-table 부트스트랩 재표본 수 (0: 신뢰구간 생략)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="부트스트랩/재표본 난수 시드"
+    )
+    parser.add_argument(
+        "--resampling-table",
+        default=None,
+        help="경기 단위 대응 표본 순열 검정/부트스트랩 결과 표 저장 경로 (.csv 또는 .parquet)",
+    )
+    parser.add_argument(
+        "--resamples",
+        type=int,
+        default=10000,
+        help="--resampling-table 순열/부트스트랩 재표본 수 (--workers 수만큼 나눠 병렬 처리)",
+    )
+    parser.add_argument(
+        "--location-store",
+        default=None,
+        help="패스/슛/턴오버 원본 좌표를 float32 memmap 위치 저장소에 추가 (저장소에 없는 경기만, python -m module.location_store로 재비닝)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="저장된 누적 집계에 새로 추가되었거나 바뀐 경기만 처리해 합침",
+    )
+    parser.add_argument(
+        "--state-file",
+        default="./cache/incremental_state.pkl",
+        help="--incremental 누적 집계 상태 파일 경로",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="단계별 경과 시간/호출 수/읽은 바이트/이벤트 수 요약표 출력",
+    )
+    parser.add_argument(
+        "--profile-json", default=None, help="단계별 계측 결과를 JSON 파일로 저장"
+    )
+    parser.add_argument(
+        "--cprofile-match",
+        type=int,
+        default=None,
+        help="지정한 경기 하나만 캐시 없이 처리하며 cProfile 결과를 출력하고 종료",
+    )
+    parser.add_argument(
+        "--cprofile-out",
+        default=None,
+        help="--cprofile-match 결과를 pstats 파일(.prof)로 저장",
+    )
+    return parser.parse_args()
 
-winning_total_turnover_average = np.mean(winner_turnover_count_total)
-losing_total_turnover_average = np.mean(loser_turnover_count_total)
 
-winning_turnover_average = np.mean(winner_turnover_count)
-losing_turnover_average = np.mean(loser_turnover_count)
+# 분포 그래프/t-test를 수행할 지표 (지표 키, 제목, x축 이름)
+METRIC_PLOTS = [
+    ("passes", "Passes", "Number of Passes"),
+    ("pass_success_rate", "Pass Accuracy", "Pass Accuracy (%)"),
+    ("on_target", "Shots On Target", "Number of On Target Shots"),
+    ("possession", "Possession Rate", "Possession Rate (%)"),
+    ("turnover_count_total", "Total Turnover", "Total Number of Turnover"),
+    ("turnover_count", "Turnover (Half Field)", "Number of Turnover in Own Half"),
+    ("fouls", "Fouls", "Number of Fouls"),
+]
 
-winning_fouls_average = np.mean(winner_foul_count)
-losing_fouls_average = np.mean(loser_foul_count)
 
+def plot_distribution_and_test(
+    aggregates, values, metric, title, xlabel, output_dir=None, formats=("png",)
+):
+    # 평균/표준편차/t-test는 누적기(Welford)로 계산하고, 경기별 값은 분포 그래프(KDE)에만 사용
+    winning_stats = aggregates.stats["winner"][metric]
+    losing_stats = aggregates.stats["loser"][metric]
+    winning_data = values["winner"][metric]
+    losing_data = values["loser"][metric]
 
-def plot_distribution_and_test(winning_data, losing_data, title, xlabel):
-    t_stat, p_value = stats.ttest_ind(winning_data, losing_data, equal_var=False)
+    with prof.stage("ttest"):
+        t_stat, p_value = aggregates.ttest(metric)
 
     print(title)
-    print("Winning avg:", np.mean(winning_data))
-    print("Losing avg:", np.mean(losing_data))
+    print("Winning avg:", winning_stats.mean)
+    print("Losing avg:", losing_stats.mean)
     print(f"{title} t-statistic: {t_stat}")
     print(f"{title} p-value: {p_value}")
     if p_value < 0.05:
@@ -240,72 +189,231 @@ def plot_distribution_and_test(winning_data, losing_data, title, xlabel):
         print(f"{title}와(과) 경기 승패 간에 유의미한 차이가 존재하지 않습니다.")
     print("---------------")
 
-    win_mean = np.mean(winning_data)
-    win_std = np.std(winning_data)
-    lose_mean = np.mean(losing_data)
-    lose_std = np.std(losing_data)
-
-    x_win = np.linspace(min(winning_data), max(winning_data), 100)
-    y_win = stats.norm.pdf(x_win, win_mean, win_std)
-    x_lose = np.linspace(min(losing_data), max(losing_data), 100)
-    y_lose = stats.norm.pdf(x_lose, lose_mean, lose_std)
-
-    plt.figure()
-    plt.plot(
-        x_win,
-        y_win,
-        color="skyblue",
-        linestyle="-",
-        linewidth=2,
-        label="Winning Team Normal Dist.",
-    )
-    plt.plot(
-        x_lose,
-        y_lose,
-        color="pink",
-        linestyle="-",
-        linewidth=2,
-        label="Losing Team Normal Dist.",
+    with prof.stage("distribution_plot"):
+        win_mean = winning_stats.mean
+        win_std = winning_stats.std(ddof=0)
+        lose_mean = losing_stats.mean
+        lose_std = losing_stats.std(ddof=0)
+
+        x_win = np.linspace(min(winning_data), max(winning_data), 100)
+        y_win = stats.norm.pdf(x_win, win_mean, win_std)
+        x_lose = np.linspace(min(losing_data), max(losing_data), 100)
+        y_lose = stats.norm.pdf(x_lose, lose_mean, lose_std)
+
+        fig = plt.figure()
+        plt.plot(
+            x_win,
+            y_win,
+            color="skyblue",
+            linestyle="-",
+            linewidth=2,
+            label="Winning Team Normal Dist.",
+        )
+        plt.plot(
+            x_lose,
+            y_lose,
+            color="pink",
+            linestyle="-",
+            linewidth=2,
+            label="Losing Team Normal Dist.",
+        )
+        sns.kdeplot(winning_data, color="blue", label="Winning Team")
+        sns.kdeplot(losing_data, color="red", label="Losing Team")
+        plt.title(f"Distribution of {title}: Winning vs Losing Teams")
+        plt.xlabel(xlabel)
+        plt.ylabel("Density")
+        plt.legend()
+        plt.grid(True)
+        if output_dir is not None:
+            words = title.lower().replace("(", "").replace(")", "").split()
+            br.save_figure(fig, output_dir, "distribution_" + "_".join(words), formats)
+
+    # 화면 출력은 사용자가 창을 닫을 때까지 블로킹되므로 계측에서 제외
+    if output_dir is None:
+        plt.show()
+
+
+def main():
+    args = parse_args()
+    if args.output_dir is not None:
+        br.use_headless_backend()
+    if args.profile or args.profile_json:
+        prof.enable()
+
+    folder_path_laliga = args.matches_dir
+    folder_path_events = args.events_dir
+
+    # match_id 및 승패 정보 추출 (경기 인덱스에서 승패가 갈린 경기만 선택)
+    with prof.stage("match_index"):
+        match_index = mi.get_match_index(
+            folder_path_laliga, folder_path_events, index_path=args.match_index
+        )
+        selected = mi.filter_matches(
+            match_index, seasons=args.season, teams=args.team, results=["Home", "Away"]
+        )
+        match_results = mi.match_results(selected)
+
+    # 경기 통계 표 (경기 통계 표의 10개 항목을 선택한 경기 전체에 대해 한 번에 계산)
+    if args.match_stats is not None:
+        with prof.stage("match_stats"):
+            match_stats = mt.load_match_stats(
+                [m["match_id"] for m in match_results],
+                store_path=args.event_store,
+                folder_path_events=folder_path_events,
+            )
+            match_stats.to_csv(args.match_stats, index=False)
+        print(
+            f"경기 통계 저장: {args.match_stats} ({match_stats['match_id'].nunique()}경기)"
+        )
+
+    # 경기 하나만 cProfile로 프로파일링 (캐시를 쓰지 않고 파싱부터 지표 추출까지)
+    if args.cprofile_match is not None:
+        match_result = next(
+            (m for m in match_results if m["match_id"] == args.cprofile_match),
+            {"match_id": args.cprofile_match, "winner": "Home", "loser": "Away"},
+        )
+        _, report = prof.profile_call(
+            mp.process_match,
+            match_result,
+            folder_path_events,
+            store_path=args.event_store,
+            output_path=args.cprofile_out,
+        )
+        print(report)
+        return
+
+    if args.incremental:
+        # 증분 모드: 새로 추가되었거나 이벤트 파일이 바뀐 경기만 처리해 저장된 누적 집계에 합침
+        with prof.stage("incremental_update"):
+            state = inc.load_state(args.state_file)
+            counts = inc.update_state(
+                state,
+                match_results,
+                folder_path_events,
+                store_path=args.event_store,
+                workers=args.workers,
+                chunksize=args.chunksize,
+                cache_dir=None if args.no_cache else args.cache_dir,
+                location_store=args.location_store,
+            )
+            inc.save_state(state, args.state_file)
+        print(
+            f"증분 집계: 추가 {counts['added']}, 변경 {counts['changed']}, "
+            f"제거 {counts['removed']}, 유지 {counts['unchanged']}"
+        )
+        if args.location_store is not None:
+            print(
+                f"위치 저장소: {counts['stored']}경기 추가, "
+                f"{counts['discarded']}경기 무효화 ({args.location_store})"
+            )
+        aggregates = inc.state_aggregates(state)
+        match_ids = sorted(state["matches"])
+        values = {
+            group: {
+                metric: inc.group_values(state, group, metric) for metric in agg.METRICS
+            }
+            for group in agg.GROUPS
+        }
+    else:
+        # 메인 루프: 모든 경기 데이터 처리 (경기당 이벤트 파일 1회 파싱)
+        # 위치 데이터는 워커에서 경기별 12x8 그리드로 비닝한 뒤 합치므로 경기 수와 관계없이 메모리가 일정
+        # --workers 2 이상이면 경기별 추출을 프로세스 풀에서 병렬 처리 (결과 순서는 직렬 처리와 동일)
+        with prof.stage("match_loop"):
+            aggregates, values, match_ids = agg.aggregate_matches(
+                match_results,
+                folder_path_events,
+                workers=args.workers,
+                chunksize=args.chunksize,
+                store_path=args.event_store,
+                cache_dir=None if args.no_cache else args.cache_dir,
+                progress=True,
+                location_store=args.location_store,
+            )
+
+    # 히트맵 생성 (그룹별 누적 그리드)
+    grids = aggregates.grids
+    heatmap_groups = {
+        "heatmap_winning_pass": (
+            grids["winner"]["pass"],
+            "Winning Team Pass Heatmap",
+            "pass",
+        ),
+        "heatmap_losing_pass": (
+            grids["loser"]["pass"],
+            "Losing Team Pass Heatmap",
+            "pass",
+        ),
+        "heatmap_winning_shot": (
+            grids["winner"]["shot"],
+            "Winning Team Shot Heatmap",
+            "shot",
+        ),
+        "heatmap_losing_shot": (
+            grids["loser"]["shot"],
+            "Losing Team Shot Heatmap",
+            "shot",
+        ),
+        "heatmap_winning_turnover": (
+            grids["winner"]["turnover"],
+            "Winning Team Turnover Heatmap",
+            "turnover",
+        ),
+        "heatmap_losing_turnover": (
+            grids["loser"]["turnover"],
+            "Losing Team Turnover Heatmap",
+            "turnover",
+        ),
+    }
+    with prof.stage("heatmaps"):
+        if args.output_dir is None:
+            for heatmap, title, kind in heatmap_groups.values():
+                hm.draw_heatmap_grid(heatmap, title, kind)
+        else:
+            br.render_heatmap_grids(heatmap_groups, args.output_dir, args.format)
+
+    # 그룹별(시즌, 팀, 홈/원정) 승/패 비교 결과 표
+    if args.stats_table is not None:
+        with prof.stage("stats_table"):
+            groupings = se.DEFAULT_GROUPINGS
+            if args.group_by is not None:
+                groupings = [
+                    None if grouping == "all" else grouping.split("+")
+                    for grouping in args.group_by
+                ]
+            observations = se.observation_frame(match_ids, values, match_index)
+            results = se.run_comparisons(
+                observations, groupings, n_boot=args.bootstrap, seed=args.seed
+            )
+            se.save_results(results, args.stats_table)
+        print(f"비교 결과 저장: {args.stats_table} ({len(results)}행)")
+
+    # 승/패 대응 표본 순열 검정, 부트스트랩 (정규성 가정 없이 t-test 결과 확인)
+    if args.resampling_table is not None:
+        with prof.stage("resampling"):
+            resampled = rs.resampling_table(
+                values, n_resamples=args.resamples, seed=args.seed, workers=args.workers
+            )
+            se.save_results(resampled, args.resampling_table)
+        print(resampled.to_string(index=False))
+        print(f"재표본 검정 결과 저장: {args.resampling_table}")
+
+    # T-test 및 분포 그래프 (--output-dir 지정 시 화면 대신 파일로 저장)
+    plot_and_test = partial(
+        plot_distribution_and_test,
+        aggregates,
+        values,
+        output_dir=args.output_dir,
+        formats=args.format,
     )
-    sns.kdeplot(winning_data, color="blue", label="Winning Team")
-    sns.kdeplot(losing_data, color="red", label="Losing Team")
-    plt.title(f"Distribution of {title}: Winning vs Losing Teams")
-    plt.xlabel(xlabel)
-    plt.ylabel("Density")
-    plt.legend()
-    plt.grid(True)
-    plt.show()
+    for metric, title, xlabel in METRIC_PLOTS:
+        plot_and_test(metric, title, xlabel)
+
+    # 단계별 계측 결과
+    if args.profile:
+        prof.print_summary()
+    if args.profile_json:
+        prof.dump_json(args.profile_json)
 
 
-# T-test 및 분포 그래프
-plot_distribution_and_test(winning_passes, losing_passes, "Passes", "Number of Passes")
-plot_distribution_and_test(
-    winning_passes_success_rates,
-    losing_passes_success_rates,
-    "Pass Accuracy",
-    "Pass Accuracy (%)",
-)
-plot_distribution_and_test(
-    winning_shots, losing_shots, "Shots On Target", "Number of On Target Shots"
-)
-plot_distribution_and_test(
-    winning_possession_rates,
-    losing_possession_rates,
-    "Possession Rate",
-    "Possession Rate (%)",
-)
-plot_distribution_and_test(
-    winner_turnover_count_total,
-    loser_turnover_count_total,
-    "Total Turnover",
-    "Total Number of Turnover",
-)
-plot_distribution_and_test(
-    winner_turnover_count,
-    loser_turnover_count,
-    "Turnover (Half Field)",
-    "Number of Turnover in Own Half",
-)
-plot_distribution_and_test(
-    winner_foul_count, loser_foul_count, "Fouls", "Number of Fouls"
-)
+if __name__ == "__main__":
+    main()
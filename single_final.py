@@ -1,25 +1,31 @@
-import module.pass_networkmap_def as pnm
-import module.shot_map_def as sm
-import module.match_table as mt
-import module.eventchain_map as ec
+from module.match_report import MatchReport
 
-events_file_path = "./data/events/3773457.json"
-lineup_file_path = "./data/lineups/3773457.json"
+import argparse
 
-pnm.draw_pass_network(events_file_path, lineup_file_path, side="home")
-pnm.draw_pass_network(events_file_path, lineup_file_path, side="away")
+parser = argparse.ArgumentParser(description="단일 경기 분석")
+parser.add_argument("match_id", nargs="?", type=int, default=3773457, help="경기 ID")
+parser.add_argument("--events", default="./data/events", help="이벤트 JSON 폴더")
+parser.add_argument("--lineups", default="./data/lineups", help="라인업 JSON 폴더")
+parser.add_argument("--event-store", default=None, help="이벤트 Parquet 저장소 경로 (지정 시 JSON 대신 사용)")
+args = parser.parse_args()
+
+# 이벤트/라인업은 한 번만 로드하고 모든 그림이 공유
+report = MatchReport(args.match_id, args.events, args.lineups, args.event_store)
+
+## pass network
+report.pass_network("home", show=True)
+report.pass_network("away", show=True)
 
 ##shotmap
-sm.draw_shot_map(events_file_path, lineup_file_path, side="home")
-sm.draw_shot_map(events_file_path, lineup_file_path, side="away")
+report.shot_map("home", show=True)
+report.shot_map("away", show=True)
 
 ## match table
-match_data, team_names, possession_percentages = mt.extract_match_data(events_file_path)
-mt.create_match_table(match_data, team_names, possession_percentages)
+report.match_table(show=True)
 
 ## most player
-mt.extract_record_data(events_file_path)
+report.most_player(show=True)
 
 ## event chain
-ec.draw_event_chain(events_file_path, lineup_file_path, "home")
-ec.draw_event_chain(events_file_path, lineup_file_path, "away")
+report.event_chain("home", show=True)
+report.event_chain("away", show=True)
@@ -0,0 +1,76 @@
+import os
+import json
+
+import numpy as np
+
+import module.incremental as inc
+import module.location_store as ls
+import module.synthetic_data as sd
+from module.aggregates import GROUPS, LOCATION_KINDS
+
+
+def _write_matches(tmp_path, n_matches=3):
+    results = sd.write_synthetic_matches(str(tmp_path / "data"), n_matches, n_events=400, seed=1)
+    return results, str(tmp_path / "data" / "events"), str(tmp_path / "locations")
+
+
+def _assert_store_matches_state(state, store_path):
+    # 저장소를 다시 비닝한 그리드가 상태의 경기별 그리드 합과 같아야 함
+    grids = inc.state_aggregates(state).grids
+    for group in GROUPS:
+        for kind in LOCATION_KINDS:
+            np.testing.assert_array_equal(ls.bin_store(store_path, kind, outcome=group), grids[group][kind])
+
+
+def _mirror_event_file(events_path, match_id):
+    # 이벤트 파일의 모든 위치를 좌우 반전 (내용이 바뀐 경기)
+    path = os.path.join(events_path, f"{match_id}.json")
+    with open(path, "r", encoding="utf-8") as f:
+        events = json.load(f)
+    for event in events:
+        if "location" in event:
+            event["location"][0] = 120 - event["location"][0]
+        if "end_location" in event.get("pass", {}):
+            event["pass"]["end_location"][0] = 120 - event["pass"]["end_location"][0]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(events, f)
+
+
+def test_incremental_store_replaces_changed_match(tmp_path):
+    results, events_path, store_path = _write_matches(tmp_path)
+    state = inc.new_state()
+    counts = inc.update_state(state, results, events_path, location_store=store_path)
+    assert counts["stored"] == 3
+    _assert_store_matches_state(state, store_path)
+    before = ls.bin_store(store_path, "pass")
+
+    _mirror_event_file(events_path, results[0]["match_id"])
+    counts = inc.update_state(state, results, events_path, location_store=store_path)
+    assert (counts["changed"], counts["discarded"], counts["stored"]) == (1, 1, 1)
+    _assert_store_matches_state(state, store_path)
+    assert not np.array_equal(ls.bin_store(store_path, "pass"), before)
+
+
+def test_incremental_store_drops_removed_match(tmp_path):
+    results, events_path, store_path = _write_matches(tmp_path)
+    state = inc.new_state()
+    inc.update_state(state, results, events_path, location_store=store_path)
+
+    counts = inc.update_state(state, results[1:], events_path, location_store=store_path)
+    assert (counts["removed"], counts["discarded"], counts["stored"]) == (1, 1, 0)
+    with ls.LocationStore(store_path) as store:
+        assert results[0]["match_id"] not in store
+    _assert_store_matches_state(state, store_path)
+
+
+def test_store_backfills_matches_changed_without_store(tmp_path):
+    results, events_path, store_path = _write_matches(tmp_path)
+    state = inc.new_state()
+    inc.update_state(state, results, events_path, location_store=store_path)
+
+    # 위치 저장소 없이 실행한 사이에 바뀐 경기도 다음 실행에서 다시 저장
+    _mirror_event_file(events_path, results[1]["match_id"])
+    inc.update_state(state, results, events_path)
+    counts = inc.update_state(state, results, events_path, location_store=store_path)
+    assert (counts["unchanged"], counts["discarded"], counts["stored"]) == (3, 1, 1)
+    _assert_store_matches_state(state, store_path)